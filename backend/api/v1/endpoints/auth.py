@@ -3,7 +3,7 @@ Endpoints de autenticación para SportStyle Store API.
 Gestiona registro, login, logout y validación de usuarios con Firebase Realtime Database.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status, UploadFile, File
+from fastapi import APIRouter, HTTPException, Depends, Request, status, UploadFile, File
 from backend.models.auth import (
     SignUpRequest,
     SignInRequest,
@@ -11,6 +11,7 @@ from backend.models.auth import (
     UserResponse,
     MessageResponse
 )
+from backend.core.http_cache import cached_response
 from backend.core.security import create_access_token, get_current_user
 from backend.config.firebase_config import get_database, get_storage_bucket
 from backend.services.user_service import UserService
@@ -124,11 +125,15 @@ async def signin(request: SignInRequest):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_profile(current_user: dict = Depends(get_current_user)):
+async def get_current_user_profile(http_request: Request, current_user: dict = Depends(get_current_user)):
     """
     Obtiene el perfil completo del usuario autenticado.
 
+    La respuesta lleva ETag (del contenido: los usuarios no tienen marca de
+    versión); con If-None-Match se responde 304 si el perfil no ha cambiado.
+
     Args:
+        http_request: Petición HTTP (cabeceras de revalidación)
         current_user: Usuario actual desde el token JWT
 
     Returns:
@@ -147,7 +152,7 @@ async def get_current_user_profile(current_user: dict = Depends(get_current_user
                 detail="User profile not found"
             )
 
-        return UserResponse(
+        return cached_response(http_request, UserResponse(
             uid=user['user_id'],
             email=user['email'],
             nombre=user.get("nombre"),
@@ -156,7 +161,7 @@ async def get_current_user_profile(current_user: dict = Depends(get_current_user
             foto_perfil=user.get("foto_perfil"),
             puntos_fidelizacion=user.get("puntos_fidelizacion", 0),
             es_admin=user.get("es_admin", False)
-        )
+        ))
 
     except HTTPException:
         raise
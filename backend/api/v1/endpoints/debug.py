@@ -0,0 +1,146 @@
+"""
+Endpoints de diagnóstico para SportStyle Store API.
+Consulta de las trazas por petición guardadas en memoria (backend/core/tracing.py)
+y perfiles por muestreo del proceso (backend/core/profiler.py).
+Solo para administradores.
+"""
+
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse
+from backend.config.settings import PROFILE_INTERVAL_MS, PROFILE_MAX_SECONDS, PROFILING_ENABLED
+from backend.core import profiler, tracing
+from backend.core.http_cache import cached_response
+from backend.core.security import get_current_admin
+
+
+router = APIRouter(prefix="/debug", tags=["Debug"], dependencies=[Depends(get_current_admin)])
+
+
+@router.get("/traces")
+async def list_traces(limit: int = Query(50, ge=1, le=1000)):
+    """
+    Lista las últimas trazas guardadas.
+
+    Args:
+        limit: Número máximo de trazas (la más reciente primero)
+
+    Returns:
+        dict: Resumen de cada traza (duración, spans, llamadas a la base de datos)
+    """
+    return {"traces": [trace.summary() for trace in tracing.recent_traces(limit)]}
+
+
+@router.get("/traces/chrome")
+async def export_traces(limit: int = Query(50, ge=1, le=1000)):
+    """
+    Exporta las últimas trazas en formato JSON de Chrome.
+
+    El fichero se abre en chrome://tracing o en https://ui.perfetto.dev.
+
+    Args:
+        limit: Número máximo de trazas
+
+    Returns:
+        JSONResponse: Trace Event Format como descarga
+    """
+    return JSONResponse(
+        tracing.chrome_trace(tracing.recent_traces(limit)),
+        headers={"Content-Disposition": 'attachment; filename="traces.json"'}
+    )
+
+
+@router.get("/traces/{trace_id}")
+async def get_trace(request: Request, trace_id: str):
+    """
+    Obtiene una traza con todos sus spans.
+
+    Una traza guardada ya no cambia, así que su ID es la versión: el cliente
+    puede reutilizarla una hora y después revalidarla con If-None-Match.
+
+    Args:
+        request: Petición HTTP (cabeceras de revalidación)
+        trace_id: ID de la traza
+
+    Returns:
+        dict: Traza con sus spans ordenados por inicio
+
+    Raises:
+        HTTPException 404: Si la traza ya no está en el buffer
+    """
+    trace = tracing.get_trace(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trace not found")
+    return cached_response(request, trace.to_dict(), version=trace_id, max_age=3600)
+
+
+@router.get("/traces/{trace_id}/chrome")
+async def export_trace(trace_id: str):
+    """
+    Exporta una traza en formato JSON de Chrome.
+
+    Args:
+        trace_id: ID de la traza
+
+    Returns:
+        JSONResponse: Trace Event Format como descarga
+
+    Raises:
+        HTTPException 404: Si la traza ya no está en el buffer
+    """
+    trace = tracing.get_trace(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trace not found")
+    return JSONResponse(
+        tracing.chrome_trace([trace]),
+        headers={"Content-Disposition": f'attachment; filename="trace-{trace_id}.json"'}
+    )
+
+
+@router.post("/profile")
+async def profile_process(
+    seconds: float = Query(10, gt=0, le=PROFILE_MAX_SECONDS),
+    output_format: str = Query("speedscope", alias="format", pattern="^(speedscope|folded)$"),
+    interval_ms: float = Query(PROFILE_INTERVAL_MS, ge=1, le=1000)
+):
+    """
+    Perfila todo el proceso durante unos segundos con el profiler por muestreo.
+
+    Para perfilar una sola petición, un administrador puede enviarla con la
+    cabecera `X-Profile: speedscope` (o `folded`).
+
+    Args:
+        seconds: Duración del muestreo
+        output_format: speedscope (JSON para speedscope.app) o folded (flamegraph.pl)
+        interval_ms: Milisegundos entre muestras
+
+    Returns:
+        Response: Fichero del perfil como descarga
+
+    Raises:
+        HTTPException 404: Si el profiler no está activado (PROFILING_ENABLED)
+        HTTPException 409: Si ya hay un perfil en curso
+    """
+    if not PROFILING_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiling is disabled")
+    if not profiler.try_acquire():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A profile is already running")
+
+    try:
+        sampler = profiler.SamplingProfiler(interval=interval_ms / 1000).start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            sampler.stop()
+    finally:
+        profiler.release()
+
+    body, content_type, filename = sampler.render(output_format, f"process-{seconds:g}s")
+    return Response(
+        body,
+        media_type=content_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Profile-Samples": str(sum(sampler.samples.values())),
+        }
+    )
@@ -6,80 +6,182 @@ Proporciona acceso a Realtime Database y Firebase Authentication.
 import firebase_admin
 from firebase_admin import credentials, auth, db, storage
 from functools import lru_cache
+from typing import Any, Dict, Optional
 from .settings import FIREBASE_CREDENTIALS_PATH
+from backend.utils.instrumented_rtdb import instrument
+from backend.core.logger import get_logger
 import os
+import threading
+import time
 
 
+logger = get_logger(__name__)
+
 # Variable global para la app de Firebase
 _firebase_app = None
 
+# Base de datos que sustituye a Firebase (ej: FakeDatabase en benchmarks y tests)
+_database_override = None
+
+# La inicialización es perezosa (primera llamada a get_database, get_auth_client...)
+# y la protege un lock: con varios hilos solo uno carga las credenciales
+_init_lock = threading.Lock()
+_warmup_lock = threading.Lock()
+_init_seconds: Optional[float] = None
+_init_error: Optional[str] = None
+_warmup_thread: Optional[threading.Thread] = None
+
 
 def initialize_firebase():
     """
     Inicializa Firebase Admin SDK con las credenciales del proyecto.
-    Solo se ejecuta una vez (singleton pattern).
+    Solo se ejecuta una vez (singleton pattern), aunque la llamen varios hilos
+    a la vez. Si falla, la siguiente llamada lo vuelve a intentar.
 
     Returns:
         firebase_admin.App: Instancia de la aplicación Firebase
     """
-    global _firebase_app
+    global _firebase_app, _init_seconds, _init_error
 
     if _firebase_app is not None:
         return _firebase_app
 
-    try:
-        # Obtener URL de Realtime Database
-        database_url = os.getenv("FIREBASE_DATABASE_URL", "https://sportstyle-store-default-rtdb.firebaseio.com")
-
-        # Opción 1: Usar archivo de credenciales JSON
-        if FIREBASE_CREDENTIALS_PATH.exists():
-            cred = credentials.Certificate(str(FIREBASE_CREDENTIALS_PATH))
-            _firebase_app = firebase_admin.initialize_app(cred, {
-                'databaseURL': database_url
-            })
-            print(f"✅ Firebase initialized with credentials file: {FIREBASE_CREDENTIALS_PATH}")
-
-        # Opción 2: Usar credenciales desde variables de entorno (producción)
-        elif os.getenv("FIREBASE_PROJECT_ID"):
-            cred = credentials.Certificate({
-                "type": "service_account",
-                "project_id": os.getenv("FIREBASE_PROJECT_ID"),
-                "private_key_id": os.getenv("FIREBASE_PRIVATE_KEY_ID"),
-                "private_key": os.getenv("FIREBASE_PRIVATE_KEY").replace('\\n', '\n'),
-                "client_email": os.getenv("FIREBASE_CLIENT_EMAIL"),
-                "client_id": os.getenv("FIREBASE_CLIENT_ID"),
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
-                "client_x509_cert_url": os.getenv("FIREBASE_CLIENT_CERT_URL")
-            })
-            _firebase_app = firebase_admin.initialize_app(cred, {
-                'databaseURL': database_url
-            })
-            print("✅ Firebase initialized with environment variables")
-
-        else:
-            raise FileNotFoundError(
-                "No Firebase credentials found. "
-                "Please provide firebase-credentials.json or set environment variables."
-            )
-
+    if _database_override is not None:
+        # Con una base de datos sustituta (use_database) no hace falta Firebase
+        return None
+
+    with _init_lock:
+        # Otro hilo puede haberla inicializado mientras se esperaba el lock
+        if _firebase_app is not None:
+            return _firebase_app
+
+        started = time.perf_counter()
+        try:
+            _firebase_app = _create_app()
+        except Exception as e:
+            _init_error = f"{type(e).__name__}: {e}"
+            logger.error("Error initializing Firebase", exc_info=True)
+            raise
+        _init_seconds = time.perf_counter() - started
+        _init_error = None
         return _firebase_app
 
-    except Exception as e:
-        print(f"❌ Error initializing Firebase: {e}")
-        raise
+
+def _create_app():
+    """Carga las credenciales e inicializa el SDK (llamar con _init_lock)."""
+    # Obtener URL de Realtime Database
+    database_url = os.getenv("FIREBASE_DATABASE_URL", "https://sportstyle-store-default-rtdb.firebaseio.com")
+
+    # Opción 1: Usar archivo de credenciales JSON
+    if FIREBASE_CREDENTIALS_PATH.exists():
+        cred = credentials.Certificate(str(FIREBASE_CREDENTIALS_PATH))
+        app = firebase_admin.initialize_app(cred, {
+            'databaseURL': database_url
+        })
+        logger.info("Firebase initialized with credentials file", extra={"credentials": str(FIREBASE_CREDENTIALS_PATH)})
+        return app
+
+    # Opción 2: Usar credenciales desde variables de entorno (producción)
+    if os.getenv("FIREBASE_PROJECT_ID"):
+        cred = credentials.Certificate({
+            "type": "service_account",
+            "project_id": os.getenv("FIREBASE_PROJECT_ID"),
+            "private_key_id": os.getenv("FIREBASE_PRIVATE_KEY_ID"),
+            "private_key": os.getenv("FIREBASE_PRIVATE_KEY").replace('\\n', '\n'),
+            "client_email": os.getenv("FIREBASE_CLIENT_EMAIL"),
+            "client_id": os.getenv("FIREBASE_CLIENT_ID"),
+            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+            "token_uri": "https://oauth2.googleapis.com/token",
+            "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
+            "client_x509_cert_url": os.getenv("FIREBASE_CLIENT_CERT_URL")
+        })
+        app = firebase_admin.initialize_app(cred, {
+            'databaseURL': database_url
+        })
+        logger.info("Firebase initialized with environment variables")
+        return app
+
+    raise FileNotFoundError(
+        "No Firebase credentials found. "
+        "Please provide firebase-credentials.json or set environment variables."
+    )
+
+
+def warm_up_firebase() -> threading.Thread:
+    """
+    Inicializa Firebase en un hilo aparte para no retrasar el arranque.
+
+    Si ya hay un calentamiento en curso no se lanza otro. Los errores quedan
+    registrados en el log y en firebase_status(); la siguiente llamada a
+    get_database() lo vuelve a intentar.
+
+    Returns:
+        threading.Thread: Hilo del calentamiento
+    """
+    global _warmup_thread
+
+    def run():
+        try:
+            initialize_firebase()
+        except Exception:
+            pass  # Ya registrado en initialize_firebase
+
+    with _warmup_lock:
+        if _warmup_thread is None or not _warmup_thread.is_alive():
+            _warmup_thread = threading.Thread(target=run, name="firebase-warmup", daemon=True)
+            _warmup_thread.start()
+        return _warmup_thread
+
+
+def firebase_status() -> Dict[str, Any]:
+    """
+    Estado de la inicialización de Firebase (para /ready).
+
+    Returns:
+        dict: status (ready, initializing, not_initialized o error), la
+            duración de la inicialización y el último error
+    """
+    if _database_override is not None:
+        return {"status": "ready", "backend": "override"}
+    if _firebase_app is not None:
+        return {"status": "ready", "init_seconds": round(_init_seconds or 0.0, 3)}
+    if _warmup_thread is not None and _warmup_thread.is_alive():
+        return {"status": "initializing"}
+    if _init_error is not None:
+        return {"status": "error", "error": _init_error}
+    return {"status": "not_initialized"}
+
+
+def use_database(database):
+    """
+    Sustituye la base de datos que devuelve get_database().
+
+    Todos los servicios obtienen la base de datos con get_database(), así que
+    esto basta para ejecutarlos contra una base de datos en memoria
+    (backend.utils.fake_rtdb.FakeDatabase) sin credenciales ni red.
+
+    Args:
+        database: Objeto con un método reference() (None para volver a Firebase)
+    """
+    global _database_override
+    _database_override = database
 
 
 def get_database():
     """
     Obtiene una referencia a Firebase Realtime Database.
 
+    Si hay listeners de instrumentación (backend.utils.instrumented_rtdb), la
+    referencia se envuelve para cronometrar cada llamada.
+
     Returns:
         db.Reference: Referencia a la raíz de la base de datos
     """
+    if _database_override is not None:
+        return instrument(_database_override.reference())
+
     initialize_firebase()
-    return db.reference()
+    return instrument(db.reference())
 
 
 def get_auth_client():
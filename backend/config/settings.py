@@ -36,6 +36,7 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 horas
 # Configuración de Firebase
 FIREBASE_PROJECT_ID = os.getenv("FIREBASE_PROJECT_ID")
 FIREBASE_WEB_API_KEY = os.getenv("FIREBASE_WEB_API_KEY")  # Para REST API de Firebase Auth
+FIREBASE_WARMUP = os.getenv("FIREBASE_WARMUP", "True") == "True"  # Inicializar en segundo plano al arrancar (si no, en la primera petición)
 
 # Reglas de negocio
 SHIPPING_COST = float(os.getenv("SHIPPING_COST", "5.0"))
@@ -45,3 +46,27 @@ CART_RESERVATION_MINUTES = int(os.getenv("CART_RESERVATION_MINUTES", "30"))
 
 # Configuración de desarrollo
 DEBUG = os.getenv("DEBUG", "True") == "True"
+
+# Trazas por petición (backend/core/tracing.py, consultables en /api/v1/debug/traces)
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", str(DEBUG)) == "True"
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "1.0"))  # Fracción de peticiones trazadas
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", "200"))    # Trazas guardadas en memoria
+
+# Profiler por muestreo bajo demanda (backend/core/profiler.py), solo administradores
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "False") == "True"
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))  # Intervalo entre muestras
+PROFILE_REQUEST_INTERVAL_MS = float(os.getenv("PROFILE_REQUEST_INTERVAL_MS", "1"))  # Ídem al perfilar una petición
+PROFILE_MAX_SECONDS = int(os.getenv("PROFILE_MAX_SECONDS", "60"))   # Duración máxima del perfil de proceso
+
+# Logging estructurado (backend/core/logger.py)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")                                   # json | text
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))                     # Registros en cola antes de descartar
+LOG_SAMPLE_BURST = int(os.getenv("LOG_SAMPLE_BURST", "10"))                    # Repeticiones de un mensaje por ventana (0 = sin muestreo)
+LOG_SAMPLE_WINDOW_SECONDS = float(os.getenv("LOG_SAMPLE_WINDOW_SECONDS", "10"))
+LOG_SLOW_REQUEST_MS = float(os.getenv("LOG_SLOW_REQUEST_MS", "1000"))          # Peticiones registradas como lentas
+
+# Compresión de respuestas (backend/core/compression.py): gzip, o brotli si está instalado
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))           # Bytes; las respuestas más pequeñas van sin comprimir
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
@@ -0,0 +1,157 @@
+"""
+Compresión de las respuestas de la API (gzip o brotli).
+
+CompressionMiddleware elige la codificación según la cabecera Accept-Encoding
+de la petición. Prefiere brotli si el paquete está instalado y si no usa gzip.
+Solo comprime respuestas de texto o JSON de al menos COMPRESSION_MIN_SIZE
+bytes que no vengan ya codificadas. Las respuestas en streaming se comprimen
+trozo a trozo, con un flush en cada uno para no retrasar su envío.
+
+Un ETag fuerte pasa a débil (W/"...") al comprimir, porque el cuerpo enviado
+ya no es byte a byte el mismo; la comparación de If-None-Match
+(backend/core/http_cache.py) es débil, así que la revalidación sigue
+funcionando.
+"""
+
+import zlib
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+
+from backend.config.settings import COMPRESSION_BROTLI_QUALITY, COMPRESSION_GZIP_LEVEL, COMPRESSION_MIN_SIZE
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml")
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Codificación a usar según Accept-Encoding (None si no se acepta ninguna).
+
+    Respeta los valores q; a igual q se prefiere br sobre gzip.
+    """
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name.strip():
+            accepted[name.strip()] = quality
+
+    candidates = ["br", "gzip"] if BROTLI_AVAILABLE else ["gzip"]
+    best = max(candidates, key=lambda encoding: accepted.get(encoding, accepted.get("*", 0.0)))
+    return best if accepted.get(best, accepted.get("*", 0.0)) > 0 else None
+
+
+class _Compressor:
+    """Compresor incremental con la misma interfaz para gzip y brotli."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+        else:
+            self._zlib = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)  # 31 = formato gzip
+
+    def compress(self, data: bytes) -> bytes:
+        """Comprime un trozo y vacía el buffer para poder enviarlo ya."""
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.finish()
+        return self._zlib.compress(data) + self._zlib.flush()
+
+
+def _is_compressible(status: int, headers: MutableHeaders) -> bool:
+    if status < 200 or status in (204, 304) or "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) or "+json" in content_type
+
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI que comprime las respuestas con gzip o brotli.
+
+    Añade Vary: Accept-Encoding a toda respuesta comprimible (aunque vaya sin
+    comprimir) para que las cachés intermedias no mezclen versiones.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = dict(scope.get("headers") or []).get(b"accept-encoding", b"").decode("latin-1")
+        encoding = choose_encoding(accept_encoding) if accept_encoding else None
+        start = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def compressing_send(message):
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                # Se retiene hasta ver el primer trozo del cuerpo
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is not None:
+                data = compressor.compress(body) if more_body else compressor.finish(body)
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+                return
+
+            headers = MutableHeaders(raw=list(start.get("headers", [])))
+            start = {**start, "headers": headers.raw}
+            if not _is_compressible(start["status"], headers):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            headers.add_vary_header("Accept-Encoding")
+            if encoding is None or (not more_body and len(body) < self.minimum_size):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            compressor = _Compressor(encoding)
+            headers["content-encoding"] = encoding
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["etag"] = f"W/{etag}"
+
+            if more_body:
+                del headers["content-length"]
+                data = compressor.compress(body)
+            else:
+                data = compressor.finish(body)
+                headers["content-length"] = str(len(data))
+            await send(start)
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, compressing_send)
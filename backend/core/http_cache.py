@@ -0,0 +1,110 @@
+"""
+Validadores HTTP (ETag / Last-Modified) y respuestas 304 para endpoints cacheables.
+
+cached_response() devuelve la respuesta con ETag, Cache-Control y, si se
+conoce, Last-Modified. Si el cliente ya tiene esa versión (If-None-Match, o
+If-Modified-Since cuando no envía If-None-Match) devuelve 304 sin cuerpo.
+
+El ETag sale de la marca de versión de los datos si existe (updated_at, un
+hash de contenido, un ID inmutable...): así se responde 304 sin serializar
+nada. Sin marca de versión, se calcula a partir del cuerpo serializado.
+
+Uso:
+    @router.get("/me")
+    async def me(http_request: Request, ...):
+        return cached_response(http_request, UserResponse(...))
+
+    return cached_response(http_request, trace.to_dict(), version=trace_id, max_age=3600)
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+from backend.utils.fast_json import FastJSONResponse, encode
+
+
+def make_etag(value: bytes, weak: bool = False) -> str:
+    """ETag a partir de una marca de versión o del cuerpo de la respuesta."""
+    tag = f'"{hashlib.blake2b(value, digest_size=12).hexdigest()}"'
+    return f"W/{tag}" if weak else tag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Comparación débil de If-None-Match (RFC 9110): W/"x" y "x" coinciden."""
+    if if_none_match.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == target for candidate in if_none_match.split(","))
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    # Last-Modified tiene resolución de segundos
+    return last_modified.replace(microsecond=0) <= since
+
+
+def _utc(value: datetime) -> datetime:
+    # Las fechas de la base de datos son UTC sin zona (datetime.utcnow)
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def cached_response(
+    request: Request,
+    content: Any,
+    version: Optional[str] = None,
+    last_modified: Optional[datetime] = None,
+    max_age: int = 0,
+    private: bool = True
+) -> Response:
+    """
+    Respuesta JSON con validadores de caché, o 304 si el cliente está al día.
+
+    Args:
+        request: Petición (cabeceras If-None-Match / If-Modified-Since)
+        content: Modelo Pydantic, lista de modelos o datos JSON
+        version: Marca de versión de los datos (si no, se usa el cuerpo)
+        last_modified: Fecha de la última modificación (UTC)
+        max_age: Segundos que el cliente puede reutilizar la respuesta sin
+            revalidar (0 = revalidar siempre)
+        private: Si la respuesta depende del usuario (no cacheable en proxies)
+
+    Returns:
+        Response: 200 con el cuerpo o 304 sin cuerpo
+    """
+    body = None
+    if version is not None:
+        etag = make_etag(version.encode(), weak=True)
+    else:
+        body = encode(content)
+        etag = make_etag(body)
+
+    scope = "private" if private else "public"
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"{scope}, max-age={max_age}" if max_age else f"{scope}, no-cache",
+    }
+    if private:
+        headers["Vary"] = "Authorization"
+    if last_modified is not None:
+        last_modified = _utc(last_modified)
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = etag_matches(if_none_match, etag)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        not_modified = bool(if_modified_since and last_modified and _not_modified_since(if_modified_since, last_modified))
+
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+    if body is None:
+        return FastJSONResponse(content, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
@@ -0,0 +1,260 @@
+"""
+Logging estructurado y no bloqueante.
+
+Los registros se encolan en una cola acotada y los escribe un hilo aparte
+(QueueListener): quien registra no espera nunca a stdout. Si la cola se llena,
+el registro se descarta y se cuenta, para no añadir latencia bajo carga.
+
+Cada registro sale como una línea JSON (LOG_FORMAT=json) o como texto legible
+(LOG_FORMAT=text). Incluye el nivel, el logger, el mensaje, el ID de la
+petición en curso (RequestLoggingMiddleware) y los campos pasados en `extra`.
+
+Los mensajes repetidos se muestrean: de cada mensaje (logger + plantilla) se
+emiten como mucho LOG_SAMPLE_BURST por ventana de LOG_SAMPLE_WINDOW_SECONDS. El
+siguiente que se emite lleva en `suppressed` cuántos se omitieron. Los errores
+no se muestrean.
+
+Uso:
+    from backend.core.logger import get_logger
+
+    logger = get_logger(__name__)
+    logger.info("Pedido creado", extra={"order_id": order_id, "items": 3})
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from backend.config.settings import (
+    LOG_FORMAT,
+    LOG_LEVEL,
+    LOG_QUEUE_SIZE,
+    LOG_SAMPLE_BURST,
+    LOG_SAMPLE_WINDOW_SECONDS,
+    LOG_SLOW_REQUEST_MS
+)
+
+ROOT_LOGGER = "sportstyle"
+
+# Atributos estándar de LogRecord (el resto son campos de `extra`)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_configure_lock = threading.Lock()
+
+
+def get_request_id() -> Optional[str]:
+    """ID de la petición en curso (None fuera de una petición)."""
+    return _request_id.get()
+
+
+class RequestIdFilter(logging.Filter):
+    """Añade el ID de la petición en curso (se ejecuta en el hilo que registra)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            record.request_id = _request_id.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Limita los mensajes repetidos a `burst` por ventana de `window` segundos.
+
+    La clave es el logger y la plantilla del mensaje (sin argumentos), así que
+    "Error al sincronizar %s" cuenta como un solo mensaje.
+    """
+
+    def __init__(self, burst: int, window: float, max_level: int = logging.WARNING):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self.max_level = max_level
+        self._counts: Dict[Tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or self.burst <= 0:
+            return True
+
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            # [inicio de la ventana, emitidos en la ventana, omitidos pendientes de avisar]
+            state = self._counts.get(key)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[2] if state else 0
+                state = self._counts[key] = [now, 0, suppressed]
+                if len(self._counts) > 10_000:
+                    # Evitar que crezca sin límite con mensajes únicos
+                    self._counts = {key: state}
+            if state[1] >= self.burst:
+                state[2] += 1
+                return False
+            state[1] += 1
+            if state[2]:
+                record.suppressed = state[2]
+                state[2] = 0
+        return True
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que descarta (y cuenta) en lugar de bloquear si la cola está llena."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Solo se resuelve el mensaje; la traza de la excepción la formatea el hilo escritor
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class JsonFormatter(logging.Formatter):
+    """Un objeto JSON por línea con los campos estándar y los de `extra`."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and value is not None:
+                data[key] = value
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Texto legible para desarrollo: hora, nivel, logger, mensaje y campos."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = " ".join(
+            f"{key}={value}" for key, value in vars(record).items()
+            if key not in _RECORD_ATTRS and value is not None
+        )
+        line = f"{self.formatTime(record, '%H:%M:%S')} {record.levelname:<7} {record.name}: {record.getMessage()}"
+        if fields:
+            line += f" [{fields}]"
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+def configure_logging():
+    """
+    Configura el logger raíz de la aplicación (una sola vez).
+
+    Los registros van a una cola acotada; un QueueListener los escribe en
+    stdout desde su propio hilo y se vacía al salir del proceso.
+    """
+    global _listener
+    with _configure_lock:
+        if _listener is not None:
+            return
+
+        log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        handler = DroppingQueueHandler(log_queue)
+        handler.addFilter(RequestIdFilter())
+        handler.addFilter(SamplingFilter(LOG_SAMPLE_BURST, LOG_SAMPLE_WINDOW_SECONDS))
+
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else TextFormatter())
+
+        root = logging.getLogger(ROOT_LOGGER)
+        root.setLevel(LOG_LEVEL)
+        root.addHandler(handler)
+        root.propagate = False
+
+        _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Logger de la aplicación (hijo de "sportstyle").
+
+    Args:
+        name: Nombre del módulo (normalmente __name__)
+
+    Returns:
+        logging.Logger: Logger configurado
+    """
+    configure_logging()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+_access_logger = get_logger("access")
+
+
+class RequestLoggingMiddleware:
+    """
+    Middleware ASGI que asigna un ID a cada petición y registra su duración.
+
+    Respeta la cabecera X-Request-ID entrante y la devuelve en la respuesta.
+    Las peticiones se registran en DEBUG; las lentas (LOG_SLOW_REQUEST_MS) en
+    WARNING y los errores 5xx en ERROR.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        incoming = dict(scope.get("headers") or []).get(b"x-request-id", b"").decode("latin-1")
+        request_id = incoming[:64] if incoming else uuid.uuid4().hex[:16]
+        token = _request_id.set(request_id)
+        status = 500
+
+        async def send_with_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message = {**message, "headers": list(message.get("headers", [])) + [(b"x-request-id", request_id.encode())]}
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            duration_ms = round((time.perf_counter() - started) * 1000, 2)
+            if status >= 500:
+                level = logging.ERROR
+            elif duration_ms >= LOG_SLOW_REQUEST_MS:
+                level = logging.WARNING
+            else:
+                level = logging.DEBUG
+            if _access_logger.isEnabledFor(level):
+                # La ruta va en el mensaje para que el muestreo sea por ruta
+                _access_logger.log(level, f"{scope.get('method', '')} {scope.get('path', '')}", extra={
+                    "status": status,
+                    "duration_ms": duration_ms,
+                })
+            _request_id.reset(token)
@@ -0,0 +1,245 @@
+"""
+Métricas de la API en formato de texto de Prometheus.
+
+MetricsMiddleware (ASGI) registra por ruta la latencia, el código de estado y
+el tamaño de petición y respuesta, además de las peticiones en curso. Las
+llamadas a Realtime Database se cuentan con un listener de
+backend.utils.instrumented_rtdb: en total por operación y colección, y por
+petición (cuántas llamadas hizo y cuánto tiempo pasó esperando a la base de
+datos). Todo se expone en /metrics con render().
+
+Las rutas se etiquetan con su plantilla (/api/v1/auth/me), no con la URL, para
+que el número de series no crezca con los parámetros.
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from backend.utils import instrumented_rtdb
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+CALLS_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """Base de las métricas: nombre, ayuda, etiquetas y valores por etiquetas."""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Contador que solo crece."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        super().__init__(name, help_text, labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labels, key)} {_format_number(value)}" for key, value in values
+        ]
+
+
+class Gauge(Counter):
+    """Valor que sube y baja."""
+
+    kind = "gauge"
+
+    def dec(self, *label_values: str, amount: float = 1):
+        self.inc(*label_values, amount=-amount)
+
+
+class Histogram(_Metric):
+    """Histograma acumulado con cubos fijos, suma y número de observaciones."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *label_values: str):
+        with self._lock:
+            # [cuenta por cubo..., suma, observaciones]
+            data = self._values.get(label_values)
+            if data is None:
+                data = self._values[label_values] = [0] * len(self.buckets) + [0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    data[index] += 1
+                    break
+            data[-2] += value
+            data[-1] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted((key, list(data)) for key, data in self._values.items())
+        lines = self._header()
+        for key, data in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets, data):
+                cumulative += count
+                le = f'le="{_format_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {_format_number(data[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {data[-1]}")
+        return lines
+
+
+REQUESTS = Counter("http_requests_total", "Peticiones HTTP atendidas", ("method", "route", "status"))
+REQUEST_SECONDS = Histogram("http_request_duration_seconds", "Latencia de las peticiones HTTP", ("method", "route"))
+IN_FLIGHT = Gauge("http_requests_in_flight", "Peticiones HTTP en curso")
+REQUEST_BYTES = Histogram("http_request_size_bytes", "Tamaño del cuerpo de las peticiones", ("route",), SIZE_BUCKETS)
+RESPONSE_BYTES = Histogram("http_response_size_bytes", "Tamaño del cuerpo de las respuestas", ("route",), SIZE_BUCKETS)
+REQUEST_STORAGE_CALLS = Histogram(
+    "http_request_storage_calls", "Llamadas a Realtime Database por petición", ("route",), CALLS_BUCKETS
+)
+REQUEST_STORAGE_SECONDS = Histogram(
+    "http_request_storage_seconds", "Tiempo esperando a Realtime Database por petición", ("route",)
+)
+STORAGE_CALLS = Counter("storage_calls_total", "Llamadas a Realtime Database", ("op", "collection"))
+STORAGE_ERRORS = Counter("storage_errors_total", "Llamadas a Realtime Database fallidas", ("op", "collection"))
+STORAGE_SECONDS = Histogram("storage_call_duration_seconds", "Latencia de las llamadas a Realtime Database", ("op",))
+
+METRICS = [
+    REQUESTS, REQUEST_SECONDS, IN_FLIGHT, REQUEST_BYTES, RESPONSE_BYTES,
+    REQUEST_STORAGE_CALLS, REQUEST_STORAGE_SECONDS, STORAGE_CALLS, STORAGE_ERRORS, STORAGE_SECONDS,
+]
+
+# [llamadas, segundos] a la base de datos de la petición en curso
+_request_storage: ContextVar[Optional[List[float]]] = ContextVar("request_storage", default=None)
+
+
+def record_storage_call(op: str, path: str, started: float, seconds: float, error: Optional[BaseException]):
+    """Listener de instrumented_rtdb: acumula la llamada en las métricas."""
+    collection = path.strip('/').split('/', 1)[0] or "/"
+    STORAGE_CALLS.inc(op, collection)
+    STORAGE_SECONDS.observe(seconds, op)
+    if error is not None:
+        STORAGE_ERRORS.inc(op, collection)
+
+    current = _request_storage.get()
+    if current is not None:
+        current[0] += 1
+        current[1] += seconds
+
+
+def render() -> str:
+    """Todas las métricas en formato de texto de Prometheus."""
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que mide cada petición HTTP.
+
+    Al registrarse activa el listener de llamadas a la base de datos.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._routes: Dict[object, str] = {}
+        instrumented_rtdb.add_listener(record_storage_call)
+
+    def _route(self, scope) -> str:
+        """Plantilla de la ruta que atendió la petición (la resuelve el router)."""
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        if endpoint not in self._routes:
+            for route in getattr(scope.get("app"), "routes", []):
+                if getattr(route, "endpoint", None) is endpoint:
+                    self._routes[endpoint] = route.path
+                    break
+            else:
+                self._routes[endpoint] = getattr(endpoint, "__name__", UNMATCHED_ROUTE)
+        return self._routes[endpoint]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_bytes = 0
+        response_bytes = 0
+        status = 500
+
+        async def counting_receive():
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                request_bytes += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message):
+            nonlocal response_bytes, status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        storage = [0, 0.0]
+        token = _request_storage.set(storage)
+        IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            elapsed = time.perf_counter() - started
+            IN_FLIGHT.dec()
+            _request_storage.reset(token)
+
+            route = self._route(scope)
+            method = scope.get("method", "")
+            REQUESTS.inc(method, route, str(status))
+            REQUEST_SECONDS.observe(elapsed, method, route)
+            REQUEST_BYTES.observe(request_bytes, route)
+            RESPONSE_BYTES.observe(response_bytes, route)
+            REQUEST_STORAGE_CALLS.observe(storage[0], route)
+            REQUEST_STORAGE_SECONDS.observe(storage[1], route)
@@ -0,0 +1,228 @@
+"""
+Profiler por muestreo bajo demanda (opcional, solo administradores).
+
+Un hilo toma cada PROFILE_INTERVAL_MS la pila de los hilos observados
+(sys._current_frames) y cuenta cuántas veces aparece cada pila. No hace falta
+instrumentar el código ni reiniciar con un profiler: el coste solo existe
+mientras se perfila. Hay dos modos, ambos desactivados salvo con
+PROFILING_ENABLED=True:
+
+- Una petición: un administrador añade la cabecera `X-Profile: speedscope` (o
+  `folded`). ProfilingMiddleware muestrea (cada PROFILE_REQUEST_INTERVAL_MS) el hilo que atiende la petición y
+  devuelve el perfil en lugar de la respuesta; el código original va en
+  `X-Profiled-Status`. Los endpoints son async, así que ese hilo es el del
+  event loop: si hay otras peticiones a la vez, también aparecerán.
+- Todo el proceso: POST /api/v1/debug/profile?seconds=N muestrea todos los
+  hilos durante N segundos.
+
+Formatos: speedscope (JSON para https://www.speedscope.app) y folded (líneas
+"a;b;c N" para flamegraph.pl o speedscope).
+"""
+
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from backend.config.settings import PROFILE_INTERVAL_MS, PROFILE_REQUEST_INTERVAL_MS, PROFILING_ENABLED
+
+FORMATS = ("speedscope", "folded")
+MAX_STACK_DEPTH = 200
+
+# Solo un perfil a la vez (el muestreo de todo el proceso ya incluye cualquier petición)
+_busy = threading.Lock()
+
+# (función, fichero, línea de la definición)
+Frame = Tuple[str, str, int]
+
+
+def _frame_key(frame) -> Frame:
+    code = frame.f_code
+    return code.co_name, code.co_filename, code.co_firstlineno
+
+
+class SamplingProfiler:
+    """
+    Muestrea las pilas de uno o varios hilos desde un hilo aparte.
+
+    Uso:
+        profiler = SamplingProfiler(interval=0.005).start()
+        ...
+        profiler.stop()
+        data = profiler.speedscope("signin")
+    """
+
+    def __init__(self, interval: float = PROFILE_INTERVAL_MS / 1000, thread_ids: Optional[Iterable[int]] = None):
+        self.interval = interval
+        self.thread_ids = set(thread_ids) if thread_ids is not None else None
+        self.samples: Counter = Counter()
+        self.duration = 0.0
+        self._started = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SamplingProfiler":
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> "SamplingProfiler":
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self._started
+        return self
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or (self.thread_ids is not None and thread_id not in self.thread_ids):
+                    continue
+                stack = []
+                while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                    stack.append(_frame_key(frame))
+                    frame = frame.f_back
+                # Pila de la raíz a la hoja, con el hilo como primer marco
+                stack.append((names.get(thread_id, str(thread_id)), "<thread>", 0))
+                self.samples[tuple(reversed(stack))] += 1
+
+    def folded(self) -> str:
+        """Pilas en formato "plegado" de flamegraph.pl: "a;b;c muestras"."""
+        lines = []
+        for stack, count in self.samples.most_common():
+            names = [name if file == "<thread>" else f"{Path(file).stem}:{name}" for name, file, _ in stack]
+            lines.append(f"{';'.join(names)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self, name: str) -> Dict[str, Any]:
+        """Perfil en el formato de fichero de speedscope (tipo "sampled")."""
+        frames: List[Dict[str, Any]] = []
+        index: Dict[Frame, int] = {}
+        samples = []
+        weights = []
+        for stack, count in self.samples.most_common():
+            sample = []
+            for frame in stack:
+                if frame not in index:
+                    index[frame] = len(frames)
+                    function, file, line = frame
+                    frames.append({"name": function, "file": file, "line": line} if line else {"name": function})
+                sample.append(index[frame])
+            samples.append(sample)
+            weights.append(count * self.interval)
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "sportstyle-store sampling profiler",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": self.duration,
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+
+    def render(self, output_format: str, name: str) -> Tuple[bytes, str, str]:
+        """
+        Perfil listo para enviar.
+
+        Returns:
+            Tuple[bytes, str, str]: (contenido, content-type, nombre de fichero)
+        """
+        if output_format == "folded":
+            return self.folded().encode(), "text/plain; charset=utf-8", f"{name}.folded.txt"
+        return json.dumps(self.speedscope(name)).encode(), "application/json", f"{name}.speedscope.json"
+
+
+def try_acquire() -> bool:
+    """Reserva el profiler (False si ya hay un perfil en curso)."""
+    return _busy.acquire(blocking=False)
+
+
+def release():
+    _busy.release()
+
+
+def _is_admin(headers: Dict[bytes, bytes]) -> bool:
+    """Comprueba que el token Bearer de la petición es de un administrador."""
+    from fastapi import HTTPException
+    from backend.core.security import decode_access_token
+    from backend.services.user_service import UserService
+
+    scheme, _, token = headers.get(b"authorization", b"").decode("latin-1").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        user = UserService.get_user_by_id(int(decode_access_token(token).get("sub")))
+    except (HTTPException, TypeError, ValueError):
+        return False
+    return bool(user and user.get("es_admin") and user.get("activo", True))
+
+
+class ProfilingMiddleware:
+    """
+    Middleware ASGI que perfila una petición si un administrador envía X-Profile.
+
+    Sin PROFILING_ENABLED, o si la cabecera no viene de un administrador, la
+    petición se atiende con normalidad.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not PROFILING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        requested = headers.get(b"x-profile", b"").decode("latin-1").strip().lower()
+        if not requested:
+            await self.app(scope, receive, send)
+            return
+
+        output_format = requested if requested in FORMATS else "speedscope"
+        if not _is_admin(headers) or not try_acquire():
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def discard_send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        # Una petición dura milisegundos: se muestrea más a menudo que el proceso
+        profiler = SamplingProfiler(PROFILE_REQUEST_INTERVAL_MS / 1000, thread_ids=[threading.get_ident()]).start()
+        try:
+            await self.app(scope, receive, discard_send)
+        finally:
+            profiler.stop()
+            release()
+
+        name = f"{scope.get('method', '')} {scope.get('path', '')}"
+        body, content_type, filename = profiler.render(output_format, name.replace(' ', '_').replace('/', '_').strip('_'))
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", content_type.encode()),
+                (b"content-length", str(len(body)).encode()),
+                (b"content-disposition", f'attachment; filename="{filename}"'.encode()),
+                (b"x-profiled-status", str(status).encode()),
+                (b"x-profile-samples", str(sum(profiler.samples.values())).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
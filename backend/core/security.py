@@ -10,6 +10,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from backend.config.settings import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
 from backend.services.user_service import UserService
+from backend.core.tracing import traced
 
 
 # Esquema de seguridad HTTP Bearer
@@ -42,6 +43,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
+@traced("jwt.decode")
 def decode_access_token(token: str) -> dict:
     """
     Decodifica un token JWT y valida su autenticidad.
@@ -66,6 +68,7 @@ def decode_access_token(token: str) -> dict:
         )
 
 
+@traced("security.get_current_user")
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
@@ -138,3 +141,24 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or token expired"
         )
+
+
+async def get_current_admin(current_user: dict = Depends(get_current_user)):
+    """
+    Obtiene el usuario actual exigiendo que sea administrador.
+
+    Args:
+        current_user: Usuario actual desde el token JWT
+
+    Returns:
+        dict: Información del usuario actual
+
+    Raises:
+        HTTPException 403: Si el usuario no es administrador
+    """
+    if not current_user.get("es_admin"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Administrator privileges required"
+        )
+    return current_user
@@ -0,0 +1,295 @@
+"""
+Trazas ligeras por petición.
+
+TracingMiddleware abre una traza por petición HTTP (según TRACE_SAMPLE_RATE).
+Dentro de ella se registran como spans anidados:
+- get_current_user y la decodificación del JWT;
+- cada método de UserService, CartService y OrderService (@trace_methods);
+- cada llamada a Realtime Database (listener de backend.utils.instrumented_rtdb);
+- la serialización de la respuesta de FastAPI.
+
+El tiempo de la petición que no cubre ningún span hijo es del framework
+(validación, routing...).
+
+Las trazas terminadas se guardan en un buffer circular en memoria
+(TRACE_BUFFER_SIZE), se consultan en /api/v1/debug/traces y se exportan en el
+formato JSON de Chrome (chrome://tracing, Perfetto) con chrome_trace().
+
+Fuera de una traza, los spans no hacen nada (una consulta a un ContextVar).
+"""
+
+import functools
+import inspect
+import itertools
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from backend.config.settings import API_V1_PREFIX, TRACE_BUFFER_SIZE, TRACE_SAMPLE_RATE, TRACING_ENABLED
+from backend.utils import instrumented_rtdb
+
+# Rutas que no se trazan (las propias de diagnóstico)
+EXCLUDED_PREFIXES = ("/metrics", f"{API_V1_PREFIX}/debug")
+
+
+class Span:
+    """Tramo de una traza: nombre, inicio y duración (segundos de perf_counter)."""
+
+    __slots__ = ("span_id", "parent_id", "name", "start", "duration", "thread", "attrs", "error")
+
+    def __init__(self, span_id: int, parent_id: Optional[int], name: str, start: float, attrs: Dict[str, Any]):
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.start = start
+        self.duration = 0.0
+        self.thread = threading.get_ident()
+        self.attrs = attrs
+        self.error: Optional[str] = None
+
+    def to_dict(self, origin: float) -> Dict[str, Any]:
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round(self.duration * 1000, 3),
+            "thread": self.thread,
+            "attrs": self.attrs,
+            "error": self.error,
+        }
+
+
+class Trace:
+    """Traza de una petición: sus spans, en el orden en que terminan."""
+
+    def __init__(self, name: str):
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.name = name
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        self.duration = 0.0
+        self.status: Optional[int] = None
+        self.spans: List[Span] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def new_span(self, parent_id: Optional[int], name: str, start: float, attrs: Dict[str, Any]) -> Span:
+        with self._lock:
+            return Span(next(self._ids), parent_id, name, start, attrs)
+
+    def add(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def summary(self) -> Dict[str, Any]:
+        storage = [span for span in self.spans if span.name.startswith("rtdb.")]
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "status": self.status,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration * 1000, 3),
+            "spans": len(self.spans),
+            "storage_calls": len(storage),
+            "storage_ms": round(sum(span.duration for span in storage) * 1000, 3),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = self.summary()
+        data["spans"] = [span.to_dict(self.start) for span in sorted(self.spans, key=lambda span: span.start)]
+        return data
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[int]] = ContextVar("current_span", default=None)
+
+_buffer: deque = deque(maxlen=TRACE_BUFFER_SIZE)
+_buffer_lock = threading.Lock()
+
+
+@contextmanager
+def span(name: str, **attrs) -> Iterator[Optional[Span]]:
+    """Span anidado en el span actual (no hace nada fuera de una traza)."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    current = trace.new_span(_current_span.get(), name, time.perf_counter(), attrs)
+    token = _current_span.set(current.span_id)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = type(e).__name__
+        raise
+    finally:
+        current.duration = time.perf_counter() - current.start
+        _current_span.reset(token)
+        trace.add(current)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorador que envuelve una función (síncrona o async) en un span."""
+    def decorator(function: Callable) -> Callable:
+        span_name = name or function.__qualname__
+
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                if _current_trace.get() is None:
+                    return await function(*args, **kwargs)
+                with span(span_name):
+                    return await function(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return function(*args, **kwargs)
+            with span(span_name):
+                return function(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def trace_methods(cls):
+    """Decorador de clase: un span por cada método estático o de clase (Clase.metodo)."""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("__"):
+            continue
+        if isinstance(value, staticmethod):
+            setattr(cls, attr, staticmethod(traced(f"{cls.__name__}.{attr}")(value.__func__)))
+        elif isinstance(value, classmethod):
+            setattr(cls, attr, classmethod(traced(f"{cls.__name__}.{attr}")(value.__func__)))
+    return cls
+
+
+def record_storage_call(op: str, path: str, started: float, seconds: float, error: Optional[BaseException]):
+    """Listener de instrumented_rtdb: la llamada como span hijo del span actual."""
+    trace = _current_trace.get()
+    if trace is None:
+        return
+    current = trace.new_span(_current_span.get(), f"rtdb.{op}", started, {"path": path})
+    current.duration = seconds
+    if error is not None:
+        current.error = type(error).__name__
+    trace.add(current)
+
+
+def start_trace(name: str) -> Optional[Trace]:
+    """Abre una traza en el contexto actual si toca según el muestreo."""
+    if not TRACING_ENABLED or random.random() >= TRACE_SAMPLE_RATE:
+        return None
+    trace = Trace(name)
+    _current_trace.set(trace)
+    _current_span.set(None)
+    return trace
+
+
+def finish_trace(trace: Trace):
+    """Cierra la traza y la guarda en el buffer."""
+    trace.duration = time.perf_counter() - trace.start
+    _current_trace.set(None)
+    with _buffer_lock:
+        _buffer.append(trace)
+
+
+def recent_traces(limit: int = 50) -> List[Trace]:
+    """Últimas trazas guardadas, la más reciente primero."""
+    with _buffer_lock:
+        traces = list(_buffer)
+    return traces[::-1][:limit]
+
+
+def get_trace(trace_id: str) -> Optional[Trace]:
+    with _buffer_lock:
+        return next((trace for trace in _buffer if trace.trace_id == trace_id), None)
+
+
+def clear():
+    with _buffer_lock:
+        _buffer.clear()
+
+
+def chrome_trace(traces: List[Trace]) -> Dict[str, Any]:
+    """
+    Trazas en el formato JSON de Chrome (Trace Event Format).
+
+    Cada petición ocupa su propia fila (tid) con la petición completa como
+    evento raíz; los spans se anidan por tiempo dentro de ella.
+    """
+    events = []
+    for row, trace in enumerate(sorted(traces, key=lambda trace: trace.start), start=1):
+        events.append({
+            "name": "thread_name", "ph": "M", "pid": 1, "tid": row,
+            "args": {"name": f"{trace.name} [{trace.trace_id}]"},
+        })
+        events.append({
+            "name": trace.name, "cat": "request", "ph": "X", "pid": 1, "tid": row,
+            "ts": trace.start * 1e6, "dur": trace.duration * 1e6,
+            "args": {"trace_id": trace.trace_id, "status": trace.status},
+        })
+        for item in trace.spans:
+            events.append({
+                "name": item.name, "cat": item.name.split('.', 1)[0], "ph": "X", "pid": 1, "tid": row,
+                "ts": item.start * 1e6, "dur": item.duration * 1e6,
+                "args": {**item.attrs, **({"error": item.error} if item.error else {})},
+            })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def install_fastapi_hooks():
+    """
+    Traza la serialización de las respuestas de FastAPI.
+
+    fastapi.routing busca serialize_response en el módulo en cada petición, así
+    que basta con sustituirla por la versión envuelta en un span.
+    """
+    import fastapi.routing
+
+    if not getattr(fastapi.routing.serialize_response, "_traced", False):
+        wrapped = traced("fastapi.serialize_response")(fastapi.routing.serialize_response)
+        wrapped._traced = True
+        fastapi.routing.serialize_response = wrapped
+
+
+class TracingMiddleware:
+    """
+    Middleware ASGI que abre una traza por petición HTTP.
+
+    Al registrarse activa el listener de llamadas a la base de datos y el span
+    de serialización de FastAPI.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        instrumented_rtdb.add_listener(record_storage_call)
+        install_fastapi_hooks()
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] != "http" or path.startswith(EXCLUDED_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        trace = start_trace(f"{scope.get('method', '')} {path}")
+        if trace is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def traced_send(message):
+            if message["type"] == "http.response.start":
+                trace.status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, traced_send)
+        finally:
+            finish_trace(trace)
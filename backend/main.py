@@ -3,21 +3,37 @@ Aplicación principal de FastAPI para SportStyle Store.
 Configura rutas, middleware y CORS.
 """
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from backend.config.settings import (
     PROJECT_NAME,
     VERSION,
     DESCRIPTION,
     API_V1_PREFIX,
-    ALLOWED_ORIGINS
+    ALLOWED_ORIGINS,
+    FIREBASE_WARMUP
 )
-from backend.api.v1.endpoints import auth
-from backend.config.firebase_config import initialize_firebase
+from backend.api.v1.endpoints import auth, debug
+from backend.config.firebase_config import firebase_status, warm_up_firebase
+from backend.core import metrics, profiler, tracing
+from backend.core.compression import CompressionMiddleware
+from backend.core.logger import RequestLoggingMiddleware
+from backend.utils.fast_json import FastJSONResponse
 
 
-# Inicializar Firebase al arrancar la aplicación
-initialize_firebase()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Arranque del worker.
+
+    Firebase se inicializa de forma perezosa en la primera llamada que lo
+    necesita; con FIREBASE_WARMUP se adelanta en un hilo aparte. Así el worker
+    acepta conexiones (y responde a /health) sin esperar a las credenciales.
+    """
+    if FIREBASE_WARMUP:
+        warm_up_firebase()
+    yield
 
 
 # Crear aplicación FastAPI
@@ -26,7 +42,9 @@ app = FastAPI(
     version=VERSION,
     description=DESCRIPTION,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
 )
 
 
@@ -39,9 +57,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compresión gzip/brotli de las respuestas de texto y JSON (COMPRESSION_MIN_SIZE).
+# Va dentro de las métricas para que registren los bytes realmente enviados
+app.add_middleware(CompressionMiddleware)
+
+# Métricas por ruta y de las llamadas a la base de datos (ver /metrics)
+app.add_middleware(metrics.MetricsMiddleware)
+
+# Trazas por petición (ver /api/v1/debug/traces)
+app.add_middleware(tracing.TracingMiddleware)
+
+# Perfil de una petición con la cabecera X-Profile (administradores, PROFILING_ENABLED)
+app.add_middleware(profiler.ProfilingMiddleware)
+
+# ID por petición (X-Request-ID) en los logs y registro de peticiones lentas o con error
+app.add_middleware(RequestLoggingMiddleware)
+
 
 # Registrar routers
 app.include_router(auth.router, prefix=API_V1_PREFIX)
+app.include_router(debug.router, prefix=API_V1_PREFIX)
 
 
 @app.get("/")
@@ -56,7 +91,8 @@ async def root():
         "message": "Welcome to SportStyle Store API",
         "version": VERSION,
         "docs": "/docs",
-        "health": "/health"
+        "health": "/health",
+        "ready": "/ready"
     }
 
 
@@ -75,6 +111,46 @@ async def health_check():
     }
 
 
+@app.get("/ready")
+async def readiness_check():
+    """
+    Endpoint de readiness: indica si las dependencias están listas.
+
+    A diferencia de /health (el proceso responde), devuelve 503 hasta que
+    Firebase está inicializado. Si no se ha inicializado ni se está
+    inicializando, lanza el calentamiento en segundo plano.
+
+    Returns:
+        JSONResponse: Estado global y de cada dependencia (200 o 503)
+    """
+    firebase = firebase_status()
+    if firebase["status"] in ("not_initialized", "error"):
+        warm_up_firebase()
+
+    ready = firebase["status"] == "ready"
+    return FastJSONResponse(
+        {
+            "status": "ready" if ready else "not_ready",
+            "service": PROJECT_NAME,
+            "version": VERSION,
+            "checks": {"firebase": firebase}
+        },
+        status_code=200 if ready else 503
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    """
+    Métricas de la API en formato de texto de Prometheus.
+
+    Returns:
+        Response: Latencia, códigos de estado y tamaños por ruta, peticiones
+            en curso y llamadas a Realtime Database
+    """
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
 # Para ejecutar con uvicorn
 if __name__ == "__main__":
     import uvicorn
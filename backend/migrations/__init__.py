@@ -0,0 +1,20 @@
+"""
+Migraciones de datos versionadas para Firebase Realtime Database.
+
+Cada migración recorre una colección por páginas y aplica sus cambios en lotes
+multi-ruta; el progreso se guarda en /migrations/{version}, así que se pueden
+interrumpir y reanudar. Para añadir una, crea un módulo mNNNN_*.py con una
+subclase de Migration y regístrala en MIGRATIONS (en orden de versión).
+"""
+
+from backend.migrations.base import Migration
+from backend.migrations.runner import MigrationRunner
+from backend.migrations.m0001_rekey_legacy_product_ids import RekeyLegacyProductIds
+from backend.migrations.m0002_product_id_to_int import ProductIdToInt
+
+MIGRATIONS = [
+    RekeyLegacyProductIds(),
+    ProductIdToInt(),
+]
+
+__all__ = ["Migration", "MigrationRunner", "MIGRATIONS"]
@@ -0,0 +1,46 @@
+"""
+Clase base de las migraciones de datos.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+
+class Migration(ABC):
+    """
+    Migración versionada que transforma los hijos de una colección uno a uno.
+
+    Cada migración define:
+    - version: identificador ordenable (ej: "0001"), también clave en /migrations
+    - description: qué hace, para el listado de estado
+    - collection: nodo que recorre (ej: "products", "users", "carts", "orders")
+    - transform(): cambios a aplicar para un hijo
+
+    transform() es abstracto: una migración que no lo define falla al
+    instanciarla, antes de empezar a recorrer la colección.
+
+    transform() debe ser idempotente: al reanudar una migración interrumpida
+    puede volver a procesar el último lote que no llegó a confirmarse.
+    """
+
+    version: str = ""
+    description: str = ""
+    collection: str = ""
+
+    @abstractmethod
+    def transform(self, key: str, value: Any) -> Dict[str, Any]:
+        """
+        Calcula los cambios para un hijo de la colección.
+
+        Args:
+            key: Clave del hijo (ej: "prod_001")
+            value: Contenido actual del hijo
+
+        Returns:
+            Dict[str, Any]: Rutas relativas a la colección y su nuevo valor
+                (None para eliminar), p. ej. {f"{key}/id": 1}. Vacío si no hay
+                nada que cambiar.
+        """
+
+    def __repr__(self) -> str:
+        return f"<Migration {self.version} {self.description}>"
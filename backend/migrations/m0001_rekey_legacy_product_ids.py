@@ -0,0 +1,35 @@
+"""
+0001 - Reasigna las claves de producto "prod_001", "prod_002"... a "1", "2"...
+(sustituye a migrate_product_ids.py).
+"""
+
+import re
+from typing import Any, Dict
+from backend.migrations.base import Migration
+
+
+class RekeyLegacyProductIds(Migration):
+    """
+    Mueve cada producto con clave prod_NNN a la clave NNN (sin ceros a la
+    izquierda) y guarda el campo 'id' como int.
+
+    El nuevo ID sale del número de la clave antigua, no de la posición del
+    producto, así que el resultado no depende del orden ni de reanudaciones.
+    """
+
+    version = "0001"
+    description = "Claves de producto prod_NNN -> NNN con id int"
+    collection = "products"
+
+    LEGACY_KEY = re.compile(r"^prod_(\d+)$")
+
+    def transform(self, key: str, value: Any) -> Dict[str, Any]:
+        match = self.LEGACY_KEY.match(key)
+        if not match or not isinstance(value, dict):
+            return {}
+
+        new_id = int(match.group(1))
+        return {
+            key: None,
+            str(new_id): {**value, "id": new_id},
+        }
@@ -0,0 +1,26 @@
+"""
+0002 - Convierte a int el campo 'id' de los productos guardado como string
+(sustituye a convert_ids_to_int.py).
+"""
+
+from typing import Any, Dict
+from backend.migrations.base import Migration
+
+
+class ProductIdToInt(Migration):
+    """
+    Las claves de Firebase siguen siendo strings; solo cambia el campo 'id'.
+    """
+
+    version = "0002"
+    description = "Campo id de productos str -> int"
+    collection = "products"
+
+    def transform(self, key: str, value: Any) -> Dict[str, Any]:
+        if not isinstance(value, dict):
+            return {}
+
+        current_id = value.get('id')
+        if isinstance(current_id, str) and current_id.isdigit():
+            return {f"{key}/id": int(current_id)}
+        return {}
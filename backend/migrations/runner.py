@@ -0,0 +1,240 @@
+"""
+Ejecución de migraciones por lotes, en paralelo y reanudables.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from backend.config.firebase_config import get_database
+from backend.migrations.base import Migration
+from backend.utils.retry import call_with_retries
+from backend.utils.rtdb import iter_children
+
+
+class MigrationRunner:
+    """
+    Aplica migraciones leyendo la colección por páginas y escribiendo los
+    cambios en lotes multi-ruta desde varios hilos.
+
+    Estructura en Firebase:
+    /migrations/
+        {version}/
+            status: str          # running | done
+            description: str
+            last_key: str        # Última clave con todos sus cambios escritos
+            scanned: int         # Hijos recorridos
+            changed: int         # Hijos con cambios
+            started_at, updated_at, finished_at: str
+
+    El progreso solo avanza hasta el último lote de una secuencia contigua de
+    lotes escritos, así que tras un fallo se reanuda desde last_key sin saltarse
+    nada (como mucho se repiten lotes ya escritos, por eso transform() debe ser
+    idempotente). Los lotes se escriben en paralelo: cada uno debe tocar solo
+    las rutas de sus propios hijos.
+    """
+
+    STATE_PATH = "migrations"
+
+    def __init__(
+        self,
+        page_size: int = 500,
+        batch_size: int = 500,
+        workers: int = 4,
+        dry_run: bool = False,
+        max_diffs: int = 20
+    ):
+        """
+        Args:
+            page_size: Hijos por lectura paginada (y máximo de hijos por lote)
+            batch_size: Rutas por escritura multi-ruta
+            workers: Hilos que escriben lotes en paralelo
+            dry_run: Solo mostrar los cambios, sin escribir nada
+            max_diffs: Cambios de ejemplo que se muestran en dry run
+        """
+        self.page_size = page_size
+        self.batch_size = batch_size
+        self.workers = workers
+        self.dry_run = dry_run
+        self.max_diffs = max_diffs
+
+    @staticmethod
+    def get_state(migration: Migration) -> Dict[str, Any]:
+        """
+        Obtiene el estado guardado de una migración.
+
+        Returns:
+            Dict[str, Any]: Estado de /migrations/{version} (vacío si nunca se ejecutó)
+        """
+        database = get_database()
+        return database.child(MigrationRunner.STATE_PATH).child(migration.version).get() or {}
+
+    @staticmethod
+    def _old_value(collection_key: str, value: Any, rel_path: str) -> Any:
+        """Valor actual de una ruta relativa dentro del hijo leído (None si es otra clave)."""
+        parts = rel_path.split('/')
+        if parts[0] != collection_key:
+            return None
+        for part in parts[1:]:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+
+    @staticmethod
+    def _write(updates: Dict[str, Any]):
+        """Escribe un lote con reintentos y backoff."""
+        def on_retry(attempt, error, delay):
+            print(f"   ↻ Reintento {attempt} en {delay:.1f}s: {error}")
+
+        call_with_retries(lambda: get_database().update(updates), attempts=6, on_retry=on_retry)
+
+    def run(self, migration: Migration, force: bool = False) -> Dict[str, Any]:
+        """
+        Ejecuta (o reanuda) una migración.
+
+        Args:
+            migration: Migración a aplicar
+            force: Volver a ejecutarla desde el principio aunque ya esté hecha
+
+        Returns:
+            Dict[str, Any]: status, scanned y changed de la ejecución
+        """
+        database = get_database()
+        state_ref = database.child(self.STATE_PATH).child(migration.version)
+        state = state_ref.get() or {}
+
+        if state.get('status') == 'done' and not force:
+            print(f"⏭️  {migration.version} ya aplicada el {state.get('finished_at', '?')}")
+            return {"status": "done", "scanned": 0, "changed": 0}
+
+        resume = state.get('status') == 'running' and not force
+        start_after: Optional[str] = state.get('last_key') if resume else None
+        totals = {
+            "scanned": state.get('scanned', 0) if resume else 0,
+            "changed": state.get('changed', 0) if resume else 0,
+        }
+
+        label = "🔍 Dry run de" if self.dry_run else "🔄 Aplicando"
+        print(f"{label} {migration.version}: {migration.description}")
+        if start_after is not None:
+            print(f"   ⏯️  Reanudando después de la clave {start_after}")
+
+        if not self.dry_run:
+            now = datetime.utcnow().isoformat()
+            state_ref.update({
+                "status": "running",
+                "description": migration.description,
+                "started_at": state.get('started_at') if resume else now,
+                "updated_at": now,
+                "finished_at": None,
+                **({} if resume else {"last_key": None, **totals}),
+            })
+
+        # Lotes por número de secuencia; el progreso avanza por la parte contigua escrita
+        pending: Dict[int, Dict[str, Any]] = {}
+        watermark = 0
+        in_flight = {}
+        diffs: List[str] = []
+        scanned = changed = 0
+
+        def advance():
+            """Guarda el progreso hasta el último lote contiguo ya escrito."""
+            nonlocal watermark
+            last = None
+            while watermark in pending and pending[watermark]["written"]:
+                batch = pending.pop(watermark)
+                totals["scanned"] += batch["scanned"]
+                totals["changed"] += batch["changed"]
+                last = batch
+                watermark += 1
+            if last is not None and not self.dry_run:
+                state_ref.update({
+                    "last_key": last["last_key"],
+                    **totals,
+                    "updated_at": datetime.utcnow().isoformat(),
+                })
+
+        def collect(done):
+            for future in done:
+                sequence = in_flight.pop(future)
+                future.result()
+                pending[sequence]["written"] = True
+            advance()
+
+        next_sequence = 0
+        batch: Dict[str, Any] = {}
+        batch_info = {"scanned": 0, "changed": 0, "last_key": None}
+
+        def flush(pool):
+            nonlocal next_sequence, batch, batch_info
+            sequence = next_sequence
+            next_sequence += 1
+            # Los lotes sin cambios solo hacen avanzar el progreso
+            pending[sequence] = {**batch_info, "written": self.dry_run or not batch}
+            if batch and not self.dry_run:
+                in_flight[pool.submit(self._write, batch)] = sequence
+                if len(in_flight) >= self.workers * 2:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+            else:
+                advance()
+            batch = {}
+            batch_info = {"scanned": 0, "changed": 0, "last_key": None}
+
+        collection_ref = database.child(migration.collection)
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for key, value in iter_children(collection_ref, self.page_size, start_after):
+                    changes = migration.transform(key, value)
+                    scanned += 1
+                    batch_info["scanned"] += 1
+                    batch_info["last_key"] = key
+
+                    if changes:
+                        changed += 1
+                        batch_info["changed"] += 1
+                        for rel_path, new_value in changes.items():
+                            path = f"{migration.collection}/{rel_path}"
+                            batch[path] = new_value
+                            if self.dry_run and len(diffs) < self.max_diffs:
+                                old_value = self._old_value(key, value, rel_path)
+                                diffs.append(f"   {path}: {self._short(old_value)} → {self._short(new_value)}")
+
+                    if len(batch) >= self.batch_size or batch_info["scanned"] >= self.page_size:
+                        flush(pool)
+
+                if batch_info["scanned"]:
+                    flush(pool)
+
+                done, _ = wait(in_flight)
+                collect(done)
+        except BaseException:
+            # Guardar lo ya escrito para poder reanudar
+            for future in [future for future in in_flight if future.done() and not future.exception()]:
+                pending[in_flight.pop(future)]["written"] = True
+            advance()
+            if not self.dry_run:
+                print(f"\n💾 Progreso de {migration.version} guardado; vuelve a ejecutarla para reanudar")
+            raise
+
+        if self.dry_run:
+            for line in diffs:
+                print(line)
+            if changed > len(diffs):
+                print(f"   ... (se muestran {len(diffs)} cambios)")
+            print(f"   📊 {scanned} recorridos, {changed} con cambios (no se ha modificado nada)")
+            return {"status": "dry_run", "scanned": scanned, "changed": changed}
+
+        state_ref.update({
+            "status": "done",
+            "finished_at": datetime.utcnow().isoformat(),
+            "updated_at": datetime.utcnow().isoformat(),
+        })
+        print(f"   ✅ {scanned} recorridos, {changed} con cambios")
+        return {"status": "done", "scanned": scanned, "changed": changed}
+
+    @staticmethod
+    def _short(value: Any, limit: int = 60) -> str:
+        """Representación corta de un valor para el diff del dry run."""
+        text = repr(value)
+        return text if len(text) <= limit else text[:limit - 3] + "..."
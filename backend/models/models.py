@@ -405,7 +405,7 @@ class ShippingAddress(BaseModel):
 
 class Order(BaseModel):
     """Modelo completo de pedido."""
-    order_id: str = Field(..., description="ID único del pedido (ej: ORD-20241205-001)")
+    order_id: str = Field(..., description="ID único del pedido (ej: ORD-20241205-01JEB5X420JWF48WFCH6YX05G1)")
     user_id: str = Field(..., description="ID del usuario en Firebase Auth")
     user_email: EmailStr = Field(..., description="Email del usuario como identificador del pedido")
     items: List[OrderItem] = Field(..., min_items=1, description="Items del pedido")
@@ -422,7 +422,7 @@ class Order(BaseModel):
     class Config:
         json_schema_extra = {
             "example": {
-                "order_id": "ORD-20241205-001",
+                "order_id": "ORD-20241205-01JEB5X420JWF48WFCH6YX05G1",
                 "user_id": "fZlBToT35rPVcuUg3SO1oTuXwM22",
                 "user_email": "hola@gmail.com",
                 "items": [
@@ -0,0 +1,367 @@
+"""
+Servicio de exportación analítica (Parquet) de pedidos, líneas de pedido y usuarios.
+Recorre Firebase por páginas y escribe ficheros Parquet particionados por mes,
+de forma incremental desde la última exportación, para poder analizar millones
+de pedidos en local (pyarrow, pandas, DuckDB, Polars) sin volver a consultar RTDB.
+"""
+
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+from backend.config.firebase_config import get_database
+from backend.core.logger import get_logger
+from backend.services.regions_service import RegionsService
+from backend.utils.rtdb import iter_children
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+
+def _timestamp():
+    """Tipo de columna para fechas (UTC, microsegundos)."""
+    return pa.timestamp('us')
+
+
+class _PartitionWriter:
+    """
+    Acumula filas por mes y las escribe como ficheros Parquet en
+    {dataset}/month=YYYY-MM/part-{run_id}-{n}.parquet (particionado Hive).
+    """
+
+    def __init__(self, dataset_dir: Path, schema, run_id: str, chunk_rows: int):
+        self.dataset_dir = dataset_dir
+        self.schema = schema
+        self.run_id = run_id
+        self.chunk_rows = chunk_rows
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._buffered = 0
+        self._parts = 0
+        self.rows = 0
+        self.files = 0
+
+    def add(self, month: str, row: Dict[str, Any]):
+        """Añade una fila a la partición de su mes."""
+        self._buffers.setdefault(month, []).append(row)
+        self._buffered += 1
+        if self._buffered >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        """Escribe las filas acumuladas (un fichero por mes con datos)."""
+        for month, rows in self._buffers.items():
+            partition = self.dataset_dir / f"month={month}"
+            partition.mkdir(parents=True, exist_ok=True)
+
+            table = pa.Table.from_pylist(rows, schema=self.schema)
+            pq.write_table(table, partition / f"part-{self.run_id}-{self._parts:05d}.parquet", compression='zstd')
+
+            self._parts += 1
+            self.files += 1
+            self.rows += len(rows)
+
+        self._buffers = {}
+        self._buffered = 0
+
+
+class AnalyticsExportService:
+    """
+    Servicio para exportar instantáneas columnares de /orders y /users.
+
+    Estructura de la exportación:
+    {output_dir}/
+        orders/month=YYYY-MM/part-*.parquet         # Un registro por pedido
+        order_items/month=YYYY-MM/part-*.parquet    # Un registro por línea de pedido
+        users/month=YYYY-MM/part-*.parquet          # Por mes de registro
+        _state.json                                 # Última clave exportada por colección
+
+    Las claves de /orders (ORD-YYYYMMDD-ULID) y de /users (secuenciales) crecen
+    con el tiempo, así que cada exportación continúa desde la última clave
+    exportada y solo añade ficheros nuevos. Los campos mutables (estado del
+    pedido, usuario activo...) reflejan el momento en que se exportó cada fila;
+    full=True regenera todo desde cero.
+
+    No se exportan datos sensibles de los usuarios (contraseña, teléfono, foto)
+    ni direcciones completas (solo código postal, ciudad y región).
+    """
+
+    STATE_FILE = "_state.json"
+    CHUNK_ROWS = 50_000
+
+    @staticmethod
+    def _schemas() -> Dict[str, Any]:
+        """Esquemas fijos de cada dataset (iguales en todos los ficheros)."""
+        return {
+            "orders": pa.schema([
+                ("order_id", pa.string()),
+                ("user_id", pa.string()),
+                ("user_email", pa.string()),
+                ("status", pa.string()),
+                ("payment_method", pa.string()),
+                ("subtotal", pa.float64()),
+                ("shipping_cost", pa.float64()),
+                ("tax", pa.float64()),
+                ("total", pa.float64()),
+                ("items_count", pa.int32()),
+                ("units", pa.int32()),
+                ("city", pa.string()),
+                ("postal_code", pa.string()),
+                ("country", pa.string()),
+                ("region", pa.string()),
+                ("created_at", _timestamp()),
+                ("updated_at", _timestamp()),
+            ]),
+            "order_items": pa.schema([
+                ("order_id", pa.string()),
+                ("line", pa.int32()),
+                ("created_at", _timestamp()),
+                ("status", pa.string()),
+                ("product_id", pa.string()),
+                ("product_name", pa.string()),
+                ("team", pa.string()),
+                ("size", pa.string()),
+                ("quantity", pa.int32()),
+                ("unit_price", pa.float64()),
+                ("personalization_price", pa.float64()),
+                ("personalized", pa.bool_()),
+                ("subtotal", pa.float64()),
+            ]),
+            "users": pa.schema([
+                ("user_id", pa.string()),
+                ("fecha_registro", _timestamp()),
+                ("activo", pa.bool_()),
+                ("es_admin", pa.bool_()),
+                ("puntos_fidelizacion", pa.int64()),
+                ("favoritos", pa.int32()),
+            ]),
+        }
+
+    @staticmethod
+    def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+        """Convierte una fecha ISO en datetime (None si falta o no es válida)."""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _month_of(value: Optional[datetime]) -> str:
+        """Partición (YYYY-MM) de una fecha; 'unknown' si no la hay."""
+        return value.strftime("%Y-%m") if value else "unknown"
+
+    # ------------------------------------------------------------------
+    # Conversión de registros a filas
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _order_rows(order_id: str, order_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convierte un pedido de Firebase en su fila y las filas de sus líneas.
+
+        Returns:
+            Dict[str, Any]: {"order": fila, "items": [filas], "month": YYYY-MM}
+        """
+        created_at = AnalyticsExportService._parse_datetime(order_data.get('created_at'))
+        address = order_data.get('shipping_address') or {}
+        items = [item for item in (order_data.get('items') or []) if item]
+        status = order_data.get('status')
+
+        order_row = {
+            "order_id": order_data.get('order_id', order_id),
+            "user_id": str(order_data.get('user_id', '')),
+            "user_email": order_data.get('user_email'),
+            "status": status,
+            "payment_method": order_data.get('payment_method'),
+            "subtotal": order_data.get('subtotal'),
+            "shipping_cost": order_data.get('shipping_cost'),
+            "tax": order_data.get('tax'),
+            "total": order_data.get('total'),
+            "items_count": len(items),
+            "units": sum(item.get('quantity', 0) for item in items),
+            "city": address.get('city'),
+            "postal_code": str(address.get('postal_code') or '') or None,
+            "country": address.get('country'),
+            "region": RegionsService.region_of(order_data).slug,
+            "created_at": created_at,
+            "updated_at": AnalyticsExportService._parse_datetime(order_data.get('updated_at')),
+        }
+
+        item_rows = [
+            {
+                "order_id": order_row["order_id"],
+                "line": line,
+                "created_at": created_at,
+                "status": status,
+                "product_id": str(item.get('product_id', '')),
+                "product_name": item.get('product_name'),
+                "team": item.get('team'),
+                "size": item.get('size'),
+                "quantity": item.get('quantity'),
+                "unit_price": item.get('unit_price'),
+                "personalization_price": item.get('personalization_price', 0.0),
+                "personalized": bool(item.get('personalization')),
+                "subtotal": item.get('subtotal'),
+            }
+            for line, item in enumerate(items)
+        ]
+
+        return {"order": order_row, "items": item_rows, "month": AnalyticsExportService._month_of(created_at)}
+
+    @staticmethod
+    def _user_row(user_id: str, user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convierte un usuario de Firebase en su fila (sin datos sensibles)."""
+        return {
+            "user_id": str(user_data.get('id', user_id)),
+            "fecha_registro": AnalyticsExportService._parse_datetime(user_data.get('fecha_registro')),
+            "activo": user_data.get('activo', True),
+            "es_admin": user_data.get('es_admin', False),
+            "puntos_fidelizacion": user_data.get('puntos_fidelizacion', 0),
+            "favoritos": len(user_data.get('favoritos') or []),
+        }
+
+    # ------------------------------------------------------------------
+    # Estado de la exportación
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _load_state(output_dir: Path) -> Dict[str, Any]:
+        """Lee el estado de la última exportación (vacío si no existe)."""
+        state_file = output_dir / AnalyticsExportService.STATE_FILE
+        if not state_file.exists():
+            return {}
+        with open(state_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _save_state(output_dir: Path, state: Dict[str, Any]):
+        """Guarda el estado de forma atómica (fichero temporal + rename)."""
+        output_dir.mkdir(parents=True, exist_ok=True)
+        state_file = output_dir / AnalyticsExportService.STATE_FILE
+        tmp_file = state_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, state_file)
+
+    @staticmethod
+    def _discard_run(output_dir: Path, run_id: str) -> int:
+        """
+        Elimina los ficheros de una exportación que no terminó, para que
+        reintentarla no duplique filas.
+
+        Returns:
+            int: Número de ficheros eliminados
+        """
+        removed = 0
+        for part in output_dir.glob(f"*/month=*/part-{run_id}-*.parquet"):
+            part.unlink()
+            removed += 1
+        return removed
+
+    # ------------------------------------------------------------------
+    # Exportación
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def export(
+        output_dir,
+        full: bool = False,
+        page_size: int = 1000,
+        chunk_rows: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Exporta los pedidos, líneas de pedido y usuarios nuevos desde la última exportación.
+
+        Args:
+            output_dir: Directorio raíz de la exportación
+            full: Borrar la exportación existente y exportar todo de nuevo
+            page_size: Registros por página de lectura de Firebase
+            chunk_rows: Filas acumuladas en memoria antes de escribir ficheros
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Por dataset, filas y ficheros escritos
+                y la última clave exportada
+
+        Raises:
+            RuntimeError: Si pyarrow no está instalado
+        """
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("pyarrow is required for analytics exports (pip install pyarrow)")
+
+        output_dir = Path(output_dir)
+        chunk_rows = chunk_rows or AnalyticsExportService.CHUNK_ROWS
+        schemas = AnalyticsExportService._schemas()
+
+        if full and output_dir.exists():
+            for dataset in schemas:
+                shutil.rmtree(output_dir / dataset, ignore_errors=True)
+            (output_dir / AnalyticsExportService.STATE_FILE).unlink(missing_ok=True)
+
+        state = AnalyticsExportService._load_state(output_dir)
+
+        # Una exportación anterior interrumpida: descartar sus ficheros
+        if state.get('in_progress'):
+            removed = AnalyticsExportService._discard_run(output_dir, state['in_progress'])
+            logger.warning("Descartados ficheros de una exportación incompleta",
+                           extra={"run_id": state['in_progress'], "files": removed})
+
+        run_id = datetime.utcnow().strftime("%Y%m%dT%H%M%S") + "-" + uuid.uuid4().hex[:6]
+        state['in_progress'] = run_id
+        AnalyticsExportService._save_state(output_dir, state)
+
+        writers = {
+            dataset: _PartitionWriter(output_dir / dataset, schema, run_id, chunk_rows)
+            for dataset, schema in schemas.items()
+        }
+        database = get_database()
+
+        # Pedidos y sus líneas
+        last_order_key = state.get('orders', {}).get('last_key')
+        for order_id, order_data in iter_children(database.child('orders'), page_size, last_order_key):
+            last_order_key = order_id
+            if not order_data:
+                continue
+            rows = AnalyticsExportService._order_rows(order_id, order_data)
+            writers["orders"].add(rows["month"], rows["order"])
+            for item_row in rows["items"]:
+                writers["order_items"].add(rows["month"], item_row)
+
+        # Usuarios (particionados por mes de registro)
+        last_user_key = state.get('users', {}).get('last_key')
+        for user_id, user_data in iter_children(database.child('users'), page_size, last_user_key):
+            last_user_key = user_id
+            if not user_data:
+                continue
+            row = AnalyticsExportService._user_row(user_id, user_data)
+            writers["users"].add(AnalyticsExportService._month_of(row["fecha_registro"]), row)
+
+        for writer in writers.values():
+            writer.flush()
+
+        # Solo ahora se avanza el punto de continuación
+        exported_at = datetime.utcnow().isoformat()
+        last_keys = {"orders": last_order_key, "order_items": last_order_key, "users": last_user_key}
+        report = {}
+        for dataset, writer in writers.items():
+            previous = state.get(dataset, {})
+            state[dataset] = {
+                "last_key": last_keys[dataset],
+                "rows": previous.get('rows', 0) + writer.rows,
+                "exported_at": exported_at if writer.rows else previous.get('exported_at'),
+            }
+            report[dataset] = {"rows": writer.rows, "files": writer.files, "last_key": last_keys[dataset]}
+
+        state.pop('in_progress')
+        AnalyticsExportService._save_state(output_dir, state)
+
+        return report
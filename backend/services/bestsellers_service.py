@@ -0,0 +1,302 @@
+"""
+Servicio de productos más vendidos (top-K) con Firebase Realtime Database.
+Alimenta resúmenes Space-Saving con las líneas de cada pedido y los persiste
+periódicamente por buckets de hora y día, de modo que el top de las últimas
+24h / 7d / 30d se obtiene sin recorrer el histórico de pedidos.
+"""
+
+import atexit
+import threading
+import time
+from typing import Dict, Any, List, Tuple
+from datetime import datetime, timedelta
+from firebase_admin import db
+from backend.config.firebase_config import get_database
+from backend.core.logger import get_logger
+from backend.models.models import OrderStatusEnum
+from backend.utils.heavy_hitters import SpaceSaving
+from backend.utils.rtdb import iter_children
+
+logger = get_logger(__name__)
+
+
+class BestsellersService:
+    """
+    Servicio para gestionar el ranking de productos más vendidos.
+
+    Estructura en Firebase:
+    /stats/bestsellers/
+        hour/
+            {YYYY-MM-DDTHH}/
+                units: [{id, count, error, name, team, image}, ...]
+                revenue: [{id, count, error, name, team, image}, ...]
+        day/
+            {YYYY-MM-DD}/
+                units: [...]
+                revenue: [...]
+
+    Cada bucket guarda como máximo CAPACITY productos por métrica. Los pedidos
+    se acumulan en memoria y se vuelcan cada FLUSH_EVERY_ORDERS pedidos o cada
+    FLUSH_INTERVAL_SECONDS (lo que ocurra antes) con una transacción por bucket,
+    así que varios procesos pueden alimentar el mismo bucket sin pisarse.
+    Los pedidos cancelados después de crearse no se descuentan.
+    """
+
+    CAPACITY = 50
+    METRICS = ("units", "revenue")
+
+    FLUSH_EVERY_ORDERS = 20
+    FLUSH_INTERVAL_SECONDS = 60
+
+    # Ventana -> (resolución, número de buckets)
+    WINDOWS = {
+        "24h": ("hour", 24),
+        "7d": ("day", 7),
+        "30d": ("day", 30),
+    }
+
+    # Resolución -> longitud del prefijo ISO que forma la clave del bucket
+    RESOLUTIONS = {
+        "hour": 13,
+        "day": 10,
+    }
+
+    # Estado en memoria pendiente de volcar: (resolución, bucket) -> {métrica: SpaceSaving}
+    _pending: Dict[Tuple[str, str], Dict[str, SpaceSaving]] = {}
+    _pending_orders = 0
+    _last_flush = time.monotonic()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _get_bestsellers_ref() -> db.Reference:
+        """
+        Obtiene la referencia al nodo de top ventas en Firebase.
+
+        Returns:
+            db.Reference: Referencia a /stats/bestsellers
+        """
+        database = get_database()
+        return database.child('stats').child('bestsellers')
+
+    @staticmethod
+    def _new_bucket() -> Dict[str, SpaceSaving]:
+        """Crea los resúmenes vacíos de un bucket."""
+        return {metric: SpaceSaving(BestsellersService.CAPACITY) for metric in BestsellersService.METRICS}
+
+    @staticmethod
+    def _add_order(buckets: Dict[Tuple[str, str], Dict[str, SpaceSaving]], order_data: Dict[str, Any]):
+        """
+        Añade las líneas de un pedido a los resúmenes de sus buckets.
+
+        Args:
+            buckets: Resúmenes por (resolución, bucket) a actualizar
+            order_data: Datos del pedido (created_at e items)
+        """
+        created_at = order_data.get('created_at') or datetime.utcnow().isoformat()
+
+        for resolution, length in BestsellersService.RESOLUTIONS.items():
+            bucket = buckets.setdefault((resolution, created_at[:length]), BestsellersService._new_bucket())
+
+            for item in order_data.get('items', []):
+                if not item:
+                    continue
+                product_id = str(item.get('product_id'))
+                label = {
+                    "name": item.get('product_name', ''),
+                    "team": item.get('team', ''),
+                    "image": item.get('product_image', '')
+                }
+                bucket["units"].add(product_id, item.get('quantity', 0), label)
+                bucket["revenue"].add(product_id, item.get('subtotal', 0.0), label)
+
+    # ------------------------------------------------------------------
+    # Alimentación y volcado
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def record_order(order_data: Dict[str, Any]):
+        """
+        Registra las líneas de un pedido nuevo y vuelca si toca.
+
+        Args:
+            order_data: Datos del pedido tal como se guardan en /orders
+        """
+        if order_data.get('status') == OrderStatusEnum.CANCELLED.value:
+            return
+
+        with BestsellersService._lock:
+            BestsellersService._add_order(BestsellersService._pending, order_data)
+            BestsellersService._pending_orders += 1
+
+            due = (
+                BestsellersService._pending_orders >= BestsellersService.FLUSH_EVERY_ORDERS
+                or time.monotonic() - BestsellersService._last_flush >= BestsellersService.FLUSH_INTERVAL_SECONDS
+            )
+
+        if due:
+            try:
+                BestsellersService.flush()
+            except Exception as e:
+                # El pedido ya está guardado: lo no volcado se reintenta después
+                logger.warning("Error al volcar el top de ventas", extra={"error": str(e)})
+
+    @staticmethod
+    def flush() -> int:
+        """
+        Vuelca a Firebase los resúmenes pendientes (una transacción por bucket).
+
+        Returns:
+            int: Número de buckets volcados
+        """
+        with BestsellersService._lock:
+            pending = BestsellersService._pending
+            BestsellersService._pending = {}
+            BestsellersService._pending_orders = 0
+            BestsellersService._last_flush = time.monotonic()
+
+        if not pending:
+            return 0
+
+        ref = BestsellersService._get_bestsellers_ref()
+        flushed = 0
+
+        try:
+            for (resolution, bucket_key), summaries in list(pending.items()):
+                def merge(current, summaries=summaries):
+                    current = current or {}
+                    return {
+                        metric: SpaceSaving.from_list(current.get(metric), BestsellersService.CAPACITY)
+                        .merge(summaries[metric])
+                        .to_list()
+                        for metric in BestsellersService.METRICS
+                    }
+
+                ref.child(resolution).child(bucket_key).transaction(merge)
+                del pending[(resolution, bucket_key)]
+                flushed += 1
+        except Exception:
+            # Devolver lo no volcado al estado pendiente para el próximo intento
+            with BestsellersService._lock:
+                for key, summaries in pending.items():
+                    current = BestsellersService._pending.setdefault(key, BestsellersService._new_bucket())
+                    for metric in BestsellersService.METRICS:
+                        current[metric].merge(summaries[metric])
+            raise
+
+        return flushed
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def get_top(window: str = "30d", by: str = "units", limit: int = 3) -> List[Dict[str, Any]]:
+        """
+        Obtiene los productos más vendidos en una ventana deslizante.
+
+        Lee solo los buckets de la ventana (como mucho CAPACITY entradas cada
+        uno) y los combina, incluyendo lo pendiente de volcar en este proceso.
+
+        Args:
+            window: "24h", "7d" o "30d"
+            by: Métrica de ordenación: "units" o "revenue"
+            limit: Número de productos
+
+        Returns:
+            List[Dict[str, Any]]: Productos (id, name, team, image, units, revenue),
+                ordenados por la métrica indicada. revenue/units es None si el
+                producto no figura en el resumen de la otra métrica.
+
+        Raises:
+            ValueError: Si la ventana o la métrica no existen
+        """
+        if window not in BestsellersService.WINDOWS:
+            raise ValueError(f"Invalid window: {window}")
+        if by not in BestsellersService.METRICS:
+            raise ValueError(f"Invalid metric: {by}")
+
+        resolution, count = BestsellersService.WINDOWS[window]
+        length = BestsellersService.RESOLUTIONS[resolution]
+        step = timedelta(hours=1) if resolution == "hour" else timedelta(days=1)
+        start_key = (datetime.utcnow() - step * (count - 1)).isoformat()[:length]
+
+        data = (
+            BestsellersService._get_bestsellers_ref()
+            .child(resolution)
+            .order_by_key()
+            .start_at(start_key)
+            .get()
+        ) or {}
+
+        combined = BestsellersService._new_bucket()
+        for bucket in data.values():
+            if not bucket:
+                continue
+            for metric in BestsellersService.METRICS:
+                combined[metric].merge(SpaceSaving.from_list(bucket.get(metric), BestsellersService.CAPACITY))
+
+        with BestsellersService._lock:
+            for (pending_resolution, bucket_key), summaries in BestsellersService._pending.items():
+                if pending_resolution == resolution and bucket_key >= start_key:
+                    for metric in BestsellersService.METRICS:
+                        combined[metric].merge(summaries[metric])
+
+        other = "revenue" if by == "units" else "units"
+        top = []
+        for entry in combined[by].top(limit):
+            other_value = combined[other].get(entry["id"])
+            top.append({
+                "id": entry["id"],
+                "name": entry.get("name", ""),
+                "team": entry.get("team", ""),
+                "image": entry.get("image", ""),
+                by: entry["count"],
+                other: other_value,
+            })
+
+        return top
+
+    # ------------------------------------------------------------------
+    # Reconstrucción (backfill)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def backfill(page_size: int = 500) -> int:
+        """
+        Reconstruye los resúmenes reproduciendo todos los pedidos existentes.
+
+        Args:
+            page_size: Número de pedidos por página de lectura
+
+        Returns:
+            int: Número de buckets generados
+        """
+        buckets: Dict[Tuple[str, str], Dict[str, SpaceSaving]] = {}
+
+        for _, order_data in iter_children(get_database().child('orders'), page_size):
+            if not order_data or order_data.get('status') == OrderStatusEnum.CANCELLED.value:
+                continue
+            BestsellersService._add_order(buckets, order_data)
+
+        tree: Dict[str, Dict[str, Any]] = {}
+        for (resolution, bucket_key), summaries in buckets.items():
+            tree.setdefault(resolution, {})[bucket_key] = {
+                metric: summaries[metric].to_list() for metric in BestsellersService.METRICS
+            }
+
+        ref = BestsellersService._get_bestsellers_ref()
+        if tree:
+            ref.set(tree)
+        else:
+            ref.delete()
+
+        return len(buckets)
+
+
+# Volcar lo pendiente al terminar el proceso
+@atexit.register
+def _flush_on_exit():
+    try:
+        BestsellersService.flush()
+    except Exception as e:
+        logger.warning("No se pudo volcar el top de ventas pendiente", extra={"error": str(e)})
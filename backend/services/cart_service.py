@@ -3,13 +3,17 @@ Servicio de carrito de compras con Firebase Realtime Database.
 Gestiona las operaciones CRUD del carrito de cada usuario.
 """
 
-from typing import Optional, List, Dict
-from datetime import datetime
+from typing import Optional, List, Dict, Any
+from datetime import datetime, timedelta
 from firebase_admin import db
 from backend.config.firebase_config import get_database
+from backend.core.tracing import trace_methods
+from backend.utils.retry import call_with_retries
+from backend.utils.rtdb import iter_children_by_value
 from backend.models.models import Cart, CartItem, CartItemCreate, CartItemUpdate, Personalization
 
 
+@trace_methods
 class CartService:
     """
     Servicio para gestionar el carrito de compras en Firebase.
@@ -35,8 +39,20 @@ class CartService:
         total_items: int
         subtotal: float
         updated_at: str
+
+    /carts_archive/{user_id}/         # Carritos abandonados archivados por el barrido
+        ... (mismos campos)
+        archived_at: str
+
+    Los carritos sin actividad durante más de ABANDONED_AFTER_DAYS se eliminan
+    (o archivan) con sweep_abandoned(). La consulta por updated_at necesita
+    `".indexOn": ["updated_at"]` en /carts en las reglas de la base de datos.
     """
 
+    ARCHIVE_PATH = "carts_archive"
+
+    ABANDONED_AFTER_DAYS = 30
+
     @staticmethod
     def _get_cart_ref(user_id: str) -> db.Reference:
         """
@@ -194,7 +210,7 @@ class CartService:
             'size': item.size,
             'subtotal': subtotal,
             'personalization_price': personalization_price,
-            'personalization': item.personalization.dict() if item.personalization else None
+            'personalization': item.personalization.model_dump() if item.personalization else None
         }
 
         # Guardar item en Firebase usando ID secuencial
@@ -266,7 +282,7 @@ class CartService:
         if updates.size is not None:
             update_dict['size'] = updates.size
         if updates.personalization is not None:
-            update_dict['personalization'] = updates.personalization.dict() if updates.personalization else None
+            update_dict['personalization'] = updates.personalization.model_dump() if updates.personalization else None
             # Recalcular precio de personalización
             if updates.personalization and (updates.personalization.nombre or updates.personalization.numero is not None):
                 update_dict['personalization_price'] = product_data.get('personalization_price', 10.0)
@@ -417,3 +433,66 @@ class CartService:
             return 0
 
         return cart_data.get('total_items', 0)
+
+    @staticmethod
+    def sweep_abandoned(
+        max_idle_days: int = ABANDONED_AFTER_DAYS,
+        archive: bool = False,
+        page_size: int = 500,
+        batch_size: int = 200,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Elimina (o archiva) los carritos sin actividad desde hace más de max_idle_days.
+
+        Solo se leen los carritos con updated_at anterior al corte, por páginas
+        ordenadas por updated_at, y se borran en escrituras multi-ruta de
+        batch_size carritos. Los carritos activos no se leen ni se tocan; los
+        que no tienen updated_at tampoco.
+
+        El borrado no es condicional: un carrito que el usuario vuelva a usar
+        entre la lectura de su página y la escritura de su lote (como mucho
+        batch_size carritos después) se borra igualmente. Es una ventana
+        corta, y solo para carritos sin cambios en max_idle_days días;
+        comprobarlo carrito a carrito costaría una lectura (o una
+        transacción) por carrito y anularía las escrituras por lotes.
+
+        Args:
+            max_idle_days: Días sin cambios a partir de los que un carrito se considera abandonado
+            archive: Copiar los carritos a /carts_archive antes de borrarlos (en la misma escritura)
+            page_size: Carritos por lectura paginada
+            batch_size: Carritos por escritura multi-ruta
+            dry_run: Solo contar, sin escribir nada
+
+        Returns:
+            Dict[str, Any]: cutoff, carts (carritos barridos) e items (líneas que contenían)
+        """
+        database = get_database()
+        cutoff = (datetime.utcnow() - timedelta(days=max_idle_days)).isoformat()
+        now = datetime.utcnow().isoformat()
+
+        result = {"cutoff": cutoff, "carts": 0, "items": 0}
+        updates: Dict[str, Any] = {}
+
+        def flush():
+            if updates and not dry_run:
+                batch = dict(updates)
+                call_with_retries(lambda: database.update(batch))
+            updates.clear()
+
+        # start_at("") deja fuera los carritos sin updated_at (null va antes que los strings)
+        abandoned = iter_children_by_value(database.child('carts'), 'updated_at', "", cutoff, page_size)
+        for user_id, cart_data in abandoned:
+            if archive:
+                updates[f"{CartService.ARCHIVE_PATH}/{user_id}"] = {**cart_data, 'archived_at': now}
+            updates[f"carts/{user_id}"] = None
+
+            items = cart_data.get('items') or {}
+            result["carts"] += 1
+            result["items"] += len([item for item in (items.values() if isinstance(items, dict) else items) if item])
+
+            if len(updates) >= batch_size * (2 if archive else 1):
+                flush()
+
+        flush()
+        return result
@@ -0,0 +1,311 @@
+"""
+Servicio de métricas materializadas con Firebase Realtime Database.
+Mantiene contadores agregados (usuarios, pedidos, ingresos) que se actualizan
+de forma incremental en cada escritura, para que el dashboard de administración
+no tenga que recorrer /users ni /orders.
+"""
+
+from typing import Dict, Any, Optional
+from datetime import datetime, timedelta
+from firebase_admin import db
+from backend.config.firebase_config import get_database
+from backend.models.models import OrderStatusEnum
+from backend.utils.rtdb import increment, iter_children
+
+
+class MetricsService:
+    """
+    Servicio para gestionar las métricas agregadas del negocio.
+
+    Estructura en Firebase:
+    /stats/
+        summary/
+            total_users: int
+            active_users: int
+            total_orders: int
+            total_revenue: float      # Excluye pedidos cancelados
+            orders_by_status/
+                {status}: int
+            rebuilt_at: str           # Última reconstrucción completa
+        users_by_day/
+            {YYYY-MM-DD}: int         # Altas de usuarios por día (UTC)
+
+    Los métodos *_updates() no escriben nada: devuelven las rutas a incrementar
+    para que el servicio que hace la escritura principal las incluya en la misma
+    actualización multi-ruta (una sola petición y atómica con el dato).
+    """
+
+    SUMMARY_PATH = "stats/summary"
+    USERS_BY_DAY_PATH = "stats/users_by_day"
+
+    @staticmethod
+    def _get_stats_ref() -> db.Reference:
+        """
+        Obtiene la referencia al nodo de estadísticas en Firebase.
+
+        Returns:
+            db.Reference: Referencia a /stats
+        """
+        database = get_database()
+        return database.child('stats')
+
+    @staticmethod
+    def _day_key(timestamp: Optional[str]) -> str:
+        """
+        Obtiene la clave de día (YYYY-MM-DD) de un timestamp ISO.
+
+        Args:
+            timestamp: Fecha en formato ISO (si falta, se usa la fecha actual)
+
+        Returns:
+            str: Clave del día
+        """
+        if timestamp:
+            return timestamp[:10]
+        return datetime.utcnow().strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _counts_revenue(status: str) -> bool:
+        """Indica si un pedido en ese estado suma a los ingresos."""
+        return status != OrderStatusEnum.CANCELLED.value
+
+    # ------------------------------------------------------------------
+    # Actualizaciones incrementales (se combinan con la escritura principal)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def order_created_updates(order_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Incrementos a aplicar al crear un pedido.
+
+        Args:
+            order_data: Datos del pedido tal como se guardan en /orders
+
+        Returns:
+            Dict[str, Any]: Rutas (desde la raíz) e incrementos
+        """
+        summary = MetricsService.SUMMARY_PATH
+        status = order_data.get('status', OrderStatusEnum.PENDING.value)
+
+        updates = {
+            f"{summary}/total_orders": increment(1),
+            f"{summary}/orders_by_status/{status}": increment(1),
+        }
+        if MetricsService._counts_revenue(status):
+            updates[f"{summary}/total_revenue"] = increment(order_data.get('total', 0.0))
+
+        return updates
+
+    @staticmethod
+    def order_status_changed_updates(
+        order_data: Dict[str, Any],
+        new_status: str
+    ) -> Dict[str, Any]:
+        """
+        Incrementos a aplicar al cambiar el estado de un pedido.
+
+        Args:
+            order_data: Datos actuales del pedido (con el estado anterior)
+            new_status: Nuevo estado del pedido
+
+        Returns:
+            Dict[str, Any]: Rutas (desde la raíz) e incrementos
+        """
+        summary = MetricsService.SUMMARY_PATH
+        old_status = order_data.get('status', OrderStatusEnum.PENDING.value)
+
+        if old_status == new_status:
+            return {}
+
+        updates = {
+            f"{summary}/orders_by_status/{old_status}": increment(-1),
+            f"{summary}/orders_by_status/{new_status}": increment(1),
+        }
+
+        # Cancelar (o reactivar) un pedido resta (o suma) sus ingresos
+        was_counted = MetricsService._counts_revenue(old_status)
+        is_counted = MetricsService._counts_revenue(new_status)
+        if was_counted != is_counted:
+            total = order_data.get('total', 0.0)
+            updates[f"{summary}/total_revenue"] = increment(total if is_counted else -total)
+
+        return updates
+
+    @staticmethod
+    def order_deleted_updates(order_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Incrementos a aplicar al eliminar un pedido.
+
+        Args:
+            order_data: Datos del pedido eliminado
+
+        Returns:
+            Dict[str, Any]: Rutas (desde la raíz) e incrementos
+        """
+        summary = MetricsService.SUMMARY_PATH
+        status = order_data.get('status', OrderStatusEnum.PENDING.value)
+
+        updates = {
+            f"{summary}/total_orders": increment(-1),
+            f"{summary}/orders_by_status/{status}": increment(-1),
+        }
+        if MetricsService._counts_revenue(status):
+            updates[f"{summary}/total_revenue"] = increment(-order_data.get('total', 0.0))
+
+        return updates
+
+    @staticmethod
+    def user_created_updates(user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Incrementos a aplicar al registrar un usuario.
+
+        Args:
+            user_data: Datos del usuario tal como se guardan en /users
+
+        Returns:
+            Dict[str, Any]: Rutas (desde la raíz) e incrementos
+        """
+        summary = MetricsService.SUMMARY_PATH
+        day = MetricsService._day_key(user_data.get('fecha_registro'))
+
+        updates = {
+            f"{summary}/total_users": increment(1),
+            f"{MetricsService.USERS_BY_DAY_PATH}/{day}": increment(1),
+        }
+        if user_data.get('activo', True):
+            updates[f"{summary}/active_users"] = increment(1)
+
+        return updates
+
+    @staticmethod
+    def user_active_changed_updates(was_active: bool, is_active: bool) -> Dict[str, Any]:
+        """
+        Incrementos a aplicar al activar o desactivar un usuario.
+
+        Args:
+            was_active: Estado anterior del usuario
+            is_active: Nuevo estado del usuario
+
+        Returns:
+            Dict[str, Any]: Rutas (desde la raíz) e incrementos
+        """
+        if was_active == is_active:
+            return {}
+
+        return {
+            f"{MetricsService.SUMMARY_PATH}/active_users": increment(1 if is_active else -1)
+        }
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def get_summary() -> Dict[str, Any]:
+        """
+        Obtiene las métricas agregadas con una sola lectura de /stats/summary.
+
+        Returns:
+            Dict[str, Any]: Métricas del negocio (0 si aún no existen)
+        """
+        summary = MetricsService._get_stats_ref().child('summary').get() or {}
+
+        total_orders = summary.get('total_orders', 0)
+        total_revenue = round(summary.get('total_revenue', 0.0), 2)
+        orders_by_status = summary.get('orders_by_status', {})
+        cancelled = orders_by_status.get(OrderStatusEnum.CANCELLED.value, 0)
+        paid_orders = total_orders - cancelled
+
+        return {
+            "total_users": summary.get('total_users', 0),
+            "active_users": summary.get('active_users', 0),
+            "total_orders": total_orders,
+            "total_revenue": total_revenue,
+            "average_ticket": round(total_revenue / paid_orders, 2) if paid_orders > 0 else 0.0,
+            "orders_by_status": orders_by_status,
+        }
+
+    @staticmethod
+    def get_new_users(days: int = 2) -> Dict[str, int]:
+        """
+        Obtiene las altas de usuarios de los últimos días.
+
+        Args:
+            days: Número de días (incluido hoy)
+
+        Returns:
+            Dict[str, int]: Altas por día (YYYY-MM-DD), con 0 en los días sin altas
+        """
+        users_by_day = MetricsService._get_stats_ref().child('users_by_day')
+        data = users_by_day.order_by_key().limit_to_last(days).get() or {}
+
+        today = datetime.utcnow().date()
+        result = {}
+        for offset in range(days - 1, -1, -1):
+            day = (today - timedelta(days=offset)).isoformat()
+            result[day] = data.get(day, 0)
+
+        return result
+
+    # ------------------------------------------------------------------
+    # Reconstrucción (reparación)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def rebuild(page_size: int = 500) -> Dict[str, Any]:
+        """
+        Recalcula todas las métricas desde cero recorriendo /users y /orders.
+
+        Usa lectura paginada, por lo que la memoria no crece con el tamaño de
+        las colecciones. Pensado para reparar contadores tras incidencias o
+        para inicializarlos sobre datos existentes.
+
+        Args:
+            page_size: Número de elementos por página de lectura
+
+        Returns:
+            Dict[str, Any]: Resumen recalculado
+        """
+        database = get_database()
+
+        total_users = 0
+        active_users = 0
+        users_by_day: Dict[str, int] = {}
+
+        for _, user_data in iter_children(database.child('users'), page_size):
+            if not user_data:
+                continue
+            total_users += 1
+            if user_data.get('activo', True):
+                active_users += 1
+            day = MetricsService._day_key(user_data.get('fecha_registro'))
+            users_by_day[day] = users_by_day.get(day, 0) + 1
+
+        total_orders = 0
+        total_revenue = 0.0
+        orders_by_status: Dict[str, int] = {}
+
+        for _, order_data in iter_children(database.child('orders'), page_size):
+            if not order_data:
+                continue
+            status = order_data.get('status', OrderStatusEnum.PENDING.value)
+            total_orders += 1
+            orders_by_status[status] = orders_by_status.get(status, 0) + 1
+            if MetricsService._counts_revenue(status):
+                total_revenue += order_data.get('total', 0.0)
+
+        summary = {
+            "total_users": total_users,
+            "active_users": active_users,
+            "total_orders": total_orders,
+            "total_revenue": round(total_revenue, 2),
+            "orders_by_status": orders_by_status,
+            "rebuilt_at": datetime.utcnow().isoformat()
+        }
+
+        database.update({
+            MetricsService.SUMMARY_PATH: summary,
+            MetricsService.USERS_BY_DAY_PATH: users_by_day or None
+        })
+
+        return summary
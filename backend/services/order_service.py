@@ -5,22 +5,36 @@ Gestiona la creación, actualización y consulta de pedidos.
 
 from typing import Optional, List
 from datetime import datetime
-import uuid
 from firebase_admin import db
 from backend.config.firebase_config import get_database
+from backend.core.tracing import trace_methods
+from backend.services.bestsellers_service import BestsellersService
+from backend.services.metrics_service import MetricsService
+from backend.services.timeseries_service import TimeSeriesService
+from backend.services.regions_service import RegionsService
+from backend.utils.ids import MonotonicIdGenerator
 from backend.models.models import (
     Order, OrderItem, OrderCreate, OrderUpdate,
     OrderStatusEnum, ShippingAddress, Personalization
 )
 
 
+# Generador de IDs de pedido ordenables por tiempo (compartido por el proceso)
+_order_id_generator = MonotonicIdGenerator("ORD")
+
+
+class _OrderNotFound(Exception):
+    """Aborta la transacción de un pedido que no existe."""
+
+
+@trace_methods
 class OrderService:
     """
     Servicio para gestionar pedidos en Firebase.
 
     Estructura en Firebase:
     /orders/{order_id}/
-        order_id: str (ORD-YYYYMMDD-XXXX)
+        order_id: str (ORD-YYYYMMDD-<ULID>)
         user_id: str
         user_email: str
         items: []
@@ -33,19 +47,24 @@ class OrderService:
         payment_method: str
         created_at: str
         updated_at: str
+
+    Los order_id son ordenables por tiempo: el orden de las claves en /orders
+    coincide con el orden de creación, así que las consultas por rango de
+    fechas y "últimos N" se resuelven con order_by_key() en Firebase.
     """
 
     @staticmethod
-    def _generate_order_id() -> str:
+    def _generate_order_id(now: Optional[datetime] = None) -> str:
         """
-        Genera un ID único para el pedido con formato: ORD-YYYYMMDD-XXXX.
+        Genera un ID único y monótono para el pedido con formato: ORD-YYYYMMDD-<ULID>.
+
+        Args:
+            now: Instante de creación del pedido (opcional)
 
         Returns:
             str: ID del pedido
         """
-        date_str = datetime.utcnow().strftime("%Y%m%d")
-        unique_suffix = uuid.uuid4().hex[:4].upper()
-        return f"ORD-{date_str}-{unique_suffix}"
+        return _order_id_generator.generate(now)
 
     @staticmethod
     def _get_orders_ref() -> db.Reference:
@@ -75,8 +94,12 @@ class OrderService:
         Returns:
             Order: Pedido creado
         """
+        # Timestamp (compartido por el ID y las fechas del pedido)
+        created = datetime.utcnow()
+        now = created.isoformat()
+
         # Generar ID único del pedido
-        order_id = OrderService._generate_order_id()
+        order_id = OrderService._generate_order_id(created)
 
         # Calcular totales
         subtotal = sum(item.subtotal for item in order_data.items)
@@ -90,29 +113,33 @@ class OrderService:
         # Total
         total = round(subtotal + shipping_cost + tax, 2)
 
-        # Timestamp
-        now = datetime.utcnow().isoformat()
-
         # Preparar datos para Firebase
         order_dict = {
             'order_id': order_id,
             'user_id': user_id,
             'user_email': user_email,
-            'items': [item.dict() for item in order_data.items],
+            'items': [item.model_dump() for item in order_data.items],
             'subtotal': subtotal,
             'shipping_cost': shipping_cost,
             'tax': tax,
             'total': total,
             'status': OrderStatusEnum.PENDING.value,
-            'shipping_address': order_data.shipping_address.dict(),
+            'shipping_address': order_data.shipping_address.model_dump(),
             'payment_method': order_data.payment_method,
             'created_at': now,
             'updated_at': now
         }
 
-        # Guardar en Firebase usando order_id como clave
-        orders_ref = OrderService._get_orders_ref()
-        orders_ref.child(order_id).set(order_dict)
+        # Guardar en Firebase usando order_id como clave, junto con las métricas
+        # agregadas y las series temporales en una única escritura multi-ruta
+        updates = {f"orders/{order_id}": order_dict}
+        updates.update(MetricsService.order_created_updates(order_dict))
+        updates.update(TimeSeriesService.order_created_updates(order_dict))
+        updates.update(RegionsService.order_created_updates(order_dict))
+        get_database().update(updates)
+
+        # Alimentar el ranking de más vendidos (se persiste periódicamente)
+        BestsellersService.record_order(order_dict)
 
         # Retornar Order creado
         return Order(
@@ -148,6 +175,19 @@ class OrderService:
         if not order_data:
             return None
 
+        return OrderService._build_order(order_data)
+
+    @staticmethod
+    def _build_order(order_data: dict) -> Order:
+        """
+        Construye un Order a partir de los datos almacenados en Firebase.
+
+        Args:
+            order_data: Datos del pedido tal como están en /orders/{order_id}
+
+        Returns:
+            Order: Pedido hidratado
+        """
         # Convertir items
         items = []
         for item_data in order_data.get('items', []):
@@ -223,6 +263,11 @@ class OrderService:
         """
         Actualiza el estado de un pedido.
 
+        El cambio de estado se hace en una transacción sobre el pedido, así que
+        de dos cambios simultáneos desde el mismo estado solo uno ve ese estado
+        anterior: las métricas agregadas se ajustan con el estado que la
+        transacción ha sustituido de verdad y no se cuentan dos veces.
+
         Args:
             order_id: ID del pedido
             new_status: Nuevo estado del pedido
@@ -230,21 +275,31 @@ class OrderService:
         Returns:
             Optional[Order]: Pedido actualizado o None si no existe
         """
-        orders_ref = OrderService._get_orders_ref()
-        order_ref = orders_ref.child(order_id)
-
-        # Verificar que el pedido existe
-        if not order_ref.get():
+        order_ref = OrderService._get_orders_ref().child(order_id)
+        previous = {}
+
+        def change_status(order_data):
+            if not order_data:
+                raise _OrderNotFound()
+            # La transacción puede reintentarse: vale el pedido del último intento
+            previous.clear()
+            previous.update(order_data)
+            return {**order_data, 'status': new_status.value, 'updated_at': datetime.utcnow().isoformat()}
+
+        try:
+            order_data = order_ref.transaction(change_status)
+        except _OrderNotFound:
             return None
 
-        # Actualizar estado y timestamp
-        order_ref.update({
-            'status': new_status.value,
-            'updated_at': datetime.utcnow().isoformat()
-        })
+        # Métricas agregadas a partir del estado anterior confirmado
+        updates = {}
+        updates.update(MetricsService.order_status_changed_updates(previous, new_status.value))
+        updates.update(TimeSeriesService.order_status_changed_updates(previous, new_status.value))
+        updates.update(RegionsService.order_status_changed_updates(previous, new_status.value))
+        if updates:
+            get_database().update(updates)
 
-        # Retornar pedido actualizado
-        return OrderService.get_order(order_id)
+        return OrderService._build_order(order_data)
 
     @staticmethod
     def get_all_orders(limit: Optional[int] = None) -> List[Order]:
@@ -257,23 +312,92 @@ class OrderService:
         Returns:
             List[Order]: Lista de todos los pedidos
         """
+        if limit:
+            # Las claves están ordenadas por fecha: basta con las últimas N
+            return OrderService.get_latest_orders(limit)
+
         orders_ref = OrderService._get_orders_ref()
         all_orders_data = orders_ref.get()
 
         if not all_orders_data:
             return []
 
-        orders = []
-        for order_id in all_orders_data.keys():
-            order = OrderService.get_order(order_id)
-            if order:
-                orders.append(order)
+        orders = [
+            OrderService._build_order(order_data)
+            for order_data in all_orders_data.values()
+            if order_data
+        ]
 
         # Ordenar por fecha de creación (más recientes primero)
         orders.sort(key=lambda x: x.created_at, reverse=True)
 
+        return orders
+
+    @staticmethod
+    def get_latest_orders(limit: int) -> List[Order]:
+        """
+        Obtiene los N pedidos más recientes usando el orden de las claves.
+
+        Args:
+            limit: Número de pedidos a retornar
+
+        Returns:
+            List[Order]: Pedidos más recientes primero
+        """
+        orders_ref = OrderService._get_orders_ref()
+        orders_data = orders_ref.order_by_key().limit_to_last(limit).get()
+
+        if not orders_data:
+            return []
+
+        orders = [
+            OrderService._build_order(order_data)
+            for order_data in orders_data.values()
+            if order_data
+        ]
+
+        # Firebase devuelve orden ascendente de claves (más antiguos primero)
+        orders.reverse()
+
+        return orders
+
+    @staticmethod
+    def get_orders_between(
+        start: datetime,
+        end: datetime,
+        limit: Optional[int] = None
+    ) -> List[Order]:
+        """
+        Obtiene los pedidos creados entre dos fechas mediante un rango de claves.
+
+        Solo lee de Firebase los pedidos del rango (no descarga /orders completo).
+        Los pedidos con el formato antiguo ORD-YYYYMMDD-XXXX no quedan incluidos.
+
+        Args:
+            start: Fecha inicial en UTC (inclusive)
+            end: Fecha final en UTC (inclusive)
+            limit: Número máximo de pedidos (los más recientes del rango)
+
+        Returns:
+            List[Order]: Pedidos del rango, más recientes primero
+        """
+        start_key, end_key = _order_id_generator.key_range(start, end)
+
+        query = OrderService._get_orders_ref().order_by_key().start_at(start_key).end_at(end_key)
         if limit:
-            orders = orders[:limit]
+            query = query.limit_to_last(limit)
+
+        orders_data = query.get()
+
+        if not orders_data:
+            return []
+
+        orders = [
+            OrderService._build_order(order_data)
+            for order_data in orders_data.values()
+            if order_data
+        ]
+        orders.reverse()
 
         return orders
 
@@ -291,8 +415,14 @@ class OrderService:
         orders_ref = OrderService._get_orders_ref()
         order_ref = orders_ref.child(order_id)
 
-        if not order_ref.get():
+        order_data = order_ref.get()
+        if not order_data:
             return False
 
-        order_ref.delete()
+        # Eliminar pedido y descontarlo de las métricas agregadas
+        updates = {f"orders/{order_id}": None}
+        updates.update(MetricsService.order_deleted_updates(order_data))
+        updates.update(TimeSeriesService.order_deleted_updates(order_data))
+        updates.update(RegionsService.order_deleted_updates(order_data))
+        get_database().update(updates)
         return True
@@ -0,0 +1,212 @@
+"""
+Servicio de agregados por región con Firebase Realtime Database.
+Acumula pedidos e ingresos por comunidad autónoma (según el código postal de
+envío) en cada escritura, para que el mapa del dashboard no recorra /orders.
+"""
+
+from typing import Dict, Any, List
+from firebase_admin import db
+from backend.config.firebase_config import get_database
+from backend.models.models import OrderStatusEnum
+from backend.utils.rtdb import increment, iter_children
+from backend.utils.spain_regions import REGIONS, UNKNOWN_REGION, Region, lookup_region
+
+
+class RegionsService:
+    """
+    Servicio para gestionar los agregados de pedidos por comunidad autónoma.
+
+    Estructura en Firebase:
+    /stats/regions/
+        {slug}/                 # andalucia, madrid, ... u "otros"
+            orders: int
+            revenue: float
+
+    La comunidad se obtiene del código postal de la dirección de envío con la
+    tabla de backend/utils/spain_regions.py. Los pedidos cancelados no cuentan.
+    """
+
+    REGIONS_PATH = "stats/regions"
+
+    SPAIN_NAMES = ("", "españa", "espana", "spain", "es")
+
+    @staticmethod
+    def _get_regions_ref() -> db.Reference:
+        """
+        Obtiene la referencia a los agregados por región en Firebase.
+
+        Returns:
+            db.Reference: Referencia a /stats/regions
+        """
+        database = get_database()
+        return database.child('stats').child('regions')
+
+    @staticmethod
+    def _counts(status: str) -> bool:
+        """Indica si un pedido en ese estado cuenta en los agregados."""
+        return status != OrderStatusEnum.CANCELLED.value
+
+    @staticmethod
+    def region_of(order_data: Dict[str, Any]) -> Region:
+        """
+        Obtiene la comunidad autónoma de destino de un pedido.
+
+        Args:
+            order_data: Datos del pedido (se usa shipping_address)
+
+        Returns:
+            Region: Comunidad o UNKNOWN_REGION (envíos fuera de España o sin CP válido)
+        """
+        address = order_data.get('shipping_address') or {}
+        if str(address.get('country', '')).strip().lower() not in RegionsService.SPAIN_NAMES:
+            return UNKNOWN_REGION
+        return lookup_region(address.get('postal_code'))
+
+    @staticmethod
+    def _order_updates(order_data: Dict[str, Any], sign: int) -> Dict[str, Any]:
+        """
+        Incrementos de un pedido en el agregado de su región.
+
+        Args:
+            order_data: Datos del pedido
+            sign: 1 para sumar el pedido, -1 para restarlo
+
+        Returns:
+            Dict[str, Any]: Rutas (desde la raíz) e incrementos
+        """
+        path = f"{RegionsService.REGIONS_PATH}/{RegionsService.region_of(order_data).slug}"
+        return {
+            f"{path}/orders": increment(sign),
+            f"{path}/revenue": increment(sign * order_data.get('total', 0.0)),
+        }
+
+    # ------------------------------------------------------------------
+    # Actualizaciones incrementales (se combinan con la escritura principal)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def order_created_updates(order_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Incrementos a aplicar al crear un pedido.
+
+        Args:
+            order_data: Datos del pedido tal como se guardan en /orders
+
+        Returns:
+            Dict[str, Any]: Rutas (desde la raíz) e incrementos
+        """
+        if not RegionsService._counts(order_data.get('status', OrderStatusEnum.PENDING.value)):
+            return {}
+        return RegionsService._order_updates(order_data, 1)
+
+    @staticmethod
+    def order_status_changed_updates(
+        order_data: Dict[str, Any],
+        new_status: str
+    ) -> Dict[str, Any]:
+        """
+        Incrementos a aplicar al cambiar el estado de un pedido.
+
+        Args:
+            order_data: Datos actuales del pedido (con el estado anterior)
+            new_status: Nuevo estado del pedido
+
+        Returns:
+            Dict[str, Any]: Rutas (desde la raíz) e incrementos
+        """
+        was_counted = RegionsService._counts(order_data.get('status', OrderStatusEnum.PENDING.value))
+        is_counted = RegionsService._counts(new_status)
+
+        if was_counted == is_counted:
+            return {}
+        return RegionsService._order_updates(order_data, 1 if is_counted else -1)
+
+    @staticmethod
+    def order_deleted_updates(order_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Incrementos a aplicar al eliminar un pedido.
+
+        Args:
+            order_data: Datos del pedido eliminado
+
+        Returns:
+            Dict[str, Any]: Rutas (desde la raíz) e incrementos
+        """
+        if not RegionsService._counts(order_data.get('status', OrderStatusEnum.PENDING.value)):
+            return {}
+        return RegionsService._order_updates(order_data, -1)
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def get_regions(include_unknown: bool = False) -> List[Dict[str, Any]]:
+        """
+        Obtiene los agregados de todas las comunidades con una única lectura.
+
+        Args:
+            include_unknown: Incluir el agregado de pedidos sin región reconocida
+
+        Returns:
+            List[Dict[str, Any]]: Una entrada por comunidad (slug, name, lat, lon,
+                orders, revenue, percentage), ordenadas por pedidos descendente.
+                percentage es el % de pedidos sobre el total listado.
+        """
+        data = RegionsService._get_regions_ref().get() or {}
+
+        regions = list(REGIONS) + ([UNKNOWN_REGION] if include_unknown else [])
+        result = []
+        for region in regions:
+            aggregate = data.get(region.slug) or {}
+            result.append({
+                "slug": region.slug,
+                "name": region.name,
+                "lat": region.lat,
+                "lon": region.lon,
+                "orders": aggregate.get('orders', 0),
+                "revenue": round(aggregate.get('revenue', 0.0), 2),
+            })
+
+        total_orders = sum(region["orders"] for region in result)
+        for region in result:
+            region["percentage"] = region["orders"] / total_orders * 100 if total_orders else 0.0
+
+        result.sort(key=lambda region: region["orders"], reverse=True)
+        return result
+
+    # ------------------------------------------------------------------
+    # Reconstrucción (backfill)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def backfill(page_size: int = 500) -> Dict[str, int]:
+        """
+        Reconstruye los agregados reproduciendo todos los pedidos existentes.
+
+        Args:
+            page_size: Número de pedidos por página de lectura
+
+        Returns:
+            Dict[str, int]: Pedidos contados por región (slug)
+        """
+        aggregates: Dict[str, Dict[str, Any]] = {}
+
+        for _, order_data in iter_children(get_database().child('orders'), page_size):
+            if not order_data:
+                continue
+            if not RegionsService._counts(order_data.get('status', OrderStatusEnum.PENDING.value)):
+                continue
+
+            slug = RegionsService.region_of(order_data).slug
+            aggregate = aggregates.setdefault(slug, {"orders": 0, "revenue": 0.0})
+            aggregate["orders"] += 1
+            aggregate["revenue"] = round(aggregate["revenue"] + order_data.get('total', 0.0), 2)
+
+        regions_ref = RegionsService._get_regions_ref()
+        if aggregates:
+            regions_ref.set(aggregates)
+        else:
+            regions_ref.delete()
+
+        return {slug: aggregate["orders"] for slug, aggregate in aggregates.items()}
@@ -0,0 +1,324 @@
+"""
+Servicio de stock agregado con Firebase Realtime Database.
+Mantiene los totales de stock por categoría, liga y equipo, y la lista de tallas
+con stock bajo, calculados una vez por versión del catálogo y actualizados de
+forma incremental en cada cambio de stock.
+"""
+
+import hashlib
+import json
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+from datetime import datetime
+from firebase_admin import db
+from backend.config.firebase_config import get_database
+from backend.utils.rtdb import as_dict, increment, safe_key
+
+
+class StockService:
+    """
+    Servicio para gestionar el stock de productos y sus agregados.
+
+    Estructura en Firebase:
+    /catalog/
+        version: str                  # Huella del catálogo (la escribe sync_products.py)
+    /stats/stock/
+        catalog_version: str          # Versión del catálogo con la que se calculó
+        total: int                    # Unidades de productos activos
+        active_products: int
+        by_category/
+            {categoria}: int          # futbol, formula1, baloncesto (el deporte)
+        by_league/
+            {liga}: int
+        by_team/
+            {equipo}: int
+        low_stock/
+            {product_id}-{talla}/     # Tallas con stock <= LOW_STOCK_THRESHOLD
+                product_id, name, team, size, stock
+        rebuilt_at: str
+
+    Solo cuentan los productos activos. Los cambios de stock deben hacerse con
+    adjust_stock()/set_stock() para que los agregados se mantengan al día.
+    """
+
+    STOCK_STATS_PATH = "stats/stock"
+    CATALOG_VERSION_PATH = "catalog/version"
+
+    LOW_STOCK_THRESHOLD = 5
+
+    # Campo del producto -> nodo del agregado
+    GROUPS = {
+        "category": "by_category",
+        "league": "by_league",
+        "team": "by_team",
+    }
+
+    @staticmethod
+    def _get_stock_stats_ref() -> db.Reference:
+        """
+        Obtiene la referencia a los agregados de stock en Firebase.
+
+        Returns:
+            db.Reference: Referencia a /stats/stock
+        """
+        database = get_database()
+        return database.child('stats').child('stock')
+
+    @staticmethod
+    def _iter_products(data: Any) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Recorre los productos de /products (dict por ID o lista).
+
+        Args:
+            data: Contenido de /products
+
+        Yields:
+            Tuple[str, Dict]: Pares (product_id, producto)
+        """
+        for product_id, product in as_dict(data).items():
+            if product:
+                yield product_id, product
+
+    @staticmethod
+    def catalog_version(products: Any) -> str:
+        """
+        Calcula la huella de un catálogo de productos.
+
+        Args:
+            products: Productos (dict por ID o lista)
+
+        Returns:
+            str: Hash corto del contenido del catálogo
+        """
+        canonical = json.dumps(dict(StockService._iter_products(products)), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def _low_stock_key(product_id: str, size: str) -> str:
+        """Clave de una talla en low_stock (no numérica, para que Firebase no la convierta en lista)."""
+        return safe_key(f"{product_id}-{size}")
+
+    @staticmethod
+    def _low_stock_entry(product_id: str, product: Dict[str, Any], size: str, units: int) -> Optional[Dict[str, Any]]:
+        """
+        Entrada de stock bajo de una talla (None si el stock es suficiente).
+        """
+        if units > StockService.LOW_STOCK_THRESHOLD:
+            return None
+        return {
+            "product_id": product_id,
+            "name": product.get('name', ''),
+            "team": product.get('team', ''),
+            "size": size,
+            "stock": units,
+        }
+
+    # ------------------------------------------------------------------
+    # Cálculo completo (una vez por versión del catálogo)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def compute(products: Any) -> Dict[str, Any]:
+        """
+        Calcula los agregados de stock de un catálogo en una sola pasada.
+
+        Args:
+            products: Productos (dict por ID o lista)
+
+        Returns:
+            Dict[str, Any]: Agregados con la estructura de /stats/stock
+        """
+        stats = {
+            "total": 0,
+            "active_products": 0,
+            "low_stock": {},
+            **{group: {} for group in StockService.GROUPS.values()},
+        }
+
+        for product_id, product in StockService._iter_products(products):
+            if not product.get('active', True):
+                continue
+
+            stock = product.get('stock') or {}
+            units = sum(stock.values()) if isinstance(stock, dict) else 0
+
+            stats["active_products"] += 1
+            stats["total"] += units
+            for field, group in StockService.GROUPS.items():
+                key = safe_key(product.get(field) or "sin_asignar")
+                stats[group][key] = stats[group].get(key, 0) + units
+
+            if isinstance(stock, dict):
+                for size, size_units in stock.items():
+                    entry = StockService._low_stock_entry(product_id, product, size, size_units)
+                    if entry:
+                        stats["low_stock"][StockService._low_stock_key(product_id, size)] = entry
+
+        return stats
+
+    @staticmethod
+    def rebuild(products: Any = None, version: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Recalcula y guarda los agregados de stock.
+
+        Args:
+            products: Catálogo ya cargado (si es None se lee /products)
+            version: Versión del catálogo (si es None se lee /catalog/version)
+
+        Returns:
+            Dict[str, Any]: Agregados guardados
+        """
+        database = get_database()
+        if products is None:
+            products = database.child('products').get()
+        if version is None:
+            version = database.child('catalog').child('version').get() or StockService.catalog_version(products)
+
+        stats = StockService.compute(products)
+        stats["catalog_version"] = version
+        stats["rebuilt_at"] = datetime.utcnow().isoformat()
+
+        StockService._get_stock_stats_ref().set(stats)
+        return stats
+
+    # ------------------------------------------------------------------
+    # Cambios de stock (incrementales)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _change_stock(product_id, size: str, change: Callable[[int], int]) -> int:
+        """
+        Cambia el stock de una talla en una transacción y actualiza los agregados.
+
+        La comprobación de stock negativo y la escritura de la talla van en la
+        misma transacción sobre /products/{id}/stock/{talla}, así que dos
+        cambios simultáneos no pueden dejarla por debajo de cero. Después, en
+        una sola escritura multi-ruta, los agregados se incrementan con la
+        diferencia confirmada y la entrada de low_stock se escribe (o se borra)
+        según el stock confirmado.
+
+        Los incrementos son exactos aunque haya cambios simultáneos; la entrada
+        de low_stock no: si dos cambios de la misma talla escriben a la vez,
+        queda la del último en escribir, que puede no ser el último en
+        confirmar su transacción. rebuild() la corrige.
+
+        Args:
+            product_id: ID del producto
+            size: Talla
+            change: Función stock actual -> nuevo stock
+
+        Returns:
+            int: Stock resultante de la talla
+
+        Raises:
+            ValueError: Si el producto o la talla no existen o el stock quedaría negativo
+        """
+        product_id = str(product_id)
+        database = get_database()
+        product = database.child('products').child(product_id).get()
+        if not product:
+            raise ValueError(f"Product {product_id} not found")
+
+        previous = {}
+
+        def update_size(current):
+            if current is None:
+                raise ValueError(f"Size {size} not available for product {product_id}")
+            new_units = change(current)
+            if new_units < 0:
+                raise ValueError(f"Insufficient stock for product {product_id} size {size}")
+            # La transacción puede reintentarse: vale el valor del último intento
+            previous["units"] = current
+            return new_units
+
+        size_ref = database.child('products').child(product_id).child('stock').child(size)
+        new_units = size_ref.transaction(update_size)
+        delta = new_units - previous["units"]
+
+        if product.get('active', True):
+            path = StockService.STOCK_STATS_PATH
+            # None borra la entrada si la talla ya no tiene stock bajo
+            updates: Dict[str, Any] = {
+                f"{path}/low_stock/{StockService._low_stock_key(product_id, size)}": (
+                    StockService._low_stock_entry(product_id, product, size, new_units)
+                ),
+            }
+            if delta:
+                updates[f"{path}/total"] = increment(delta)
+                for field, group in StockService.GROUPS.items():
+                    key = safe_key(product.get(field) or "sin_asignar")
+                    updates[f"{path}/{group}/{key}"] = increment(delta)
+            database.update(updates)
+
+        return new_units
+
+    @staticmethod
+    def adjust_stock(product_id, size: str, delta: int) -> int:
+        """
+        Suma (o resta) unidades al stock de una talla y actualiza los agregados.
+
+        Args:
+            product_id: ID del producto
+            size: Talla (S, M, L...)
+            delta: Unidades a sumar (negativo para restar)
+
+        Returns:
+            int: Stock resultante de la talla
+
+        Raises:
+            ValueError: Si el producto o la talla no existen o el stock quedaría negativo
+        """
+        return StockService._change_stock(product_id, size, lambda current: current + delta)
+
+    @staticmethod
+    def set_stock(product_id, size: str, units: int) -> int:
+        """
+        Fija el stock de una talla (ej: tras un recuento de almacén).
+
+        Args:
+            product_id: ID del producto
+            size: Talla
+            units: Nuevo stock
+
+        Returns:
+            int: Stock resultante de la talla
+
+        Raises:
+            ValueError: Si el producto o la talla no existen o units es negativo
+        """
+        return StockService._change_stock(product_id, size, lambda current: units)
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def get_summary() -> Dict[str, Any]:
+        """
+        Obtiene los agregados de stock.
+
+        Lee /stats/stock y /catalog/version; solo si el catálogo ha cambiado
+        desde el último cálculo (o nunca se calculó) se recalcula desde /products.
+
+        Returns:
+            Dict[str, Any]: total, active_products, by_category, by_league,
+                by_team (dict nombre -> unidades) y low_stock (lista ordenada
+                por stock ascendente)
+        """
+        database = get_database()
+        stats = StockService._get_stock_stats_ref().get()
+        version = database.child('catalog').child('version').get()
+
+        if not stats or (version and stats.get('catalog_version') != version):
+            stats = StockService.rebuild(version=version)
+
+        low_stock: List[Dict[str, Any]] = sorted(
+            (entry for entry in (stats.get('low_stock') or {}).values() if entry),
+            key=lambda entry: entry.get('stock', 0)
+        )
+
+        return {
+            "total": stats.get('total', 0),
+            "active_products": stats.get('active_products', 0),
+            **{group: stats.get(group) or {} for group in StockService.GROUPS.values()},
+            "low_stock": low_stock,
+        }
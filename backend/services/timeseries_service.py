@@ -0,0 +1,306 @@
+"""
+Servicio de series temporales de pedidos con Firebase Realtime Database.
+Acumula ingresos y número de pedidos en buckets por hora, día y mes a medida
+que se crean pedidos, para que las gráficas consulten O(buckets) y no O(pedidos).
+"""
+
+from typing import Dict, Any, List
+from datetime import datetime, timedelta
+from firebase_admin import db
+from backend.config.firebase_config import get_database
+from backend.models.models import OrderStatusEnum
+from backend.utils.rtdb import increment, iter_children
+
+
+class TimeSeriesService:
+    """
+    Servicio para gestionar las series temporales de ingresos y pedidos.
+
+    Estructura en Firebase:
+    /timeseries/orders/
+        hour/
+            {YYYY-MM-DDTHH}/
+                revenue: float
+                orders: int
+        day/
+            {YYYY-MM-DD}/
+                revenue: float
+                orders: int
+        month/
+            {YYYY-MM}/
+                revenue: float
+                orders: int
+
+    Las claves son ordenables, así que un rango de fechas es una única consulta
+    order_by_key().start_at().end_at(). Los pedidos cancelados no cuentan.
+    Los buckets usan la fecha de creación del pedido (UTC).
+    """
+
+    SERIES_PATH = "timeseries/orders"
+
+    # Resolución -> longitud del prefijo ISO que forma la clave del bucket
+    RESOLUTIONS = {
+        "hour": 13,     # 2025-12-05T10
+        "day": 10,      # 2025-12-05
+        "month": 7,     # 2025-12
+    }
+
+    @staticmethod
+    def _get_series_ref() -> db.Reference:
+        """
+        Obtiene la referencia a la serie de pedidos en Firebase.
+
+        Returns:
+            db.Reference: Referencia a /timeseries/orders
+        """
+        database = get_database()
+        return database.child('timeseries').child('orders')
+
+    @staticmethod
+    def _bucket_key(resolution: str, moment: datetime) -> str:
+        """
+        Obtiene la clave del bucket que contiene un instante.
+
+        Args:
+            resolution: "hour", "day" o "month"
+            moment: Instante (UTC)
+
+        Returns:
+            str: Clave del bucket
+        """
+        return moment.isoformat()[:TimeSeriesService.RESOLUTIONS[resolution]]
+
+    @staticmethod
+    def _next_bucket(resolution: str, moment: datetime) -> datetime:
+        """
+        Avanza un instante al inicio del bucket siguiente.
+
+        Args:
+            resolution: "hour", "day" o "month"
+            moment: Inicio del bucket actual
+
+        Returns:
+            datetime: Inicio del bucket siguiente
+        """
+        if resolution == "hour":
+            return moment + timedelta(hours=1)
+        if resolution == "day":
+            return moment + timedelta(days=1)
+        if moment.month == 12:
+            return moment.replace(year=moment.year + 1, month=1)
+        return moment.replace(month=moment.month + 1)
+
+    @staticmethod
+    def _bucket_start(resolution: str, moment: datetime) -> datetime:
+        """Trunca un instante al inicio de su bucket."""
+        moment = moment.replace(minute=0, second=0, microsecond=0)
+        if resolution in ("day", "month"):
+            moment = moment.replace(hour=0)
+        if resolution == "month":
+            moment = moment.replace(day=1)
+        return moment
+
+    @staticmethod
+    def _counts(status: str) -> bool:
+        """Indica si un pedido en ese estado cuenta en la serie."""
+        return status != OrderStatusEnum.CANCELLED.value
+
+    @staticmethod
+    def _order_updates(order_data: Dict[str, Any], sign: int) -> Dict[str, Any]:
+        """
+        Incrementos de un pedido en todos sus buckets.
+
+        Args:
+            order_data: Datos del pedido (se usa created_at y total)
+            sign: 1 para sumar el pedido, -1 para restarlo
+
+        Returns:
+            Dict[str, Any]: Rutas (desde la raíz) e incrementos
+        """
+        created_at = order_data.get('created_at') or datetime.utcnow().isoformat()
+        total = order_data.get('total', 0.0)
+
+        updates = {}
+        for resolution, length in TimeSeriesService.RESOLUTIONS.items():
+            bucket = f"{TimeSeriesService.SERIES_PATH}/{resolution}/{created_at[:length]}"
+            updates[f"{bucket}/revenue"] = increment(sign * total)
+            updates[f"{bucket}/orders"] = increment(sign)
+
+        return updates
+
+    # ------------------------------------------------------------------
+    # Actualizaciones incrementales (se combinan con la escritura principal)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def order_created_updates(order_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Incrementos a aplicar al crear un pedido.
+
+        Args:
+            order_data: Datos del pedido tal como se guardan en /orders
+
+        Returns:
+            Dict[str, Any]: Rutas (desde la raíz) e incrementos
+        """
+        if not TimeSeriesService._counts(order_data.get('status', OrderStatusEnum.PENDING.value)):
+            return {}
+        return TimeSeriesService._order_updates(order_data, 1)
+
+    @staticmethod
+    def order_status_changed_updates(
+        order_data: Dict[str, Any],
+        new_status: str
+    ) -> Dict[str, Any]:
+        """
+        Incrementos a aplicar al cambiar el estado de un pedido.
+
+        Args:
+            order_data: Datos actuales del pedido (con el estado anterior)
+            new_status: Nuevo estado del pedido
+
+        Returns:
+            Dict[str, Any]: Rutas (desde la raíz) e incrementos
+        """
+        was_counted = TimeSeriesService._counts(order_data.get('status', OrderStatusEnum.PENDING.value))
+        is_counted = TimeSeriesService._counts(new_status)
+
+        if was_counted == is_counted:
+            return {}
+        return TimeSeriesService._order_updates(order_data, 1 if is_counted else -1)
+
+    @staticmethod
+    def order_deleted_updates(order_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Incrementos a aplicar al eliminar un pedido.
+
+        Args:
+            order_data: Datos del pedido eliminado
+
+        Returns:
+            Dict[str, Any]: Rutas (desde la raíz) e incrementos
+        """
+        if not TimeSeriesService._counts(order_data.get('status', OrderStatusEnum.PENDING.value)):
+            return {}
+        return TimeSeriesService._order_updates(order_data, -1)
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def get_range(resolution: str, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """
+        Obtiene los buckets de un rango de fechas con una única consulta.
+
+        Args:
+            resolution: "hour", "day" o "month"
+            start: Fecha inicial en UTC (inclusive)
+            end: Fecha final en UTC (inclusive)
+
+        Returns:
+            List[Dict[str, Any]]: Un elemento por bucket (bucket, revenue, orders),
+                en orden cronológico y con 0 en los buckets sin pedidos
+
+        Raises:
+            ValueError: Si la resolución no existe
+        """
+        if resolution not in TimeSeriesService.RESOLUTIONS:
+            raise ValueError(f"Invalid resolution: {resolution}")
+
+        start_key = TimeSeriesService._bucket_key(resolution, start)
+        end_key = TimeSeriesService._bucket_key(resolution, end)
+
+        data = (
+            TimeSeriesService._get_series_ref()
+            .child(resolution)
+            .order_by_key()
+            .start_at(start_key)
+            .end_at(end_key)
+            .get()
+        ) or {}
+
+        series = []
+        moment = TimeSeriesService._bucket_start(resolution, start)
+        while True:
+            key = TimeSeriesService._bucket_key(resolution, moment)
+            if key > end_key:
+                break
+            bucket = data.get(key) or {}
+            series.append({
+                "bucket": key,
+                "revenue": round(bucket.get('revenue', 0.0), 2),
+                "orders": bucket.get('orders', 0)
+            })
+            moment = TimeSeriesService._next_bucket(resolution, moment)
+
+        return series
+
+    @staticmethod
+    def get_last(resolution: str, count: int) -> List[Dict[str, Any]]:
+        """
+        Obtiene los últimos N buckets hasta el actual (incluido).
+
+        Args:
+            resolution: "hour", "day" o "month"
+            count: Número de buckets
+
+        Returns:
+            List[Dict[str, Any]]: Buckets en orden cronológico
+        """
+        end = datetime.utcnow()
+        start = TimeSeriesService._bucket_start(resolution, end)
+        for _ in range(count - 1):
+            if resolution == "month":
+                start = (start - timedelta(days=1)).replace(day=1)
+            elif resolution == "day":
+                start -= timedelta(days=1)
+            else:
+                start -= timedelta(hours=1)
+
+        return TimeSeriesService.get_range(resolution, start, end)
+
+    # ------------------------------------------------------------------
+    # Reconstrucción (backfill)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def backfill(page_size: int = 500) -> Dict[str, int]:
+        """
+        Reconstruye las series reproduciendo todos los pedidos existentes.
+
+        Recorre /orders por páginas y reemplaza /timeseries/orders con los
+        buckets recalculados.
+
+        Args:
+            page_size: Número de pedidos por página de lectura
+
+        Returns:
+            Dict[str, int]: Número de buckets generados por resolución
+        """
+        buckets: Dict[str, Dict[str, Dict[str, Any]]] = {
+            resolution: {} for resolution in TimeSeriesService.RESOLUTIONS
+        }
+
+        for _, order_data in iter_children(get_database().child('orders'), page_size):
+            if not order_data:
+                continue
+            if not TimeSeriesService._counts(order_data.get('status', OrderStatusEnum.PENDING.value)):
+                continue
+
+            created_at = order_data.get('created_at')
+            if not created_at:
+                continue
+
+            for resolution, length in TimeSeriesService.RESOLUTIONS.items():
+                bucket = buckets[resolution].setdefault(created_at[:length], {"revenue": 0.0, "orders": 0})
+                bucket["revenue"] = round(bucket["revenue"] + order_data.get('total', 0.0), 2)
+                bucket["orders"] += 1
+
+        series_ref = TimeSeriesService._get_series_ref()
+        if any(buckets.values()):
+            series_ref.set(buckets)
+        else:
+            series_ref.delete()
+
+        return {resolution: len(data) for resolution, data in buckets.items()}
@@ -3,12 +3,19 @@ Servicio de usuarios con Firebase Realtime Database.
 Gestiona autenticación, registro y operaciones de usuarios SIN Firebase Authentication.
 """
 
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import datetime
 from firebase_admin import db
 from backend.config.firebase_config import get_database
+from backend.core.tracing import trace_methods
+from backend.services.metrics_service import MetricsService
 
 
+class _UserNotFound(Exception):
+    """Aborta la transacción de un usuario que no existe."""
+
+
+@trace_methods
 class UserService:
     """
     Servicio para gestionar usuarios en Firebase Realtime Database.
@@ -195,9 +202,11 @@ class UserService:
             "direccion_envio": {}
         }
 
-        # Guardar en Firebase (convertir ID a string para Firebase)
-        users_ref = UserService._get_users_ref()
-        users_ref.child(str(user_id)).set(user_data)
+        # Guardar en Firebase (convertir ID a string para Firebase) junto con
+        # las métricas agregadas en una única escritura multi-ruta
+        updates = {f"users/{user_id}": user_data}
+        updates.update(MetricsService.user_created_updates(user_data))
+        get_database().update(updates)
 
         # Crear carrito vacío para el usuario con el mismo ID
         UserService._create_user_cart(user_id, email)
@@ -355,24 +364,67 @@ class UserService:
         Returns:
             bool: True si se actualizó, False si el usuario no existe
         """
-        users_ref = UserService._get_users_ref()
-        user_ref = users_ref.child(str(user_id))
-
-        if not user_ref.get():
-            return False
-
         # Filtrar campos permitidos para actualizar
         allowed_fields = ['nombre', 'apellidos', 'telefono', 'foto_perfil',
                          'puntos_fidelizacion', 'es_admin', 'activo', 'direccion_envio']
 
         update_data = {k: v for k, v in kwargs.items() if k in allowed_fields}
 
+        # Si cambia 'activo' hay que mantener el contador de usuarios activos
+        if 'activo' in update_data:
+            return UserService._update_with_active(user_id, update_data)
+
+        users_ref = UserService._get_users_ref()
+        user_ref = users_ref.child(str(user_id))
+
+        user_data = user_ref.get()
+        if not user_data:
+            return False
+
         if update_data:
-            user_ref.update(update_data)
+            get_database().update({f"users/{user_id}/{k}": v for k, v in update_data.items()})
             return True
 
         return False
 
+    @staticmethod
+    def _update_with_active(user_id, update_data: Dict[str, Any]) -> bool:
+        """
+        Actualiza un usuario (incluido 'activo') en una transacción y ajusta
+        el contador de usuarios activos.
+
+        El incremento se calcula con el valor de 'activo' que la transacción ha
+        sustituido de verdad, así que dos desactivaciones simultáneas solo
+        restan una vez.
+
+        Args:
+            user_id: ID del usuario
+            update_data: Campos a actualizar (con 'activo')
+
+        Returns:
+            bool: True si se actualizó, False si el usuario no existe
+        """
+        update_data = {**update_data, 'activo': bool(update_data['activo'])}
+        previous = {}
+
+        def apply(user_data):
+            if not user_data:
+                raise _UserNotFound()
+            # La transacción puede reintentarse: vale el usuario del último intento
+            previous.clear()
+            previous.update(user_data)
+            return {**user_data, **update_data}
+
+        try:
+            UserService._get_users_ref().child(str(user_id)).transaction(apply)
+        except _UserNotFound:
+            return False
+
+        counters = MetricsService.user_active_changed_updates(previous.get('activo', True), update_data['activo'])
+        if counters:
+            get_database().update(counters)
+        return True
+
     @staticmethod
     def change_password(user_id, old_password: str, new_password: str) -> bool:
         """
@@ -415,12 +467,5 @@ class UserService:
         Returns:
             bool: True si se desactivó, False si no existe
         """
-        users_ref = UserService._get_users_ref()
-        user_ref = users_ref.child(str(user_id))
-
-        if not user_ref.get():
-            return False
-
         # Marcar como inactivo en lugar de eliminar
-        user_ref.update({'activo': False})
-        return True
+        return UserService._update_with_active(user_id, {'activo': False})
@@ -0,0 +1 @@
+"""Utilidades compartidas del backend."""
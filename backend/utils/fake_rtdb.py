@@ -0,0 +1,501 @@
+"""
+Realtime Database falsa en memoria con la API de firebase_admin.db.Reference.
+
+Pensada para benchmarks y tests sin red: registra cada llamada (operación, ruta,
+bytes) y puede simular la latencia de ida y vuelta a Firebase (fija más jitter),
+durmiendo de verdad o solo sumando el tiempo simulado. Reproduce el
+comportamiento de Firebase que afecta a los servicios: claves enteras devueltas
+como lista, nodos vacíos que desaparecen, valores de servidor (increment,
+timestamp), consultas ordenadas y transacciones optimistas (lectura +
+escritura condicional, que se reintenta si otro cliente ha escrito antes).
+
+Uso:
+    from backend.config.firebase_config import use_database
+    from backend.utils.fake_rtdb import FakeDatabase
+
+    fake = FakeDatabase(data, latency_ms=40, jitter_ms=10)
+    use_database(fake)
+    ...                                # CartService, OrderService... usan la falsa
+    print(fake.summary())
+    use_database(None)
+"""
+
+import copy
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from firebase_admin.db import TransactionAbortedError
+
+
+# Caracteres no permitidos en las rutas de Realtime Database
+_INVALID_PATH_CHARS = set('.$#[]')
+
+# Reintentos de una transacción con conflicto (como el SDK)
+TRANSACTION_MAX_RETRIES = 25
+
+# Alfabeto de los IDs de push() (ordenados por tiempo, como los de Firebase)
+_PUSH_CHARS = '-0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'
+
+
+class Call(NamedTuple):
+    """Llamada registrada contra la base de datos falsa."""
+    op: str                 # get, set, update, delete, push, query, transaction
+    kind: str               # read | write
+    path: str
+    bytes: int              # Tamaño JSON de la respuesta (lecturas) o del cuerpo (escrituras)
+    latency: float          # Segundos de latencia simulada
+    query: Optional[str] = None
+
+
+def _split(path: str) -> List[str]:
+    """Divide una ruta en segmentos validando los caracteres."""
+    parts = [part for part in str(path).split('/') if part]
+    for part in parts:
+        if _INVALID_PATH_CHARS & set(part):
+            raise ValueError(f'Invalid path: "{path}". Path contains illegal characters.')
+    return parts
+
+
+def _size(value: Any) -> int:
+    """Bytes que ocuparía el valor en JSON."""
+    if value is None:
+        return 0
+    return len(json.dumps(value, default=str, separators=(',', ':')).encode('utf-8'))
+
+
+def _store(value: Any) -> Any:
+    """
+    Convierte un valor al formato almacenado: dicts con claves str, sin None ni
+    nodos vacíos (las listas se guardan como dicts por índice, como Firebase).
+    """
+    if isinstance(value, (list, tuple)):
+        value = {str(index): item for index, item in enumerate(value)}
+    if isinstance(value, dict):
+        stored = {}
+        for key, item in value.items():
+            item = _store(item)
+            if item is not None:
+                _split(str(key))
+                stored[str(key)] = item
+        return stored or None
+    return value
+
+
+def _etag(value: Any) -> str:
+    """ETag de un valor (cambia si cambia el contenido)."""
+    return hashlib.md5(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _array_index(key: str) -> Optional[int]:
+    """Índice entero de una clave canónica ("0", "12"...), None si no lo es."""
+    if key.isdigit() and (key == "0" or not key.startswith("0")):
+        return int(key)
+    return None
+
+
+def _export(value: Any) -> Any:
+    """
+    Copia un valor almacenado tal y como lo devolvería Firebase: un nodo cuyas
+    claves son todas enteros y ocupan más de la mitad del rango 0..max se
+    devuelve como lista (con None en los huecos).
+    """
+    if not isinstance(value, dict):
+        return value
+
+    exported = {key: _export(item) for key, item in value.items()}
+    indexes = [_array_index(key) for key in exported]
+    if indexes and all(index is not None for index in indexes) and len(indexes) * 2 > max(indexes):
+        array = [None] * (max(indexes) + 1)
+        for key, index in zip(exported, indexes):
+            array[index] = exported[key]
+        return array
+    return exported
+
+
+def _type_rank(value: Any) -> Tuple[int, Any]:
+    """Clave de orden de un valor según Realtime Database: null < false < true < números < strings < objetos."""
+    if value is None:
+        return (0, 0)
+    if value is False:
+        return (1, 0)
+    if value is True:
+        return (2, 0)
+    if isinstance(value, (int, float)):
+        return (3, value)
+    if isinstance(value, str):
+        return (4, value)
+    return (5, 0)
+
+
+def _key_rank(key: str) -> Tuple[int, Any]:
+    """Clave de orden de una clave: primero las enteras (numéricamente), luego el resto."""
+    index = _array_index(key)
+    if index is not None and index < 2 ** 31:
+        return (0, index)
+    return (1, key)
+
+
+class FakeDatabase:
+    """
+    Base de datos en memoria compartida por todas sus referencias.
+
+    Args:
+        data: Contenido inicial (se copia)
+        latency_ms: Latencia media de cada llamada en milisegundos
+        jitter_ms: Variación máxima (uniforme, +/-) sobre la latencia
+        seed: Semilla del jitter para resultados reproducibles
+        sleep: Dormir la latencia simulada (False: solo se suma en los registros)
+    """
+
+    def __init__(
+        self,
+        data: Any = None,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        seed: Optional[int] = None,
+        sleep: bool = True
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.sleep = sleep
+        self.calls: List[Call] = []
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._root: Dict[str, Any] = _store(copy.deepcopy(data)) or {}
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def reference(self, path: str = "/") -> "FakeReference":
+        """Referencia a una ruta (equivalente a firebase_admin.db.reference)."""
+        return FakeReference(self, _split(path))
+
+    def load(self, data: Any):
+        """Sustituye todo el contenido (sin registrar llamadas)."""
+        with self._lock:
+            self._root = _store(copy.deepcopy(data)) or {}
+
+    def dump(self) -> Any:
+        """Copia de todo el contenido (sin registrar llamadas)."""
+        with self._lock:
+            return _export(self._root)
+
+    def reset_calls(self):
+        """Vacía el registro de llamadas."""
+        with self._lock:
+            self.calls = []
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Resumen del registro de llamadas.
+
+        Returns:
+            Dict[str, Any]: calls, reads, writes, read_bytes, write_bytes,
+                latency_seconds y by_op (llamadas por operación)
+        """
+        with self._lock:
+            calls = list(self.calls)
+
+        by_op: Dict[str, int] = {}
+        for call in calls:
+            by_op[call.op] = by_op.get(call.op, 0) + 1
+
+        return {
+            "calls": len(calls),
+            "reads": sum(1 for call in calls if call.kind == "read"),
+            "writes": sum(1 for call in calls if call.kind == "write"),
+            "read_bytes": sum(call.bytes for call in calls if call.kind == "read"),
+            "write_bytes": sum(call.bytes for call in calls if call.kind == "write"),
+            "latency_seconds": round(sum(call.latency for call in calls), 6),
+            "by_op": by_op,
+        }
+
+    # ------------------------------------------------------------------
+    # Interno
+    # ------------------------------------------------------------------
+
+    def _record(self, op: str, kind: str, parts: List[str], payload: Any, query: Optional[str] = None):
+        """Registra una llamada y aplica su latencia."""
+        latency = self.latency_ms
+        if self.jitter_ms:
+            with self._lock:
+                latency += self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        latency = max(0.0, latency) / 1000
+
+        call = Call(op, kind, "/" + "/".join(parts), _size(payload), latency, query)
+        with self._lock:
+            self.calls.append(call)
+
+        if self.sleep and latency:
+            time.sleep(latency)
+
+    def _read(self, parts: List[str]) -> Any:
+        node = self._root
+        for part in parts:
+            if not isinstance(node, dict) or part not in node:
+                return None
+            node = node[part]
+        return node
+
+    def _resolve(self, value: Any, current: Any) -> Any:
+        """Sustituye los valores de servidor ({".sv": ...}) de un valor a escribir."""
+        if isinstance(value, dict):
+            server_value = value.get('.sv')
+            if server_value == 'timestamp':
+                return int(time.time() * 1000)
+            if isinstance(server_value, dict) and 'increment' in server_value:
+                base = current if isinstance(current, (int, float)) and not isinstance(current, bool) else 0
+                return base + server_value['increment']
+            return {
+                key: self._resolve(item, current.get(str(key)) if isinstance(current, dict) else None)
+                for key, item in value.items()
+            }
+        return value
+
+    def _write(self, parts: List[str], value: Any):
+        """Escribe (o borra con None) un valor en una ruta, eliminando los nodos que queden vacíos."""
+        value = _store(self._resolve(copy.deepcopy(value), self._read(parts)))
+
+        if not parts:
+            self._root = value or {}
+            return
+
+        node = self._root
+        trail = []
+        for part in parts[:-1]:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                if value is None:
+                    return
+                child = node[part] = {}
+            trail.append((node, part))
+            node = child
+
+        if value is None:
+            node.pop(parts[-1], None)
+            # Firebase no guarda nodos vacíos
+            for parent, key in reversed(trail):
+                if parent[key]:
+                    break
+                del parent[key]
+        else:
+            node[parts[-1]] = value
+
+    def _push_id(self) -> str:
+        """ID de push() ordenable por tiempo (8 caracteres de timestamp + 12 aleatorios)."""
+        now = int(time.time() * 1000)
+        stamp = []
+        for _ in range(8):
+            stamp.append(_PUSH_CHARS[now % 64])
+            now //= 64
+        with self._lock:
+            suffix = ''.join(self._random.choice(_PUSH_CHARS) for _ in range(12))
+        return ''.join(reversed(stamp)) + suffix
+
+
+class FakeReference:
+    """Referencia a una ruta de FakeDatabase (mismos métodos que db.Reference)."""
+
+    def __init__(self, database: FakeDatabase, parts: List[str]):
+        self._database = database
+        self._parts = parts
+
+    @property
+    def key(self) -> Optional[str]:
+        return self._parts[-1] if self._parts else None
+
+    @property
+    def path(self) -> str:
+        return "/" + "/".join(self._parts)
+
+    @property
+    def parent(self) -> Optional["FakeReference"]:
+        if not self._parts:
+            return None
+        return FakeReference(self._database, self._parts[:-1])
+
+    def child(self, path: str) -> "FakeReference":
+        if not path or not isinstance(path, str):
+            raise ValueError(f'Invalid path argument: "{path}". Path must be a non-empty string.')
+        return FakeReference(self._database, self._parts + _split(path))
+
+    def get(self, etag: bool = False, shallow: bool = False):
+        with self._database._lock:
+            value = _export(self._database._read(self._parts))
+        if shallow and isinstance(value, (dict, list)):
+            value = {key: True for key in (value if isinstance(value, dict) else
+                                           [str(index) for index, item in enumerate(value) if item is not None])}
+        self._database._record("get", "read", self._parts, value)
+        if etag:
+            return value, _etag(value)
+        return value
+
+    def set(self, value: Any):
+        if value is None:
+            raise ValueError('Value must not be None.')
+        self._database._record("set", "write", self._parts, value)
+        with self._database._lock:
+            self._database._write(self._parts, value)
+
+    def update(self, value: Dict[str, Any]):
+        if not value or not isinstance(value, dict):
+            raise ValueError('Value argument must be a non-empty dictionary.')
+        if None in value.keys():
+            raise ValueError('Dictionary must not contain None keys.')
+        self._database._record("update", "write", self._parts, value)
+        with self._database._lock:
+            for path, item in value.items():
+                self._database._write(self._parts + _split(path), item)
+
+    def delete(self):
+        self._database._record("delete", "write", self._parts, None)
+        with self._database._lock:
+            self._database._write(self._parts, None)
+
+    def push(self, value: Any = '') -> "FakeReference":
+        if value is None:
+            raise ValueError('Value must not be None.')
+        key = self._database._push_id()
+        self._database._record("push", "write", self._parts + [key], value)
+        with self._database._lock:
+            self._database._write(self._parts + [key], value)
+        return FakeReference(self._database, self._parts + [key])
+
+    def transaction(self, transaction_update: Callable[[Any], Any]) -> Any:
+        """
+        Transacción optimista como la del SDK: GET con ETag, la función fuera
+        del bloqueo y PUT condicional (dos llamadas si no hay conflicto).
+
+        Si otra escritura ha cambiado el valor entre medias, el PUT falla,
+        devuelve el valor actual y la función se vuelve a ejecutar con él
+        (hasta TRANSACTION_MAX_RETRIES veces). Como el SDK, la función no
+        puede devolver None.
+        """
+        if not callable(transaction_update):
+            raise ValueError('transaction_update must be a function.')
+
+        database = self._database
+        with database._lock:
+            current = _export(database._read(self._parts))
+        database._record("transaction", "read", self._parts, current)
+
+        for _ in range(TRANSACTION_MAX_RETRIES):
+            new_value = transaction_update(copy.deepcopy(current))
+            if new_value is None:
+                raise ValueError('Value must not be none.')
+            database._record("transaction", "write", self._parts, new_value)
+            with database._lock:
+                stored = _export(database._read(self._parts))
+                if _etag(stored) == _etag(current):
+                    database._write(self._parts, new_value)
+                    return new_value
+            current = stored
+
+        raise TransactionAbortedError('Transaction aborted after failed retries.')
+
+    def order_by_child(self, path: str) -> "FakeQuery":
+        if not path or path.startswith('$'):
+            raise ValueError(f'Illegal child path: {path}')
+        return FakeQuery(self, "child", _split(path))
+
+    def order_by_key(self) -> "FakeQuery":
+        return FakeQuery(self, "key")
+
+    def order_by_value(self) -> "FakeQuery":
+        return FakeQuery(self, "value")
+
+    def __repr__(self) -> str:
+        return f"<FakeReference {self.path}>"
+
+
+class FakeQuery:
+    """Consulta ordenada sobre los hijos de una referencia (como db.Query)."""
+
+    def __init__(self, ref: FakeReference, order_by: str, child_path: Optional[List[str]] = None):
+        self._ref = ref
+        self._order_by = order_by
+        self._child_path = child_path or []
+        self._start = self._end = None
+        self._has_start = self._has_end = False
+        self._first: Optional[int] = None
+        self._last: Optional[int] = None
+
+    def start_at(self, start: Any) -> "FakeQuery":
+        if start is None:
+            raise ValueError('Start value must not be None.')
+        self._start, self._has_start = start, True
+        return self
+
+    def end_at(self, end: Any) -> "FakeQuery":
+        if end is None:
+            raise ValueError('End value must not be None.')
+        self._end, self._has_end = end, True
+        return self
+
+    def equal_to(self, value: Any) -> "FakeQuery":
+        return self.start_at(value).end_at(value)
+
+    def limit_to_first(self, limit: int) -> "FakeQuery":
+        if self._last is not None:
+            raise ValueError('Cannot set both first and last limits.')
+        self._first = limit
+        return self
+
+    def limit_to_last(self, limit: int) -> "FakeQuery":
+        if self._first is not None:
+            raise ValueError('Cannot set both first and last limits.')
+        self._last = limit
+        return self
+
+    def _rank(self, key: str, value: Any) -> Tuple:
+        """Posición de un hijo según el orden de la consulta (desempate por clave)."""
+        if self._order_by == "key":
+            return (_key_rank(key),)
+        if self._order_by == "value":
+            return (_type_rank(value), _key_rank(key))
+        for part in self._child_path:
+            value = value.get(part) if isinstance(value, dict) else None
+        return (_type_rank(value), _key_rank(key))
+
+    def _bound(self, bound: Any) -> Tuple:
+        return _key_rank(str(bound)) if self._order_by == "key" else _type_rank(bound)
+
+    def _description(self) -> str:
+        order = {"key": "$key", "value": "$value"}.get(self._order_by, "/".join(self._child_path))
+        parts = [f"orderBy={order}"]
+        if self._has_start:
+            parts.append(f"startAt={self._start!r}")
+        if self._has_end:
+            parts.append(f"endAt={self._end!r}")
+        if self._first is not None:
+            parts.append(f"limitToFirst={self._first}")
+        if self._last is not None:
+            parts.append(f"limitToLast={self._last}")
+        return "&".join(parts)
+
+    def get(self) -> Any:
+        database = self._ref._database
+        with database._lock:
+            node = database._read(self._ref._parts)
+            children = list(node.items()) if isinstance(node, dict) else []
+
+            ranked = sorted(((self._rank(key, value), key, value) for key, value in children), key=lambda item: item[0])
+            if self._has_start:
+                ranked = [item for item in ranked if item[0][0] >= self._bound(self._start)]
+            if self._has_end:
+                ranked = [item for item in ranked if item[0][0] <= self._bound(self._end)]
+            if self._first is not None:
+                ranked = ranked[:self._first]
+            if self._last is not None:
+                ranked = ranked[-self._last:] if self._last else []
+
+            result = OrderedDict((key, _export(value)) for _, key, value in ranked)
+
+        database._record("query", "read", self._ref._parts, result, self._description())
+        return result if node is not None else None
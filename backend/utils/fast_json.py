@@ -0,0 +1,120 @@
+"""
+Serialización JSON rápida para respuestas de la API y carga de datos.
+
+- dumps/loads usan orjson si está instalado (varias veces más rápido que json
+  y devuelve bytes, que es lo que se envía) y si no, la librería estándar con
+  la misma salida compacta en UTF-8.
+- dump_model escribe modelos Pydantic (o listas y dicts de modelos)
+  directamente a bytes con el serializador de pydantic-core, sin pasar por
+  model_dump() ni jsonable_encoder.
+- FastJSONResponse es la clase de respuesta por defecto de la API
+  (default_response_class en backend/main.py).
+- load_file lee ficheros como data/BBDD.json de una vez, en binario.
+
+Uso:
+    from backend.utils.fast_json import FastJSONResponse, dump_model, load_file
+
+    data = load_file("data/BBDD.json")
+    body = dump_model(orders)                 # List[Order] -> bytes
+    return FastJSONResponse(orders)           # Modelos sin dict intermedio
+"""
+
+import json
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Union
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(value: Any) -> Any:
+    """Tipos que no entiende el codificador JSON."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, "isoformat"):
+        # datetime, date y time con la librería estándar (orjson ya los soporta)
+        return value.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serializa un valor a JSON compacto en UTF-8.
+
+    Args:
+        value: dict, list, tipos básicos, fechas o modelos Pydantic
+
+    Returns:
+        bytes: JSON codificado
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserializa JSON (bytes o str)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """
+    Lee un fichero JSON completo.
+
+    Para volcados que no caben en memoria, usar backend/utils/json_stream.py.
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def _is_model_content(value: Any) -> bool:
+    if isinstance(value, BaseModel):
+        return True
+    return isinstance(value, (list, tuple)) and bool(value) and isinstance(value[0], BaseModel)
+
+
+def dump_model(value: Any) -> bytes:
+    """
+    Serializa modelos Pydantic directamente a bytes.
+
+    Acepta un modelo, una lista de modelos o cualquier estructura que los
+    contenga. Las fechas salen en ISO 8601, como con jsonable_encoder.
+
+    Returns:
+        bytes: JSON codificado
+    """
+    return to_json(value)
+
+
+def encode(content: Any) -> bytes:
+    """Cuerpo JSON de una respuesta: dump_model para modelos, dumps para el resto."""
+    if _is_model_content(content):
+        return dump_model(content)
+    return dumps(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse que codifica con encode() (modelos sin dict intermedio).
+
+    FastAPI ya convierte a dict lo que devuelven los endpoints con
+    response_model; un endpoint que devuelva FastJSONResponse(modelos)
+    directamente se salta también esa conversión.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return encode(content)
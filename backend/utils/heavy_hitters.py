@@ -0,0 +1,155 @@
+"""
+Estructura Space-Saving para detectar los elementos más frecuentes (heavy hitters)
+de un flujo usando memoria constante.
+
+Mantiene como máximo `capacity` contadores. Cuando llega un elemento nuevo con
+la estructura llena, reemplaza al contador mínimo y hereda su valor como error
+máximo. Garantías (Metwally et al.):
+- Todo elemento con peso real > total / capacity aparece en la estructura.
+- Para cada elemento: count - error <= peso real <= count.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class SpaceSaving:
+    """
+    Resumen Space-Saving con pesos (unidades, ingresos...).
+    """
+
+    def __init__(self, capacity: int = 50):
+        """
+        Args:
+            capacity: Número máximo de contadores que se mantienen
+        """
+        self.capacity = capacity
+        self._counters: Dict[str, List[float]] = {}     # item -> [count, error]
+        self._labels: Dict[str, Dict[str, Any]] = {}    # item -> datos para mostrar
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    def add(self, item: str, weight: float = 1, label: Optional[Dict[str, Any]] = None):
+        """
+        Añade una ocurrencia de un elemento.
+
+        Args:
+            item: Identificador del elemento
+            weight: Peso de la ocurrencia (ej: unidades vendidas)
+            label: Datos descriptivos opcionales (ej: nombre del producto)
+        """
+        counter = self._counters.get(item)
+
+        if counter is not None:
+            counter[0] += weight
+        elif len(self._counters) < self.capacity:
+            self._counters[item] = [weight, 0]
+        else:
+            # Reemplazar el mínimo: el nuevo elemento hereda su cuenta como error
+            min_item = min(self._counters, key=lambda key: self._counters[key][0])
+            min_count = self._counters.pop(min_item)[0]
+            self._labels.pop(min_item, None)
+            self._counters[item] = [min_count + weight, min_count]
+
+        if label:
+            self._labels[item] = label
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """
+        Combina otro resumen en este (suma de contadores y errores).
+
+        El resultado se recorta a `capacity` contadores; los elementos que no
+        aparecen en uno de los resúmenes suman el mínimo de ese resumen como
+        error (cota superior de lo que pudo perderse).
+
+        Args:
+            other: Resumen a combinar
+
+        Returns:
+            SpaceSaving: Este mismo resumen (para encadenar)
+        """
+        self_min = self._min_count() if len(self) >= self.capacity else 0
+        other_min = other._min_count() if len(other) >= other.capacity else 0
+
+        merged: Dict[str, List[float]] = {}
+        for item in set(self._counters) | set(other._counters):
+            own = self._counters.get(item)
+            theirs = other._counters.get(item)
+            count = (own[0] if own else self_min) + (theirs[0] if theirs else other_min)
+            error = (own[1] if own else self_min) + (theirs[1] if theirs else other_min)
+            merged[item] = [count, error]
+
+        kept = sorted(merged.items(), key=lambda entry: entry[1][0], reverse=True)[:self.capacity]
+        self._counters = dict(kept)
+
+        labels = {**self._labels, **other._labels}
+        self._labels = {item: labels[item] for item in self._counters if item in labels}
+
+        return self
+
+    def _min_count(self) -> float:
+        """Cuenta mínima actual (0 si está vacío)."""
+        if not self._counters:
+            return 0
+        return min(counter[0] for counter in self._counters.values())
+
+    def top(self, k: int) -> List[Dict[str, Any]]:
+        """
+        Devuelve los k elementos con mayor cuenta estimada.
+
+        Args:
+            k: Número de elementos
+
+        Returns:
+            List[Dict[str, Any]]: Elementos con id, count, error y sus datos descriptivos
+        """
+        ranked = sorted(self._counters.items(), key=lambda entry: entry[1][0], reverse=True)[:k]
+        return [
+            {"id": item, "count": count, "error": error, **self._labels.get(item, {})}
+            for item, (count, error) in ranked
+        ]
+
+    def get(self, item: str) -> Optional[float]:
+        """
+        Cuenta estimada de un elemento.
+
+        Args:
+            item: Identificador del elemento
+
+        Returns:
+            Optional[float]: Cuenta estimada o None si no está en el resumen
+        """
+        counter = self._counters.get(item)
+        return counter[0] if counter else None
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """
+        Serializa el resumen como lista (evita claves numéricas en Firebase).
+
+        Returns:
+            List[Dict[str, Any]]: Entradas con id, count, error y datos descriptivos
+        """
+        return self.top(len(self._counters))
+
+    @classmethod
+    def from_list(cls, entries: Optional[Iterable[Dict[str, Any]]], capacity: int = 50) -> "SpaceSaving":
+        """
+        Reconstruye un resumen serializado con to_list().
+
+        Args:
+            entries: Entradas serializadas (puede ser None)
+            capacity: Número máximo de contadores
+
+        Returns:
+            SpaceSaving: Resumen reconstruido
+        """
+        summary = cls(capacity)
+        for entry in entries or []:
+            if not entry:
+                continue
+            entry = dict(entry)
+            item = str(entry.pop("id"))
+            summary._counters[item] = [entry.pop("count", 0), entry.pop("error", 0)]
+            if entry:
+                summary._labels[item] = entry
+        return summary
@@ -0,0 +1,143 @@
+"""
+Instrumentación de las llamadas a Realtime Database.
+
+get_database() envuelve la referencia raíz con InstrumentedReference cuando hay
+algún listener registrado (métricas, trazas...). Cada llamada que va a la base
+de datos (get, set, update, delete, push, transaction y el get de una
+consulta) se cronometra y se notifica a los listeners con la operación, la
+ruta, el instante de inicio (time.perf_counter), la duración en segundos y el
+error si lo hubo. Sin listeners, get_database() devuelve la referencia tal cual
+y no hay ningún coste.
+
+Uso:
+    from backend.utils import instrumented_rtdb
+
+    def log_call(op, path, started, seconds, error):
+        print(f"{op} {path} {seconds * 1000:.1f} ms")
+
+    instrumented_rtdb.add_listener(log_call)
+"""
+
+import time
+from typing import Any, Callable, List, Optional
+
+# listener(op, ruta, inicio, segundos, error)
+Listener = Callable[[str, str, float, float, Optional[BaseException]], None]
+
+_listeners: List[Listener] = []
+
+
+def add_listener(listener: Listener):
+    """Registra un listener (una sola vez aunque se llame varias)."""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_listener(listener: Listener):
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def instrument(reference):
+    """Envuelve una referencia si hay listeners; si no, la devuelve sin cambios."""
+    if not _listeners or isinstance(reference, InstrumentedReference):
+        return reference
+    return InstrumentedReference(reference)
+
+
+def _timed(op: str, path: str, call: Callable[[], Any]) -> Any:
+    """Ejecuta una llamada a la base de datos y notifica su duración."""
+    started = time.perf_counter()
+    error = None
+    try:
+        return call()
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        seconds = time.perf_counter() - started
+        for listener in list(_listeners):
+            listener(op, path, started, seconds, error)
+
+
+class InstrumentedReference:
+    """Referencia (firebase_admin.db.Reference o FakeReference) instrumentada."""
+
+    def __init__(self, reference):
+        self._reference = reference
+
+    def __getattr__(self, name: str) -> Any:
+        # key, path y cualquier otro atributo se delegan sin instrumentar
+        return getattr(self._reference, name)
+
+    def __repr__(self) -> str:
+        return f"InstrumentedReference({self._reference!r})"
+
+    @property
+    def parent(self) -> Optional["InstrumentedReference"]:
+        parent = self._reference.parent
+        return InstrumentedReference(parent) if parent is not None else None
+
+    def child(self, path: str) -> "InstrumentedReference":
+        return InstrumentedReference(self._reference.child(path))
+
+    def get(self, *args, **kwargs):
+        return _timed("get", self._reference.path, lambda: self._reference.get(*args, **kwargs))
+
+    def set(self, value: Any):
+        return _timed("set", self._reference.path, lambda: self._reference.set(value))
+
+    def update(self, value: Any):
+        return _timed("update", self._reference.path, lambda: self._reference.update(value))
+
+    def delete(self):
+        return _timed("delete", self._reference.path, self._reference.delete)
+
+    def push(self, *args, **kwargs) -> "InstrumentedReference":
+        return InstrumentedReference(
+            _timed("push", self._reference.path, lambda: self._reference.push(*args, **kwargs))
+        )
+
+    def transaction(self, transaction_update: Callable[[Any], Any]):
+        return _timed("transaction", self._reference.path, lambda: self._reference.transaction(transaction_update))
+
+    def order_by_child(self, path: str) -> "InstrumentedQuery":
+        return InstrumentedQuery(self._reference.order_by_child(path), self._reference.path)
+
+    def order_by_key(self) -> "InstrumentedQuery":
+        return InstrumentedQuery(self._reference.order_by_key(), self._reference.path)
+
+    def order_by_value(self) -> "InstrumentedQuery":
+        return InstrumentedQuery(self._reference.order_by_value(), self._reference.path)
+
+
+class InstrumentedQuery:
+    """Consulta instrumentada: solo get() llega a la base de datos."""
+
+    def __init__(self, query, path: str):
+        self._query = query
+        self._path = path
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._query, name)
+
+    def _wrap(self, query) -> "InstrumentedQuery":
+        return InstrumentedQuery(query, self._path)
+
+    def start_at(self, start: Any) -> "InstrumentedQuery":
+        return self._wrap(self._query.start_at(start))
+
+    def end_at(self, end: Any) -> "InstrumentedQuery":
+        return self._wrap(self._query.end_at(end))
+
+    def equal_to(self, value: Any) -> "InstrumentedQuery":
+        return self._wrap(self._query.equal_to(value))
+
+    def limit_to_first(self, limit: int) -> "InstrumentedQuery":
+        return self._wrap(self._query.limit_to_first(limit))
+
+    def limit_to_last(self, limit: int) -> "InstrumentedQuery":
+        return self._wrap(self._query.limit_to_last(limit))
+
+    def get(self):
+        return _timed("query", self._path, self._query.get)
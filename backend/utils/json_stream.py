@@ -0,0 +1,149 @@
+"""
+Lectura en streaming de ficheros JSON grandes con la librería estándar.
+
+Pensado para volcados con la forma {"coleccion": [ {...}, {...} ], ...}: recorre
+las colecciones de primer nivel y devuelve sus elementos de uno en uno, de modo
+que la memoria usada depende del tamaño de un elemento y no del fichero.
+"""
+
+import json
+from typing import Any, Iterator, TextIO, Tuple, Union
+
+
+class _StreamReader:
+    """
+    Buffer de lectura sobre un fichero de texto que decodifica valores JSON
+    con JSONDecoder.raw_decode, leyendo más datos cuando un valor está incompleto.
+    """
+
+    WHITESPACE = " \t\n\r"
+    DELIMITERS = WHITESPACE + ",]}"
+
+    def __init__(self, stream: TextIO, chunk_size: int = 1 << 16):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Lee otro bloque del fichero. Devuelve False si ya no quedan datos."""
+        if self.eof:
+            return False
+
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+
+        # Descartar lo ya consumido para que el buffer no crezca sin límite
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Siguiente carácter significativo (sin consumirlo); '' al final del fichero."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in self.WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """
+        Consume el siguiente carácter significativo, que debe ser uno de `chars`.
+
+        Raises:
+            ValueError: Si el carácter no es el esperado
+        """
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Invalid JSON: expected one of {chars!r} at offset {self.pos}, found {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """
+        Decodifica el siguiente valor JSON completo.
+
+        Raises:
+            ValueError: Si el JSON está mal formado o termina a medias
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+
+            # Un número solo está completo si le sigue un delimitador: "1" puede
+            # ser el principio de "1.5" o "12" en el siguiente bloque
+            is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if is_number and (end == len(self.buffer) or self.buffer[end] not in self.DELIMITERS):
+                if self._fill():
+                    continue
+
+            self.pos = end
+            return value
+
+
+def iter_collections(
+    stream: TextIO,
+    chunk_size: int = 1 << 16
+) -> Iterator[Tuple[str, Union[int, str], Any]]:
+    """
+    Recorre un objeto JSON de primer nivel elemento a elemento.
+
+    Para cada colección que sea un array devuelve (coleccion, indice, elemento);
+    si es un objeto, (coleccion, clave, valor) por cada miembro; cualquier otro
+    valor se devuelve completo como (coleccion, None, valor).
+
+    Args:
+        stream: Fichero de texto abierto
+        chunk_size: Caracteres por lectura
+
+    Yields:
+        Tuple[str, Union[int, str], Any]: (colección, índice o clave, valor)
+
+    Raises:
+        ValueError: Si el JSON está mal formado
+    """
+    reader = _StreamReader(stream, chunk_size)
+    reader.expect("{")
+
+    if reader.peek() == "}":
+        return
+
+    while True:
+        collection = reader.value()
+        reader.expect(":")
+
+        opening = reader.peek()
+        if opening and opening in "[{":
+            reader.expect(opening)
+            closing = "]" if opening == "[" else "}"
+            index = 0
+
+            if reader.peek() == closing:
+                reader.expect(closing)
+            else:
+                while True:
+                    if opening == "[":
+                        key = index
+                    else:
+                        key = reader.value()
+                        reader.expect(":")
+                    yield collection, key, reader.value()
+                    index += 1
+                    if reader.expect("," + closing) == closing:
+                        break
+        else:
+            yield collection, None, reader.value()
+
+        if reader.expect(",}") == "}":
+            return
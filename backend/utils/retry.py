@@ -0,0 +1,51 @@
+"""
+Reintentos con backoff exponencial y jitter para operaciones de red
+(escrituras en Firebase, llamadas HTTP...).
+"""
+
+import random
+import time
+from typing import Callable, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+
+def call_with_retries(
+    operation: Callable[[], T],
+    attempts: int = 5,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    on_retry: Optional[Callable[[int, BaseException, float], None]] = None
+) -> T:
+    """
+    Ejecuta una operación reintentándola si falla.
+
+    La espera antes del reintento n es aleatoria entre 0 y
+    min(max_delay, base_delay * 2**n) ("full jitter"), para que varios
+    procesos que fallan a la vez no reintenten sincronizados.
+
+    Args:
+        operation: Función sin argumentos a ejecutar
+        attempts: Número máximo de intentos (incluido el primero)
+        base_delay: Espera base en segundos
+        max_delay: Espera máxima en segundos
+        retry_on: Excepciones que provocan un reintento
+        on_retry: Callback opcional (intento, error, espera) antes de cada reintento
+
+    Returns:
+        T: Resultado de la operación
+
+    Raises:
+        La última excepción si se agotan los intentos
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return operation()
+        except retry_on as e:
+            if attempt == attempts:
+                raise
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+            if on_retry:
+                on_retry(attempt, e, delay)
+            time.sleep(delay)
@@ -0,0 +1,168 @@
+"""
+Utilidades para trabajar con Firebase Realtime Database.
+
+Incluye valores de servidor (incrementos atómicos) y lectura paginada de
+colecciones grandes para no descargar un nodo completo en memoria.
+"""
+
+import re
+from typing import Any, Dict, Iterator, Optional, Tuple
+from firebase_admin import db
+
+
+# Caracteres no permitidos en las claves de Realtime Database
+_INVALID_KEY_CHARS = re.compile(r'[.$#\[\]/]')
+
+
+def safe_key(value: Any) -> str:
+    """
+    Convierte un valor (ej: nombre de equipo) en una clave válida de Firebase.
+
+    Args:
+        value: Valor a usar como clave
+
+    Returns:
+        str: Clave sin los caracteres . $ # [ ] / (sustituidos por _)
+    """
+    key = _INVALID_KEY_CHARS.sub('_', str(value).strip())
+    return key or '_'
+
+
+def increment(delta) -> Dict[str, Any]:
+    """
+    Valor de servidor que incrementa atómicamente un campo numérico.
+
+    Se usa dentro de `update()` (incluidas escrituras multi-ruta) y no
+    requiere leer el valor previo: Firebase aplica el incremento en el servidor.
+
+    Args:
+        delta: Cantidad a sumar (puede ser negativa o decimal)
+
+    Returns:
+        Dict: Marcador `{".sv": {"increment": delta}}`
+    """
+    return {".sv": {"increment": delta}}
+
+
+def as_dict(data: Any) -> Dict[str, Any]:
+    """
+    Normaliza el contenido de un nodo a un dict clave -> valor.
+
+    Firebase devuelve una lista cuando las claves son enteros consecutivos
+    ("1", "2", ...); en ese caso se reconstruyen las claves desde los índices.
+
+    Args:
+        data: Valor devuelto por `get()` (dict, lista o None)
+
+    Returns:
+        Dict[str, Any]: Hijos no nulos indexados por su clave
+    """
+    if isinstance(data, list):
+        return {str(index): value for index, value in enumerate(data) if value is not None}
+    return {str(key): value for key, value in (data or {}).items() if value is not None}
+
+
+def iter_children(
+    ref: db.Reference,
+    page_size: int = 500,
+    start_after: Optional[str] = None
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Recorre los hijos de un nodo por páginas ordenadas por clave.
+
+    Cada página es una consulta `order_by_key().start_at(...).limit_to_first(...)`,
+    de modo que la memoria usada está acotada por `page_size`.
+
+    Args:
+        ref: Referencia al nodo a recorrer (ej: /orders)
+        page_size: Número de hijos por petición
+        start_after: Empezar después de esta clave (para recorridos incrementales)
+
+    Yields:
+        Tuple[str, Any]: Pares (clave, valor) en orden de clave
+    """
+    last_key = start_after
+
+    while True:
+        query = ref.order_by_key()
+        if last_key is None:
+            page = query.limit_to_first(page_size).get()
+        else:
+            # start_at es inclusivo: se pide un elemento más y se descarta el primero
+            page = query.start_at(last_key).limit_to_first(page_size + 1).get()
+
+        if not page:
+            return
+
+        items = list(page.items()) if isinstance(page, dict) else [
+            (str(index), value) for index, value in enumerate(page) if value is not None
+        ]
+
+        if last_key is not None and items and items[0][0] == last_key:
+            items = items[1:]
+
+        if not items:
+            return
+
+        for key, value in items:
+            yield key, value
+
+        last_key = str(items[-1][0])
+
+        if len(items) < page_size:
+            return
+
+
+def iter_children_by_value(
+    ref: db.Reference,
+    child: str,
+    start_at: Any,
+    end_at: Any,
+    page_size: int = 500
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Recorre por páginas los hijos cuyo campo `child` está en [start_at, end_at].
+
+    Cada página es una consulta `order_by_child(child).start_at(...).end_at(...)`
+    que continúa desde el último valor leído. Requiere `.indexOn` sobre `child`
+    en las reglas de la base de datos. Es seguro borrar los hijos ya
+    devueltos mientras se recorre.
+
+    Args:
+        ref: Referencia al nodo a recorrer (ej: /carts)
+        child: Campo por el que se ordena (ej: "updated_at")
+        start_at: Valor mínimo (inclusivo)
+        end_at: Valor máximo (inclusivo)
+        page_size: Número de hijos por petición
+
+    Yields:
+        Tuple[str, Any]: Pares (clave, valor) en orden del campo
+    """
+    cursor = start_at
+    # Claves ya devueltas con el valor del cursor (start_at es inclusivo)
+    seen_at_cursor = set()
+
+    while True:
+        limit = page_size + len(seen_at_cursor)
+        page = as_dict(
+            ref.order_by_child(child)
+            .start_at(cursor)
+            .end_at(end_at)
+            .limit_to_first(limit)
+            .get()
+        )
+        items = [(key, value) for key, value in page.items() if key not in seen_at_cursor]
+        if not items:
+            return
+
+        items.sort(key=lambda item: (item[1].get(child), item[0]))
+        for key, value in items:
+            yield key, value
+
+        last_value = items[-1][1].get(child)
+        if last_value != cursor:
+            cursor, seen_at_cursor = last_value, set()
+        seen_at_cursor.update(key for key, value in items if value.get(child) == cursor)
+
+        if len(page) < limit:
+            return
@@ -0,0 +1,144 @@
+"""
+Tabla de códigos postales de España -> provincia y comunidad autónoma.
+
+Los dos primeros dígitos de un código postal español son el código INE de la
+provincia (01-52), así que la búsqueda es un acceso directo a un array indexado
+por ese prefijo, sin diccionarios ni recorridos.
+"""
+
+from typing import Any, NamedTuple, Optional
+
+
+class Region(NamedTuple):
+    """Comunidad o ciudad autónoma."""
+    slug: str           # Clave estable para Firebase
+    name: str           # Nombre para mostrar
+    lat: float          # Coordenadas aproximadas de la capital (para el mapa)
+    lon: float
+
+
+class Province(NamedTuple):
+    """Provincia y la comunidad a la que pertenece (índice en REGIONS)."""
+    name: str
+    region: int
+
+
+REGIONS = (
+    Region("andalucia", "Andalucía", 37.3891, -5.9845),                 # 0
+    Region("aragon", "Aragón", 41.6488, -0.8891),                       # 1
+    Region("asturias", "Asturias", 43.3614, -5.8593),                   # 2
+    Region("baleares", "Illes Balears", 39.5696, 2.6502),               # 3
+    Region("canarias", "Canarias", 28.2916, -16.6291),                  # 4
+    Region("cantabria", "Cantabria", 43.4623, -3.8100),                 # 5
+    Region("castilla-la-mancha", "Castilla-La Mancha", 39.8628, -4.0273),  # 6
+    Region("castilla-y-leon", "Castilla y León", 41.6523, -4.7245),     # 7
+    Region("cataluna", "Cataluña", 41.3851, 2.1734),                    # 8
+    Region("valencia", "Comunitat Valenciana", 39.4699, -0.3763),       # 9
+    Region("extremadura", "Extremadura", 38.9161, -6.3437),             # 10
+    Region("galicia", "Galicia", 42.8782, -8.5448),                     # 11
+    Region("madrid", "Madrid", 40.4168, -3.7038),                       # 12
+    Region("murcia", "Murcia", 37.9922, -1.1307),                       # 13
+    Region("navarra", "Navarra", 42.8125, -1.6458),                     # 14
+    Region("pais-vasco", "País Vasco", 43.2630, -2.9350),               # 15
+    Region("la-rioja", "La Rioja", 42.4627, -2.4450),                   # 16
+    Region("ceuta", "Ceuta", 35.8894, -5.3213),                         # 17
+    Region("melilla", "Melilla", 35.2923, -2.9381),                     # 18
+)
+
+# Índice = prefijo del código postal (código INE de provincia)
+PROVINCES = (
+    None,                                       # 00 (no existe)
+    Province("Álava", 15),                      # 01
+    Province("Albacete", 6),                    # 02
+    Province("Alicante", 9),                    # 03
+    Province("Almería", 0),                     # 04
+    Province("Ávila", 7),                       # 05
+    Province("Badajoz", 10),                    # 06
+    Province("Illes Balears", 3),               # 07
+    Province("Barcelona", 8),                   # 08
+    Province("Burgos", 7),                      # 09
+    Province("Cáceres", 10),                    # 10
+    Province("Cádiz", 0),                       # 11
+    Province("Castellón", 9),                   # 12
+    Province("Ciudad Real", 6),                 # 13
+    Province("Córdoba", 0),                     # 14
+    Province("A Coruña", 11),                   # 15
+    Province("Cuenca", 6),                      # 16
+    Province("Girona", 8),                      # 17
+    Province("Granada", 0),                     # 18
+    Province("Guadalajara", 6),                 # 19
+    Province("Gipuzkoa", 15),                   # 20
+    Province("Huelva", 0),                      # 21
+    Province("Huesca", 1),                      # 22
+    Province("Jaén", 0),                        # 23
+    Province("León", 7),                        # 24
+    Province("Lleida", 8),                      # 25
+    Province("La Rioja", 16),                   # 26
+    Province("Lugo", 11),                       # 27
+    Province("Madrid", 12),                     # 28
+    Province("Málaga", 0),                      # 29
+    Province("Murcia", 13),                     # 30
+    Province("Navarra", 14),                    # 31
+    Province("Ourense", 11),                    # 32
+    Province("Asturias", 2),                    # 33
+    Province("Palencia", 7),                    # 34
+    Province("Las Palmas", 4),                  # 35
+    Province("Pontevedra", 11),                 # 36
+    Province("Salamanca", 7),                   # 37
+    Province("Santa Cruz de Tenerife", 4),      # 38
+    Province("Cantabria", 5),                   # 39
+    Province("Segovia", 7),                     # 40
+    Province("Sevilla", 0),                     # 41
+    Province("Soria", 7),                       # 42
+    Province("Tarragona", 8),                   # 43
+    Province("Teruel", 1),                      # 44
+    Province("Toledo", 6),                      # 45
+    Province("Valencia", 9),                    # 46
+    Province("Valladolid", 7),                  # 47
+    Province("Bizkaia", 15),                    # 48
+    Province("Zamora", 7),                      # 49
+    Province("Zaragoza", 1),                    # 50
+    Province("Ceuta", 17),                      # 51
+    Province("Melilla", 18),                    # 52
+)
+
+# Comunidad para códigos postales vacíos, extranjeros o inválidos
+UNKNOWN_REGION = Region("otros", "Otros / desconocido", 0.0, 0.0)
+
+
+def lookup_province(postal_code: Any) -> Optional[Province]:
+    """
+    Obtiene la provincia de un código postal español.
+
+    Args:
+        postal_code: Código postal (str o int, ej: "28001", 8001)
+
+    Returns:
+        Optional[Province]: Provincia o None si el código no es válido
+    """
+    code = str(postal_code or "").strip().replace(" ", "")
+    if code.isdigit() and len(code) == 4:
+        code = "0" + code       # Códigos guardados como número pierden el 0 inicial
+    if len(code) != 5 or not code.isdigit():
+        return None
+
+    prefix = int(code[:2])
+    if prefix >= len(PROVINCES):
+        return None
+    return PROVINCES[prefix]
+
+
+def lookup_region(postal_code: Any) -> Region:
+    """
+    Obtiene la comunidad autónoma de un código postal español.
+
+    Args:
+        postal_code: Código postal (str o int)
+
+    Returns:
+        Region: Comunidad autónoma o UNKNOWN_REGION si no se reconoce
+    """
+    province = lookup_province(postal_code)
+    if province is None:
+        return UNKNOWN_REGION
+    return REGIONS[province.region]
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark de serialización JSON (backend/utils/fast_json.py).
+
+Compara la librería estándar y el camino por defecto de FastAPI con la capa
+rápida, sobre listas de N pedidos sintéticos (--sizes):
+
+    encode.dicts.json        json.dumps de los pedidos como dicts (JSONResponse de Starlette)
+    encode.dicts.fast        fast_json.dumps
+    encode.models.fastapi    jsonable_encoder + JSONResponse (respuesta por defecto de FastAPI)
+    encode.models.model_dump model_dump(mode="json") + json.dumps
+    encode.models.fast       fast_json.dump_model (sin dicts intermedios)
+    decode.json              json.loads del cuerpo
+    decode.fast              fast_json.loads
+    load.catalog.json        json.load de un catálogo de N productos con el formato de BBDD.json
+    load.catalog.fast        fast_json.load_file
+
+Cada medida es la mediana de --repeat muestras (ver microbench.measure). La
+columna "× json" es la mejora frente a la variante de referencia de su grupo.
+
+Uso:
+    python benchmarks/bench_json.py                            # 100, 1000 y 10000 pedidos
+    python benchmarks/bench_json.py --sizes=50000 --repeat=5
+    python benchmarks/bench_json.py --filter=encode.models
+    python benchmarks/bench_json.py --json=json-main.json
+    python benchmarks/bench_json.py --compare=json-main.json --tolerance=0.1
+"""
+
+import json
+import platform
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Agregar la raíz del proyecto al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from backend.services.order_service import OrderService
+from backend.utils import fast_json
+from benchmarks.generate_dataset import DatasetGenerator
+from benchmarks.microbench import compare, git_commit, measure
+
+DEFAULT_SIZES = [100, 1000, 10000]
+
+# Variante de referencia de cada grupo (para la columna "× json")
+REFERENCES = {
+    "encode.dicts": "encode.dicts.json",
+    "encode.models": "encode.models.fastapi",
+    "decode": "decode.json",
+    "load.catalog": "load.catalog.json",
+}
+
+
+def benchmarks(size: int, seed: int, workdir: Path) -> Dict[str, Callable[[], Any]]:
+    """
+    Prepara las operaciones a medir para `size` pedidos (y productos).
+
+    Returns:
+        Dict[str, Callable[[], Any]]: nombre -> función sin argumentos
+    """
+    generator = DatasetGenerator(products=size, users=max(size // 10, 1), orders=size, carts=0, seed=seed)
+    raw_orders = [order for _, order in generator.orders()]
+    models = [OrderService._build_order(order) for order in raw_orders]
+    dicts = [model.model_dump(mode="json") for model in models]
+    body = fast_json.dumps(dicts)
+
+    catalog_file = workdir / f"catalog-{size}.json"
+    catalog_file.write_bytes(fast_json.dumps({
+        "products": generator.catalog(),
+        "categories": generator.categories,
+        "leagues": generator.leagues,
+    }))
+
+    def load_catalog_stdlib():
+        with open(catalog_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    return {
+        "encode.dicts.json": lambda: JSONResponse(dicts).body,
+        "encode.dicts.fast": lambda: fast_json.dumps(dicts),
+        "encode.models.fastapi": lambda: JSONResponse(jsonable_encoder(models)).body,
+        "encode.models.model_dump": lambda: json.dumps([model.model_dump(mode="json") for model in models]).encode(),
+        "encode.models.fast": lambda: fast_json.dump_model(models),
+        "decode.json": lambda: json.loads(body),
+        "decode.fast": lambda: fast_json.loads(body),
+        "load.catalog.json": load_catalog_stdlib,
+        "load.catalog.fast": lambda: fast_json.load_file(catalog_file),
+    }
+
+
+def run(sizes: List[int], repeat: int, min_time: float, seed: int, name_filter: str) -> List[Dict[str, Any]]:
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            for name, operation in benchmarks(size, seed, Path(workdir)).items():
+                if name_filter and name_filter not in name:
+                    continue
+                results.append({"name": name, "size": size, **measure(operation, repeat, min_time)})
+    return results
+
+
+def main():
+    """Función principal."""
+    options = {"sizes": ",".join(map(str, DEFAULT_SIZES)), "repeat": "7", "min-time": "0.1", "seed": "42",
+               "filter": "", "json": "", "compare": "", "tolerance": "0.1"}
+    for arg in sys.argv[1:]:
+        for name in options:
+            if arg.startswith(f"--{name}="):
+                options[name] = arg.split('=', 1)[1]
+
+    sizes = [int(value) for value in options["sizes"].split(',')]
+    backend = "orjson" if fast_json.ORJSON_AVAILABLE else "json (orjson no instalado)"
+    print(f"⏱️  Serialización JSON (pedidos {sizes}, {options['repeat']} muestras, capa rápida: {backend})")
+    results = run(sizes, int(options["repeat"]), float(options["min-time"]), int(options["seed"]), options["filter"])
+
+    reference = {(row["name"], row["size"]): row["median_us"] for row in results}
+    print(f"\n   {'operación':<26} {'n':>7} {'mediana ms':>11} {'mín ms':>9} {'× json':>7}")
+    for row in results:
+        group = row["name"].rsplit('.', 1)[0]
+        base = reference.get((REFERENCES.get(group), row["size"]))
+        speedup = f"{base / row['median_us']:.1f}x" if base else ""
+        print(f"   {row['name']:<26} {row['size']:>7} {row['median_us'] / 1000:>11.2f} "
+              f"{row['min_us'] / 1000:>9.2f} {speedup:>7}")
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "orjson": fast_json.ORJSON_AVAILABLE,
+        "seed": int(options["seed"]),
+        "repeat": int(options["repeat"]),
+        "results": results,
+    }
+    if options["json"]:
+        Path(options["json"]).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        print(f"\n💾 Resultados guardados en {options['json']}")
+
+    if options["compare"]:
+        baseline = json.loads(Path(options["compare"]).read_text(encoding='utf-8'))
+        if not compare(results, baseline, float(options["tolerance"])):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Benchmark de los servicios contra una Realtime Database falsa con latencia.
+
+Ejecuta operaciones reales de CartService, OrderService y UserService contra
+FakeDatabase y mide, para cada latencia de red (RTT) simulada, cuántas llamadas
+hace cada operación, los bytes leídos/escritos y el tiempo total estimado
+(CPU medida + latencia simulada de cada llamada). No necesita red ni credenciales.
+
+Uso:
+    python benchmarks/bench_services.py                       # RTT 0, 20, 50 y 100 ms
+    python benchmarks/bench_services.py --rtt=30,80 --jitter=10
+    python benchmarks/bench_services.py --users=1000 --repeat=20
+    python benchmarks/bench_services.py --sleep               # Duerme la latencia de verdad
+    python benchmarks/bench_services.py --json=results.json
+"""
+
+import json
+import math
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Agregar la raíz del proyecto al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.config.firebase_config import use_database
+from backend.models.models import CartItemCreate, CartItemUpdate
+from backend.services.bestsellers_service import BestsellersService
+from backend.services.cart_service import CartService
+from backend.services.order_service import OrderService
+from backend.services.user_service import UserService
+from backend.utils.fake_rtdb import FakeDatabase
+from benchmarks.fixtures import build_dataset, load_products, make_order_create, user_email
+
+
+def scenarios(users: int, rng: random.Random) -> Dict[str, Callable[[], Any]]:
+    """Operaciones a medir: nombre -> función sin argumentos."""
+    products = load_products()
+    new_users = iter(range(users + 1, users + 1_000_000))
+
+    def any_user() -> int:
+        return rng.randint(1, users)
+
+    def add_item():
+        product = rng.choice(products)
+        item = CartItemCreate(product_id=product["id"], quantity=1, size=product["sizes"][0])
+        CartService.add_item(str(any_user()), item, product)
+
+    def create_order():
+        user_id = any_user()
+        OrderService.create_order(str(user_id), user_email(user_id), make_order_create(products, rng))
+
+    return {
+        "cart.get_cart": lambda: CartService.get_cart(str(any_user())),
+        "cart.add_item": add_item,
+        "cart.update_item": lambda: CartService.update_item(str(any_user()), 1, CartItemUpdate(quantity=2)),
+        "order.create_order": create_order,
+        "order.get_user_orders": lambda: OrderService.get_user_orders(user_email(any_user())),
+        "user.get_user_by_id": lambda: UserService.get_user_by_id(any_user()),
+        "user.authenticate_user": lambda: UserService.authenticate_user(user_email(any_user()), "secret123"),
+        "user.create_user": lambda: UserService.create_user(
+            user_email(next(new_users)), "secret123", "Nuevo", "Usuario"
+        ),
+    }
+
+
+def run(
+    rtts: List[float],
+    jitter_ms: float,
+    users: int,
+    orders_per_user: int,
+    repeat: int,
+    sleep: bool,
+    seed: int
+) -> List[Dict[str, Any]]:
+    """
+    Ejecuta todos los escenarios para cada RTT.
+
+    Returns:
+        List[Dict[str, Any]]: Un resultado por (RTT, operación) con llamadas,
+            bytes y tiempos medios por operación
+    """
+    dataset = build_dataset(users=users, orders_per_user=orders_per_user, seed=seed)
+    results = []
+
+    for rtt in rtts:
+        fake = FakeDatabase(dataset, latency_ms=rtt, jitter_ms=jitter_ms, seed=seed, sleep=sleep)
+        use_database(fake)
+        rng = random.Random(seed)
+
+        try:
+            for name, operation in scenarios(users, rng).items():
+                totals = []
+                cpu_times = []
+                summaries = []
+                for _ in range(repeat):
+                    fake.reset_calls()
+                    started = time.perf_counter()
+                    operation()
+                    elapsed = time.perf_counter() - started
+                    summary = fake.summary()
+                    summaries.append(summary)
+                    # Si no se duerme, la latencia simulada se suma al tiempo medido
+                    cpu = elapsed if not sleep else max(0.0, elapsed - summary["latency_seconds"])
+                    cpu_times.append(cpu)
+                    totals.append(elapsed if sleep else elapsed + summary["latency_seconds"])
+
+                results.append({
+                    "rtt_ms": rtt,
+                    "operation": name,
+                    "calls": statistics.mean(s["calls"] for s in summaries),
+                    "reads": statistics.mean(s["reads"] for s in summaries),
+                    "writes": statistics.mean(s["writes"] for s in summaries),
+                    "read_bytes": statistics.mean(s["read_bytes"] for s in summaries),
+                    "write_bytes": statistics.mean(s["write_bytes"] for s in summaries),
+                    "cpu_ms": statistics.mean(cpu_times) * 1000,
+                    "total_ms": statistics.mean(totals) * 1000,
+                    "p95_ms": sorted(totals)[math.ceil(len(totals) * 0.95) - 1] * 1000,
+                })
+
+            # Volcar el top de ventas pendiente mientras la base falsa sigue activa
+            BestsellersService.flush()
+        finally:
+            use_database(None)
+
+    return results
+
+
+def print_table(results: List[Dict[str, Any]]):
+    """Muestra los resultados agrupados por RTT."""
+    current_rtt = None
+    for row in results:
+        if row["rtt_ms"] != current_rtt:
+            current_rtt = row["rtt_ms"]
+            print(f"\n🌐 RTT {current_rtt:g} ms")
+            print(f"   {'operación':<24} {'llamadas':>8} {'lect.':>6} {'escr.':>6} {'KB leídos':>10} {'CPU ms':>8} {'total ms':>9} {'p95 ms':>8}")
+        print(
+            f"   {row['operation']:<24} {row['calls']:>8.1f} {row['reads']:>6.1f} {row['writes']:>6.1f} "
+            f"{row['read_bytes'] / 1024:>10.1f} {row['cpu_ms']:>8.2f} {row['total_ms']:>9.1f} {row['p95_ms']:>8.1f}"
+        )
+
+
+def main():
+    """Función principal."""
+    options = {"rtt": "0,20,50,100", "jitter": "0", "users": "200", "orders": "5", "repeat": "10", "seed": "42", "json": ""}
+    for arg in sys.argv[1:]:
+        for name in options:
+            if arg.startswith(f"--{name}="):
+                options[name] = arg.split('=', 1)[1]
+
+    rtts = [float(value) for value in options["rtt"].split(',') if value]
+    print(f"⏱️  Benchmark de servicios: {options['users']} usuarios, {options['orders']} pedidos/usuario, "
+          f"{options['repeat']} repeticiones por operación")
+
+    results = run(
+        rtts=rtts,
+        jitter_ms=float(options["jitter"]),
+        users=int(options["users"]),
+        orders_per_user=int(options["orders"]),
+        repeat=int(options["repeat"]),
+        sleep='--sleep' in sys.argv,
+        seed=int(options["seed"]),
+    )
+    print_table(results)
+
+    if options["json"]:
+        with open(options["json"], 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Resultados guardados en {options['json']}")
+
+
+if __name__ == "__main__":
+    main()
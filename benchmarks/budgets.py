@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Presupuestos de llamadas a la base de datos por operación de servicio.
+
+Cada operación se ejecuta contra FakeDatabase con un conjunto de datos fijo y
+se cuentan sus llamadas, lecturas, escrituras y bytes. budgets.json guarda el
+máximo permitido de cada métrica; test_round_trip_budgets.py falla si una
+operación lo supera (por ejemplo, si aparece una consulta N+1).
+
+Uso:
+    python benchmarks/budgets.py              # Compara las medidas con budgets.json
+    python benchmarks/budgets.py --update     # Reescribe budgets.json con las medidas actuales
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+# Agregar la raíz del proyecto al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.config.firebase_config import use_database
+from backend.models.models import CartItemCreate, CartItemUpdate, OrderStatusEnum
+from backend.services.bestsellers_service import BestsellersService
+from backend.services.cart_service import CartService
+from backend.services.order_service import OrderService
+from backend.services.user_service import UserService
+from backend.utils.fake_rtdb import FakeDatabase
+from benchmarks.fixtures import build_dataset, load_products, make_order_create, user_email
+
+BUDGETS_FILE = Path(__file__).parent / "budgets.json"
+
+METRICS = ("calls", "reads", "writes", "read_bytes", "write_bytes")
+
+# Margen sobre los bytes medidos al reescribir los presupuestos (las llamadas son exactas)
+BYTES_HEADROOM = 1.25
+
+# Conjunto de datos de las medidas: con N líneas de carrito y N pedidos por
+# usuario, una operación 1+N se distingue de una de coste constante
+DATASET = {"users": 20, "orders_per_user": 5, "cart_items": 5, "seed": 1}
+
+
+def operations(dataset: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+    """Operaciones con presupuesto: nombre -> función sin argumentos."""
+    products = load_products()
+    product = products[0]
+    order_id = next(iter(dataset["orders"]))
+    new_user_id = len(dataset["users"]) + 1
+
+    return {
+        "cart.get_cart": lambda: CartService.get_cart("1"),
+        "cart.get_cart_count": lambda: CartService.get_cart_count("1"),
+        "cart.add_item": lambda: CartService.add_item(
+            "1", CartItemCreate(product_id=product["id"], quantity=1, size=product["sizes"][0]), product
+        ),
+        "cart.update_item": lambda: CartService.update_item("1", 1, CartItemUpdate(quantity=2)),
+        "cart.remove_item": lambda: CartService.remove_item("1", 1),
+        "order.create_order": lambda: OrderService.create_order(
+            "1", user_email(1), make_order_create(products, random.Random(1))
+        ),
+        "order.get_order": lambda: OrderService.get_order(order_id),
+        "order.get_user_orders": lambda: OrderService.get_user_orders(user_email(1)),
+        "order.update_order_status": lambda: OrderService.update_order_status(order_id, OrderStatusEnum.SHIPPED),
+        "user.create_user": lambda: UserService.create_user(user_email(new_user_id), "secret123", "Nuevo", "Usuario"),
+        "user.authenticate_user": lambda: UserService.authenticate_user(user_email(1), "secret123"),
+        "user.get_user_by_id": lambda: UserService.get_user_by_id(1),
+        "user.get_user_by_email": lambda: UserService.get_user_by_email(user_email(1)),
+        "user.update_user": lambda: UserService.update_user(1, nombre="Renombrado"),
+    }
+
+
+def measure_all() -> Dict[str, Dict[str, int]]:
+    """
+    Mide cada operación sobre una copia limpia del conjunto de datos.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Métricas de METRICS por operación
+    """
+    dataset = build_dataset(**DATASET)
+    measured = {}
+
+    for name in operations(dataset):
+        fake = FakeDatabase(dataset)
+        use_database(fake)
+        try:
+            # Vaciar el top de ventas pendiente para que no se vuelque dentro de la medida
+            BestsellersService.flush()
+            fake.reset_calls()
+            operations(dataset)[name]()
+            summary = fake.summary()
+        finally:
+            use_database(None)
+        measured[name] = {metric: summary[metric] for metric in METRICS}
+
+    return measured
+
+
+def load_budgets() -> Dict[str, Dict[str, int]]:
+    """Presupuestos guardados en budgets.json."""
+    with open(BUDGETS_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def over_budget(measured: Dict[str, int], budget: Dict[str, int]) -> Dict[str, tuple]:
+    """Métricas que superan el presupuesto: métrica -> (medido, presupuesto)."""
+    return {
+        metric: (measured[metric], limit)
+        for metric, limit in budget.items()
+        if measured.get(metric, 0) > limit
+    }
+
+
+def main():
+    """Función principal."""
+    measured = measure_all()
+
+    if '--update' in sys.argv:
+        budgets = {
+            name: {
+                metric: int(values[metric] * BYTES_HEADROOM) if metric.endswith('_bytes') else values[metric]
+                for metric in METRICS
+            }
+            for name, values in measured.items()
+        }
+        with open(BUDGETS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(budgets, f, indent=2)
+            f.write("\n")
+        print(f"💾 Presupuestos actualizados en {BUDGETS_FILE}")
+        return
+
+    budgets = load_budgets()
+    failed = False
+    for name, values in measured.items():
+        budget = budgets.get(name)
+        if budget is None:
+            print(f"⚠️  {name}: sin presupuesto")
+            failed = True
+            continue
+        exceeded = over_budget(values, budget)
+        icon = "❌" if exceeded else "✅"
+        print(f"{icon} {name}: {values['calls']} llamadas ({values['reads']} lect., {values['writes']} escr.), "
+              f"{values['read_bytes']} B leídos, {values['write_bytes']} B escritos")
+        for metric, (value, limit) in exceeded.items():
+            print(f"      {metric}: {value} > {limit}")
+        failed = failed or bool(exceeded)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
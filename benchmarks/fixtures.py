@@ -0,0 +1,145 @@
+"""
+Datos de prueba para los benchmarks: catálogo real de data/BBDD.json más
+usuarios, carritos y pedidos sintéticos con el formato que escriben los servicios.
+"""
+
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+
+from backend.models.models import OrderCreate, OrderItem, ShippingAddress
+
+DATA_FILE = Path(__file__).parent.parent / "data" / "BBDD.json"
+
+
+def load_products() -> List[Dict[str, Any]]:
+    """Productos del catálogo de data/BBDD.json."""
+    with open(DATA_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)['products']
+
+
+def user_email(user_id: int) -> str:
+    return f"user{user_id}@example.com"
+
+
+def make_user(user_id: int) -> Dict[str, Any]:
+    """Usuario con los campos que guarda UserService.create_user."""
+    return {
+        "id": user_id,
+        "email": user_email(user_id),
+        "password": "secret123",
+        "nombre": f"Usuario{user_id}",
+        "apellidos": "Benchmark",
+        "telefono": "",
+        "foto_perfil": "",
+        "fecha_registro": "2025-01-01T00:00:00",
+        "puntos_fidelizacion": 0,
+        "es_admin": False,
+        "activo": True,
+    }
+
+
+def make_cart(user_id: int, products: List[Dict[str, Any]], items: int, rng: random.Random) -> Dict[str, Any]:
+    """Carrito con `items` líneas (formato de CartService.add_item)."""
+    lines = {}
+    for item_id in range(1, items + 1):
+        product = rng.choice(products)
+        quantity = rng.randint(1, 3)
+        lines[str(item_id)] = {
+            "product_id": product["id"],
+            "quantity": quantity,
+            "size": rng.choice(product["sizes"]),
+            "subtotal": round(product["price"] * quantity, 2),
+            "personalization_price": 0.0,
+        }
+    return {
+        "user_email": user_email(user_id),
+        "items": lines,
+        "next_item_id": items + 1,
+        "total_items": sum(line["quantity"] for line in lines.values()),
+        "subtotal": round(sum(line["subtotal"] for line in lines.values()), 2),
+        "updated_at": datetime.utcnow().isoformat(),
+    }
+
+
+def make_order_create(products: List[Dict[str, Any]], rng: random.Random, lines: int = 2) -> OrderCreate:
+    """Datos de un pedido nuevo (lo que recibe OrderService.create_order)."""
+    items = []
+    for product in rng.sample(products, lines):
+        quantity = rng.randint(1, 2)
+        items.append(OrderItem(
+            product_id=str(product["id"]),
+            product_name=product["name"],
+            product_image=product["images"]["main"],
+            team=product["team"],
+            quantity=quantity,
+            size=rng.choice(product["sizes"]),
+            unit_price=product["price"],
+            subtotal=round(product["price"] * quantity, 2),
+        ))
+    return OrderCreate(
+        items=items,
+        shipping_address=ShippingAddress(street="Calle Mayor 1", city="Madrid", state="Madrid", postal_code="28013"),
+        payment_method="card",
+    )
+
+
+def build_dataset(
+    users: int = 100,
+    orders_per_user: int = 5,
+    cart_items: int = 5,
+    seed: int = 42
+) -> Dict[str, Any]:
+    """
+    Construye un volcado completo de la base de datos.
+
+    Args:
+        users: Número de usuarios (cada uno con su carrito)
+        orders_per_user: Pedidos por usuario
+        cart_items: Líneas en cada carrito
+        seed: Semilla para que los datos sean reproducibles
+
+    Returns:
+        Dict[str, Any]: Contenido para FakeDatabase
+    """
+    rng = random.Random(seed)
+    products = load_products()
+    start = datetime(2025, 1, 1)
+
+    data: Dict[str, Any] = {
+        "products": {str(product["id"]): product for product in products},
+        "users": {},
+        "carts": {},
+        "orders": {},
+    }
+
+    order_number = 0
+    for user_id in range(1, users + 1):
+        data["users"][str(user_id)] = make_user(user_id)
+        data["carts"][str(user_id)] = make_cart(user_id, products, cart_items, rng)
+
+        for _ in range(orders_per_user):
+            order_number += 1
+            created = (start + timedelta(minutes=order_number)).isoformat()
+            order = make_order_create(products, rng)
+            subtotal = round(sum(item.subtotal for item in order.items), 2)
+            order_id = f"ORD-{created[:10].replace('-', '')}-{order_number:026d}"
+            data["orders"][order_id] = {
+                "order_id": order_id,
+                "user_id": str(user_id),
+                "user_email": user_email(user_id),
+                "items": [item.dict() for item in order.items],
+                "subtotal": subtotal,
+                "shipping_cost": 0.0,
+                "tax": round(subtotal * 0.21, 2),
+                "total": round(subtotal * 1.21, 2),
+                "status": "pending",
+                "shipping_address": order.shipping_address.dict(),
+                "payment_method": order.payment_method,
+                "created_at": created,
+                "updated_at": created,
+            }
+
+    return data
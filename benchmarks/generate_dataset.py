@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Generador de conjuntos de datos sintéticos a gran escala.
+
+Genera productos (sobre los deportes, ligas, equipos y tallas del catálogo de
+data/BBDD.json), usuarios, carritos y pedidos con el mismo formato que escriben
+los servicios. Con la misma semilla y tamaños el resultado es idéntico, así que
+sirve como entrada reproducible para los benchmarks. Todo se genera en
+streaming: la memoria usada no depende del número de usuarios ni de pedidos
+(solo el catálogo de productos se mantiene en memoria).
+
+Uso:
+    python benchmarks/generate_dataset.py --scale=small --out=data/synthetic
+    python benchmarks/generate_dataset.py --products=100000 --users=1000000 --orders=10000000 --out=/tmp/big
+    python benchmarks/generate_dataset.py --scale=medium --format=json --out=data/synthetic
+    python benchmarks/generate_dataset.py --scale=small --target=firebase --yes
+    python benchmarks/generate_dataset.py --scale=small --seed=7 --out=data/synthetic
+
+Formatos:
+    jsonl   Un fichero por colección (products.jsonl...), una línea {"key", "value"} por elemento
+    json    Un único dataset.json con las colecciones como objetos (lo acepta
+            scripts/upload_to_firebase.py, que lo lee en streaming)
+
+Con --target=firebase se escribe directamente en la base de datos de
+get_database() en lotes multi-ruta. Después conviene ejecutar
+scripts/rebuild_aggregates.py para recalcular /stats y /timeseries.
+"""
+
+import json
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+# Agregar la raíz del proyecto al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.ids import MonotonicIdGenerator
+from backend.utils.spain_regions import PROVINCES
+
+DATA_FILE = project_root / "data" / "BBDD.json"
+
+# Tamaños predefinidos: productos, usuarios, pedidos, carritos
+SCALES = {
+    "tiny": (100, 1_000, 5_000, 200),
+    "small": (1_000, 10_000, 100_000, 2_000),
+    "medium": (10_000, 100_000, 1_000_000, 20_000),
+    "large": (100_000, 1_000_000, 10_000_000, 200_000),
+}
+
+KITS = ("Primera equipación", "Segunda equipación", "Tercera equipación", "Retro", "Entrenamiento", "Edición especial")
+
+FIRST_NAMES = (
+    "Lucía", "Hugo", "Martina", "Martín", "Sofía", "Pablo", "María", "Daniel", "Julia", "Alejandro",
+    "Paula", "Mateo", "Valeria", "Leo", "Carmen", "Álvaro", "Sara", "Manuel", "Elena", "Javier",
+)
+LAST_NAMES = (
+    "García", "Rodríguez", "González", "Fernández", "López", "Martínez", "Sánchez", "Pérez", "Gómez", "Martín",
+    "Jiménez", "Ruiz", "Hernández", "Díaz", "Moreno", "Muñoz", "Álvarez", "Romero", "Alonso", "Navarro",
+)
+STREETS = ("Calle Mayor", "Avenida de la Constitución", "Calle Real", "Plaza de España", "Calle del Sol", "Paseo Marítimo")
+PAYMENT_METHODS = ("card", "card", "card", "paypal", "bizum")
+
+# Peso de cada provincia por prefijo postal (aprox. población; el resto pesa 1)
+PROVINCE_WEIGHTS = {
+    28: 14, 8: 12, 46: 5, 41: 4, 3: 4, 29: 3.5, 30: 3, 11: 2.5, 7: 2.5,
+    48: 2.3, 15: 2.3, 35: 2.2, 38: 2.1, 33: 2, 50: 2, 36: 2,
+}
+POSTAL_PREFIXES = [prefix for prefix in range(1, len(PROVINCES)) if PROVINCES[prefix] is not None]
+PREFIX_WEIGHTS = [PROVINCE_WEIGHTS.get(prefix, 1) for prefix in POSTAL_PREFIXES]
+
+COLLECTIONS = ("categories", "leagues", "products", "users", "carts", "orders")
+
+
+class DatasetGenerator:
+    """
+    Genera las colecciones de un conjunto de datos sintético.
+
+    Cada colección usa su propio generador aleatorio sembrado con
+    "{seed}:{colección}", de modo que cambiar el tamaño de una colección no
+    altera las demás. Los pedidos y carritos solo referencian productos y
+    usuarios existentes y calculan los importes como OrderService/CartService.
+    """
+
+    def __init__(
+        self,
+        products: int = 1_000,
+        users: int = 10_000,
+        orders: int = 100_000,
+        carts: int = 2_000,
+        seed: int = 42,
+        start: datetime = datetime(2023, 1, 1),
+        end: datetime = datetime(2025, 12, 31)
+    ):
+        """
+        Args:
+            products: Número de productos
+            users: Número de usuarios (IDs 1..users)
+            orders: Número de pedidos, repartidos entre start y end
+            carts: Número de usuarios con carrito
+            seed: Semilla de todo el conjunto de datos
+            start: Fecha del primer registro de usuario y pedido
+            end: Fecha del último pedido
+        """
+        self.sizes = {"products": products, "users": users, "orders": orders, "carts": min(carts, users)}
+        self.seed = seed
+        self.start = start
+        self.end = end
+
+        with open(DATA_FILE, 'r', encoding='utf-8') as f:
+            base = json.load(f)
+        self.templates: List[Dict[str, Any]] = base["products"]
+        self.categories: List[Dict[str, Any]] = base.get("categories", [])
+        self.leagues: List[Dict[str, Any]] = base.get("leagues", [])
+
+        self._catalog: List[Dict[str, Any]] = []
+
+    def _rng(self, collection: str) -> random.Random:
+        return random.Random(f"{self.seed}:{collection}")
+
+    def collections(self) -> Dict[str, Callable[[], Iterator[Tuple[str, Any]]]]:
+        """Colección -> función que genera sus pares (clave, valor) en orden."""
+        return {
+            "categories": lambda: ((item["id"], item) for item in self.categories),
+            "leagues": lambda: ((item["id"], item) for item in self.leagues),
+            "products": self.products,
+            "users": self.users,
+            "carts": self.carts,
+            "orders": self.orders,
+        }
+
+    # ------------------------------------------------------------------
+    # Productos
+    # ------------------------------------------------------------------
+
+    def products(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Productos 1..N como variantes (equipación, temporada) de los del catálogo base."""
+        rng = self._rng("products")
+        for product_id in range(1, self.sizes["products"] + 1):
+            template = self.templates[(product_id - 1) % len(self.templates)]
+            kit = KITS[rng.randrange(len(KITS))]
+            season = rng.randint(1995, 2025)
+            price = round(template["price"] * rng.uniform(0.8, 1.3)) - 0.01
+
+            yield str(product_id), {
+                "id": product_id,
+                "name": f"{template['name']} {kit} {season}/{(season + 1) % 100:02d}",
+                "description": template["description"],
+                "price": max(price, 9.99),
+                "currency": "EUR",
+                "category": template["category"],
+                "league": template["league"],
+                "team": template["team"],
+                "images": template["images"],
+                "sizes": template["sizes"],
+                "stock": {size: rng.randint(0, 40) for size in template["sizes"]},
+                "featured": rng.random() < 0.05,
+                "active": rng.random() < 0.95,
+            }
+
+    def catalog(self) -> List[Dict[str, Any]]:
+        """Productos generados (se calculan una vez; los usan carritos y pedidos)."""
+        if not self._catalog:
+            self._catalog = [product for _, product in self.products()]
+        return self._catalog
+
+    def _pick_product(self, rng: random.Random) -> Dict[str, Any]:
+        """Producto con popularidad sesgada (unos pocos productos concentran las ventas)."""
+        catalog = self.catalog()
+        return catalog[int(len(catalog) * rng.random() ** 3)]
+
+    # ------------------------------------------------------------------
+    # Usuarios
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def user_email(user_id: int) -> str:
+        return f"user{user_id}@example.com"
+
+    def users(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Usuarios 1..N registrados en orden entre start y end."""
+        rng = self._rng("users")
+        total = self.sizes["users"]
+        span = (self.end - self.start).total_seconds()
+
+        for user_id in range(1, total + 1):
+            registered = self.start + timedelta(seconds=span * (user_id - 1 + rng.random()) / total)
+            yield str(user_id), {
+                "id": user_id,
+                "email": self.user_email(user_id),
+                "password": f"pass{user_id}",
+                "nombre": FIRST_NAMES[rng.randrange(len(FIRST_NAMES))],
+                "apellidos": f"{LAST_NAMES[rng.randrange(len(LAST_NAMES))]} {LAST_NAMES[rng.randrange(len(LAST_NAMES))]}",
+                "telefono": f"+34 6{rng.randint(0, 99_999_999):08d}",
+                "foto_perfil": "",
+                "fecha_registro": registered.isoformat(),
+                "puntos_fidelizacion": rng.randint(0, 500),
+                "es_admin": False,
+                "activo": rng.random() < 0.97,
+                "direccion_envio": self._address(rng),
+            }
+
+    def _address(self, rng: random.Random) -> Dict[str, Any]:
+        """Dirección de envío en una provincia ponderada por población."""
+        prefix = rng.choices(POSTAL_PREFIXES, PREFIX_WEIGHTS)[0]
+        province = PROVINCES[prefix].name
+        return {
+            "street": f"{STREETS[rng.randrange(len(STREETS))]} {rng.randint(1, 150)}",
+            "city": province,
+            "state": province,
+            "postal_code": f"{prefix:02d}{rng.randint(0, 999):03d}",
+            "country": "España",
+        }
+
+    # ------------------------------------------------------------------
+    # Carritos
+    # ------------------------------------------------------------------
+
+    def carts(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Carritos de una muestra de usuarios, con updated_at en los 90 días
+        anteriores a end (los más antiguos son candidatos del barrido de abandonados).
+        """
+        rng = self._rng("carts")
+        user_ids = sorted(rng.sample(range(1, self.sizes["users"] + 1), self.sizes["carts"]))
+
+        for user_id in user_ids:
+            items = {}
+            for item_id in range(1, rng.randint(1, 6) + 1):
+                product = self._pick_product(rng)
+                quantity = rng.randint(1, 3)
+                personalization = self._personalization(rng)
+                personalization_price = 10.0 if personalization else 0.0
+                items[str(item_id)] = {
+                    "product_id": product["id"],
+                    "quantity": quantity,
+                    "size": product["sizes"][rng.randrange(len(product["sizes"]))],
+                    "subtotal": round((product["price"] + personalization_price) * quantity, 2),
+                    "personalization_price": personalization_price,
+                    "personalization": personalization,
+                }
+
+            updated = self.end - timedelta(seconds=rng.uniform(0, 90 * 86400))
+            yield str(user_id), {
+                "user_email": self.user_email(user_id),
+                "items": items,
+                "next_item_id": len(items) + 1,
+                "total_items": sum(item["quantity"] for item in items.values()),
+                "subtotal": round(sum(item["subtotal"] for item in items.values()), 2),
+                "updated_at": updated.isoformat(),
+            }
+
+    @staticmethod
+    def _personalization(rng: random.Random):
+        if rng.random() >= 0.15:
+            return None
+        return {"nombre": LAST_NAMES[rng.randrange(len(LAST_NAMES))].upper()[:15], "numero": rng.randint(0, 99)}
+
+    # ------------------------------------------------------------------
+    # Pedidos
+    # ------------------------------------------------------------------
+
+    def _status(self, rng: random.Random, created: datetime) -> str:
+        """Estado según la antigüedad del pedido respecto a end."""
+        if rng.random() < 0.04:
+            return "cancelled"
+        age_days = (self.end - created).days
+        if age_days > 10:
+            return "delivered"
+        if age_days > 3:
+            return rng.choice(("shipped", "delivered"))
+        return rng.choice(("pending", "processing", "shipped"))
+
+    def orders(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Pedidos en orden cronológico (y por tanto de clave) entre start y end."""
+        rng = self._rng("orders")
+        ids = MonotonicIdGenerator("ORD")
+        total = self.sizes["orders"]
+        users = self.sizes["users"]
+        span = (self.end - self.start).total_seconds()
+
+        for index in range(total):
+            created = self.start + timedelta(seconds=span * (index + rng.random()) / total)
+            order_id = ids.from_parts(created, rng.getrandbits(80))
+            # Usuarios sesgados: una minoría hace la mayoría de pedidos
+            user_id = int(users * rng.random() ** 2) + 1
+
+            items = []
+            for _ in range(rng.choices((1, 2, 3, 4), (55, 28, 12, 5))[0]):
+                product = self._pick_product(rng)
+                quantity = rng.choices((1, 2, 3), (80, 15, 5))[0]
+                personalization = self._personalization(rng)
+                personalization_price = 10.0 if personalization else 0.0
+                items.append({
+                    "product_id": str(product["id"]),
+                    "product_name": product["name"],
+                    "product_image": product["images"]["main"],
+                    "team": product["team"],
+                    "quantity": quantity,
+                    "size": product["sizes"][rng.randrange(len(product["sizes"]))],
+                    "unit_price": product["price"],
+                    "personalization_price": personalization_price,
+                    "personalization": personalization,
+                    "subtotal": round((product["price"] + personalization_price) * quantity, 2),
+                })
+
+            # Mismos cálculos que OrderService.create_order
+            subtotal = sum(item["subtotal"] for item in items)
+            shipping_cost = 0.0 if subtotal >= 50 else 5.0
+            tax = round((subtotal + shipping_cost) * 0.21, 2)
+            status = self._status(rng, created)
+            updated = created if status == "pending" else created + timedelta(hours=rng.uniform(1, 96))
+
+            yield order_id, {
+                "order_id": order_id,
+                "user_id": str(user_id),
+                "user_email": self.user_email(user_id),
+                "items": items,
+                "subtotal": subtotal,
+                "shipping_cost": shipping_cost,
+                "tax": tax,
+                "total": round(subtotal + shipping_cost + tax, 2),
+                "status": status,
+                "shipping_address": self._address(rng),
+                "payment_method": PAYMENT_METHODS[rng.randrange(len(PAYMENT_METHODS))],
+                "created_at": created.isoformat(),
+                "updated_at": min(updated, self.end).isoformat(),
+            }
+
+
+# ----------------------------------------------------------------------
+# Salidas
+# ----------------------------------------------------------------------
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_jsonl(generator: DatasetGenerator, out_dir: Path, progress: Callable[[str, int], None]):
+    """Escribe un fichero {colección}.jsonl por colección."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for name, items in generator.collections().items():
+        with open(out_dir / f"{name}.jsonl", 'w', encoding='utf-8') as f:
+            for count, (key, value) in enumerate(items(), 1):
+                f.write(_dumps({"key": key, "value": value}))
+                f.write("\n")
+                progress(name, count)
+
+
+def write_json(generator: DatasetGenerator, out_dir: Path, progress: Callable[[str, int], None]):
+    """Escribe dataset.json con las colecciones como objetos, sin tenerlas en memoria."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with open(out_dir / "dataset.json", 'w', encoding='utf-8') as f:
+        f.write("{")
+        for position, (name, items) in enumerate(generator.collections().items()):
+            f.write(("," if position else "") + f"\n{_dumps(name)}:{{")
+            for count, (key, value) in enumerate(items(), 1):
+                f.write(("," if count > 1 else "") + f"\n{_dumps(key)}:{_dumps(value)}")
+                progress(name, count)
+            f.write("}")
+        f.write("\n}\n")
+
+
+def write_database(
+    generator: DatasetGenerator,
+    progress: Callable[[str, int], None],
+    batch_size: int = 500,
+    workers: int = 4
+):
+    """Escribe las colecciones en get_database() con escrituras multi-ruta en paralelo."""
+    from backend.config.firebase_config import get_database
+    from backend.utils.retry import call_with_retries
+
+    database = get_database()
+    in_flight = set()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for name, items in generator.collections().items():
+            batch: Dict[str, Any] = {}
+            for count, (key, value) in enumerate(items(), 1):
+                batch[f"{name}/{key}"] = value
+                if len(batch) >= batch_size:
+                    in_flight.add(pool.submit(call_with_retries, lambda updates=batch: database.update(updates)))
+                    batch = {}
+                    if len(in_flight) >= workers * 2:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                progress(name, count)
+            if batch:
+                in_flight.add(pool.submit(call_with_retries, lambda updates=batch: database.update(updates)))
+
+        for future in wait(in_flight)[0]:
+            future.result()
+
+
+def main():
+    """Función principal."""
+    options = {"scale": "", "products": "", "users": "", "orders": "", "carts": "",
+               "seed": "42", "out": "data/synthetic", "format": "jsonl", "target": "file"}
+    for arg in sys.argv[1:]:
+        for name in options:
+            if arg.startswith(f"--{name}="):
+                options[name] = arg.split('=', 1)[1]
+
+    products, users, orders, carts = SCALES.get(options["scale"] or "small", SCALES["small"])
+    generator = DatasetGenerator(
+        products=int(options["products"] or products),
+        users=int(options["users"] or users),
+        orders=int(options["orders"] or orders),
+        carts=int(options["carts"] or carts),
+        seed=int(options["seed"]),
+    )
+    sizes = generator.sizes
+    print(f"🎲 Generando {sizes['products']:,} productos, {sizes['users']:,} usuarios, "
+          f"{sizes['orders']:,} pedidos y {sizes['carts']:,} carritos (semilla {generator.seed})")
+
+    started = time.monotonic()
+    last_report = [started]
+
+    def progress(name: str, count: int):
+        now = time.monotonic()
+        if now - last_report[0] >= 2.0:
+            print(f"   ⏱️  {name}: {count:,} · {now - started:.0f}s")
+            last_report[0] = now
+
+    try:
+        if options["target"] == "firebase":
+            if '--yes' not in sys.argv:
+                response = input("\n⚠️  Se escribirá en la base de datos configurada. ¿Continuar? (sí/no): ").lower()
+                if response not in ['sí', 'si', 's', 'yes', 'y']:
+                    print("❌ Operación cancelada")
+                    return
+            write_database(generator, progress)
+            print("💡 Ejecuta scripts/rebuild_aggregates.py para recalcular las estadísticas")
+        elif options["format"] == "json":
+            write_json(generator, Path(options["out"]), progress)
+        else:
+            write_jsonl(generator, Path(options["out"]), progress)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+    destination = "la base de datos" if options["target"] == "firebase" else options["out"]
+    print(f"✅ Conjunto de datos generado en {destination} ({time.monotonic() - started:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Tiempo de importación del frontend de Streamlit (arranque en frío).
+
+Cada muestra se toma en un intérprete nuevo, como el primer rerun de una
+sesión tras arrancar el servidor. Solo se cronometra la importación de los
+módulos del escenario. Los módulos de `preload` se importan antes, fuera de la
+medida:
+
+    startup          main.py: lo que se carga antes de pintar la primera página
+    all_pages        main.py más el navbar y las ocho páginas (el arranque
+                     cuando main.py las importaba todas)
+    page.<clave>     primera visita a una página, con main.py ya cargado
+
+Con --detail=<escenario> se ejecuta el escenario una vez con `python -X
+importtime` y se listan los módulos que más tardan (tiempo propio, sin contar
+sus dependencias).
+
+Uso:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat=9 --filter=page.
+    python benchmarks/import_time.py --detail=page.admin --top=20
+    python benchmarks/import_time.py --json=imports-main.json
+    python benchmarks/import_time.py --compare=imports-main.json --tolerance=0.2
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Agregar la raíz del proyecto al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.microbench import git_commit
+
+FRONTEND_DIR = project_root / "frontend"
+
+PAGE_KEYS = ["home", "catalog", "product_detail", "cart", "checkout", "order_confirmation", "account", "admin"]
+
+# nombre -> (módulos importados antes de medir, módulos medidos)
+SCENARIOS: Dict[str, Tuple[List[str], List[str]]] = {
+    "startup": ([], ["main"]),
+    "all_pages": ([], ["main", "components.navbar"] + [f"pages.{key}" for key in PAGE_KEYS]),
+    **{f"page.{key}": (["main"], [f"pages.{key}"]) for key in PAGE_KEYS},
+}
+
+# Se ejecuta en el intérprete nuevo (desde frontend/, como `streamlit run main.py`)
+CHILD = """
+import importlib, json, sys, time
+sys.path[:0] = [{frontend!r}, {root!r}]
+for name in {preload!r}:
+    importlib.import_module(name)
+sys.stderr.write("import-time: start\\n")
+sys.stderr.flush()
+before = len(sys.modules)
+started = time.perf_counter()
+for name in {modules!r}:
+    importlib.import_module(name)
+print(json.dumps({{"seconds": time.perf_counter() - started, "modules": len(sys.modules) - before}}))
+"""
+
+
+def run_child(preload: List[str], modules: List[str], importtime: bool = False) -> subprocess.CompletedProcess:
+    code = CHILD.format(frontend=str(FRONTEND_DIR), root=str(project_root), preload=preload, modules=modules)
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    return subprocess.run(command, cwd=FRONTEND_DIR, capture_output=True, text=True)
+
+
+def last_error_line(stderr: str) -> str:
+    lines = [line for line in stderr.strip().splitlines() if not line.startswith("import time:")]
+    return lines[-1] if lines else "error desconocido"
+
+
+def measure(preload: List[str], modules: List[str], repeat: int) -> Dict[str, Any]:
+    """
+    Importa `modules` en `repeat` intérpretes nuevos.
+
+    Returns:
+        dict: Mediana y mínimo en ms y módulos nuevos cargados, o el error
+    """
+    samples = []
+    loaded = 0
+    for _ in range(repeat):
+        result = run_child(preload, modules)
+        if result.returncode != 0:
+            return {"error": last_error_line(result.stderr)}
+        data = json.loads(result.stdout.strip().splitlines()[-1])
+        samples.append(data["seconds"] * 1000)
+        loaded = data["modules"]
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+        "modules": loaded,
+    }
+
+
+def detail(name: str, top: int) -> Optional[List[Tuple[str, float, float]]]:
+    """
+    Módulos más lentos de un escenario según `-X importtime`.
+
+    Returns:
+        Optional[List[Tuple[str, float, float]]]: (módulo, propio ms, acumulado ms), o None si falla
+    """
+    preload, modules = SCENARIOS[name]
+    result = run_child(preload, modules, importtime=True)
+    if result.returncode != 0:
+        print(f"❌ {name}: {last_error_line(result.stderr)}")
+        return None
+
+    rows = []
+    _, _, measured = result.stderr.partition("import-time: start\n")
+    for line in measured.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, module = line[len("import time:"):].split("|")
+        rows.append((module.strip(), int(own) / 1000, int(cumulative) / 1000))
+    return sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> bool:
+    """
+    Compara las medianas con las de otro fichero de resultados.
+
+    Returns:
+        bool: False si algún escenario empeora más de `tolerance` (fracción)
+    """
+    previous = {row["name"]: row for row in baseline["results"] if "median_ms" in row}
+    ok = True
+    print(f"\n🔁 Comparación con {baseline.get('commit') or 'la baseline'} (tolerancia {tolerance:.0%}):")
+    for row in results:
+        base = previous.get(row["name"])
+        if not base or "median_ms" not in row:
+            continue
+        change = row["median_ms"] / base["median_ms"] - 1
+        regressed = change > tolerance
+        ok = ok and not regressed
+        print(f"   {'❌' if regressed else '✅'} {row['name']:<26} "
+              f"{base['median_ms']:>9.1f} → {row['median_ms']:>9.1f} ms ({change:+.1%})")
+    return ok
+
+
+def main():
+    """Función principal."""
+    options = {"repeat": "5", "filter": "", "detail": "", "top": "15", "json": "", "compare": "", "tolerance": "0.2"}
+    for arg in sys.argv[1:]:
+        for name in options:
+            if arg.startswith(f"--{name}="):
+                options[name] = arg.split('=', 1)[1]
+
+    if options["detail"]:
+        if options["detail"] not in SCENARIOS:
+            print(f"❌ Escenario desconocido: {options['detail']} (disponibles: {', '.join(SCENARIOS)})")
+            sys.exit(1)
+        rows = detail(options["detail"], int(options["top"]))
+        if rows is None:
+            sys.exit(1)
+        print(f"🔍 {options['detail']}: módulos más lentos (-X importtime)")
+        print(f"\n   {'módulo':<50} {'propio ms':>10} {'acumulado ms':>13}")
+        for module, own, cumulative in rows:
+            print(f"   {module:<50} {own:>10.1f} {cumulative:>13.1f}")
+        return
+
+    repeat = int(options["repeat"])
+    print(f"⏱️  Tiempo de importación del frontend ({repeat} intérpretes nuevos por escenario)")
+    print(f"\n   {'escenario':<26} {'mediana ms':>11} {'mín ms':>9} {'módulos':>8}")
+    results = []
+    for name, (preload, modules) in SCENARIOS.items():
+        if options["filter"] and options["filter"] not in name:
+            continue
+        row = {"name": name, **measure(preload, modules, repeat)}
+        results.append(row)
+        if "error" in row:
+            print(f"   ❌ {name:<23} {row['error']}")
+        else:
+            print(f"   {name:<26} {row['median_ms']:>11.1f} {row['min_ms']:>9.1f} {row['modules']:>8}")
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+    if options["json"]:
+        Path(options["json"]).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        print(f"\n💾 Resultados guardados en {options['json']}")
+
+    if options["compare"]:
+        baseline = json.loads(Path(options["compare"]).read_text(encoding='utf-8'))
+        if not compare(results, baseline, float(options["tolerance"])):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+Prueba de carga de la API con asyncio.
+
+Lanza N usuarios virtuales concurrentes que repiten escenarios elegidos al azar
+según sus pesos durante el tiempo indicado, y muestra por escenario las
+peticiones, la tasa de error, la latencia p50/p95/p99 y el throughput. Los
+resultados se pueden guardar como baseline y comparar con los de otra versión.
+
+Escenarios HTTP (contra la API en --url):
+    health, signup, signin, me, verify_token, profile_upload
+
+Escenarios de servicio (la API todavía no expone carrito ni pedidos, así que se
+ejecutan en proceso con CartService/OrderService sobre una base de datos en
+memoria con el mismo RTT):
+    cart     get_cart + add_item + update_item + get_cart
+    order    create_order + get_order
+
+Cada usuario virtual se registra (signup) al empezar; ese registro no cuenta en
+los resultados salvo en el escenario signup.
+
+Uso:
+    python benchmarks/loadtest_server.py --rtt=20 &        # API sobre base de datos en memoria
+    python benchmarks/loadtest.py                           # 20 usuarios, 30 s, mezcla por defecto
+    python benchmarks/loadtest.py --concurrency=100 --duration=60 --mix=signin:1,me:8,cart:3
+    python benchmarks/loadtest.py --save-baseline=v1.2
+    python benchmarks/loadtest.py --compare=v1.2 --tolerance=0.2
+"""
+
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Agregar la raíz del proyecto al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+BASELINES_DIR = Path(__file__).parent / "baselines"
+API_PREFIX = "/api/v1/auth"
+
+DEFAULT_MIX = "signin:2,me:6,verify_token:2,signup:1,profile_upload:1,cart:3,order:1"
+
+# PNG 1x1 para el escenario de foto de perfil
+TINY_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000100e221bc330000000049454e44ae426082"
+)
+
+
+class HttpError(Exception):
+    """Respuesta HTTP con código de error."""
+
+    def __init__(self, status: int, body: bytes):
+        super().__init__(f"HTTP {status}: {body[:200]!r}")
+        self.status = status
+
+
+class HttpClient:
+    """
+    Cliente HTTP/1.1 mínimo sobre asyncio con conexión persistente (keep-alive).
+
+    Solo cubre lo que necesita la prueba de carga: JSON, multipart y respuestas
+    con Content-Length o chunked.
+    """
+
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+        self.reader = self.writer = None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json_body: Any = None,
+        body: bytes = b"",
+        content_type: Optional[str] = None,
+        token: Optional[str] = None
+    ) -> Any:
+        """
+        Envía una petición y devuelve el JSON de la respuesta.
+
+        Raises:
+            HttpError: Si el código de respuesta es >= 400
+        """
+        if json_body is not None:
+            body = json.dumps(json_body).encode()
+            content_type = "application/json"
+
+        headers = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", f"Content-Length: {len(body)}"]
+        if content_type:
+            headers.append(f"Content-Type: {content_type}")
+        if token:
+            headers.append(f"Authorization: Bearer {token}")
+        payload = ("\r\n".join(headers) + "\r\n\r\n").encode() + body
+
+        for attempt in range(2):
+            if self.writer is None:
+                self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            try:
+                self.writer.write(payload)
+                await self.writer.drain()
+                status, response_headers, response_body = await self._read_response()
+                break
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # El servidor cerró la conexión persistente: reconectar una vez
+                await self.close()
+                if attempt:
+                    raise
+
+        if response_headers.get("connection", "").lower() == "close":
+            await self.close()
+        if status >= 400:
+            raise HttpError(status, response_body)
+        return json.loads(response_body) if response_body else None
+
+    async def _read_response(self) -> Tuple[int, Dict[str, str], bytes]:
+        status_line = await self.reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                chunk = await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+                chunks.append(chunk[:-2])
+            return status, headers, b"".join(chunks)
+
+        length = int(headers.get("content-length", 0))
+        return status, headers, await self.reader.readexactly(length) if length else b""
+
+
+class VirtualUser:
+    """Usuario virtual: su conexión, sus credenciales y su token."""
+
+    def __init__(self, url: str, run_id: str, number: int):
+        self.client = HttpClient(url)
+        self.email = f"load-{run_id}-{number}@example.com"
+        self.password = "loadtest123"
+        self.token: Optional[str] = None
+        self.user_id: Optional[int] = None
+        self.number = number
+
+
+# ----------------------------------------------------------------------
+# Escenarios HTTP
+# ----------------------------------------------------------------------
+
+def signup_payload(email: str, password: str) -> Dict[str, Any]:
+    return {"email": email, "password": password, "nombre": "Carga", "apellidos": "Prueba"}
+
+
+async def scenario_health(user: VirtualUser, _context):
+    await user.client.request("GET", "/health")
+
+
+async def scenario_signup(user: VirtualUser, _context):
+    email = f"new-{uuid.uuid4().hex}@example.com"
+    await user.client.request("POST", f"{API_PREFIX}/signup", signup_payload(email, user.password))
+
+
+async def scenario_signin(user: VirtualUser, _context):
+    response = await user.client.request("POST", f"{API_PREFIX}/signin", {"email": user.email, "password": user.password})
+    user.token = response["access_token"]
+
+
+async def scenario_me(user: VirtualUser, _context):
+    await user.client.request("GET", f"{API_PREFIX}/me", token=user.token)
+
+
+async def scenario_verify_token(user: VirtualUser, _context):
+    await user.client.request("POST", f"{API_PREFIX}/verify-token", token=user.token)
+
+
+async def scenario_profile_upload(user: VirtualUser, _context):
+    boundary = uuid.uuid4().hex
+    body = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="avatar.png"\r\n'
+        "Content-Type: image/png\r\n\r\n"
+    ).encode() + TINY_PNG + f"\r\n--{boundary}--\r\n".encode()
+    await user.client.request(
+        "POST", f"{API_PREFIX}/upload-profile-picture",
+        body=body, content_type=f"multipart/form-data; boundary={boundary}", token=user.token
+    )
+
+
+# ----------------------------------------------------------------------
+# Escenarios de servicio (en proceso)
+# ----------------------------------------------------------------------
+
+class ServiceContext:
+    """Base de datos en memoria y pool de hilos para los escenarios de servicio."""
+
+    def __init__(self, rtt: float, jitter: float, users: int, concurrency: int, seed: int):
+        from backend.config.firebase_config import use_database
+        from backend.utils.fake_rtdb import FakeDatabase
+        from benchmarks.generate_dataset import DatasetGenerator
+
+        generator = DatasetGenerator(products=500, users=users, orders=users * 2, carts=users // 10, seed=seed)
+        self.products = generator.catalog()
+        data = {name: dict(items()) for name, items in generator.collections().items()}
+        use_database(FakeDatabase(data, latency_ms=rtt, jitter_ms=jitter, seed=seed))
+
+        self.users = users
+        self.rng = random.Random(seed)
+        self.pool = ThreadPoolExecutor(max_workers=concurrency)
+
+    async def run(self, function: Callable[[], Any]):
+        return await asyncio.get_running_loop().run_in_executor(self.pool, function)
+
+
+def _cart_flow(context: ServiceContext, user_id: int):
+    from backend.models.models import CartItemCreate, CartItemUpdate
+    from backend.services.cart_service import CartService
+
+    product = context.products[context.rng.randrange(len(context.products))]
+    CartService.get_cart(str(user_id))
+    item = CartService.add_item(
+        str(user_id), CartItemCreate(product_id=product["id"], quantity=1, size=product["sizes"][0]), product
+    )
+    CartService.update_item(str(user_id), item.id, CartItemUpdate(quantity=2))
+    CartService.get_cart(str(user_id))
+
+
+def _order_flow(context: ServiceContext, user_id: int):
+    from backend.services.order_service import OrderService
+    from benchmarks.fixtures import make_order_create
+
+    order = OrderService.create_order(
+        str(user_id), f"user{user_id}@example.com", make_order_create(context.products, random.Random(user_id))
+    )
+    OrderService.get_order(order.order_id)
+
+
+async def scenario_cart(user: VirtualUser, context: ServiceContext):
+    await context.run(lambda: _cart_flow(context, (user.number % context.users) + 1))
+
+
+async def scenario_order(user: VirtualUser, context: ServiceContext):
+    await context.run(lambda: _order_flow(context, (user.number % context.users) + 1))
+
+
+SCENARIOS: Dict[str, Callable[[VirtualUser, Any], Awaitable[None]]] = {
+    "health": scenario_health,
+    "signup": scenario_signup,
+    "signin": scenario_signin,
+    "me": scenario_me,
+    "verify_token": scenario_verify_token,
+    "profile_upload": scenario_profile_upload,
+    "cart": scenario_cart,
+    "order": scenario_order,
+}
+SERVICE_SCENARIOS = {"cart", "order"}
+
+
+# ----------------------------------------------------------------------
+# Ejecución y resultados
+# ----------------------------------------------------------------------
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Percentil por rango más cercano de una lista ordenada."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(len(sorted_values) * fraction) - 1)]
+
+
+async def run_load(
+    url: str,
+    mix: Dict[str, float],
+    concurrency: int,
+    duration: float,
+    think_ms: float,
+    context: Optional[ServiceContext],
+    seed: int
+) -> Dict[str, Any]:
+    """
+    Ejecuta la prueba de carga.
+
+    Returns:
+        Dict[str, Any]: Resultados por escenario y totales
+    """
+    run_id = uuid.uuid4().hex[:8]
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    samples: Dict[str, List[float]] = {name: [] for name in names}
+    errors: Dict[str, Dict[str, int]] = {name: {} for name in names}
+    needs_http = any(name not in SERVICE_SCENARIOS for name in names)
+
+    async def virtual_user(number: int, deadline: float):
+        rng = random.Random(seed * 1000 + number)
+        user = VirtualUser(url, run_id, number)
+        try:
+            if needs_http:
+                response = await user.client.request(
+                    "POST", f"{API_PREFIX}/signup", signup_payload(user.email, user.password)
+                )
+                user.token, user.user_id = response["access_token"], response["user_id"]
+
+            while time.monotonic() < deadline:
+                name = rng.choices(names, weights)[0]
+                started = time.perf_counter()
+                try:
+                    await SCENARIOS[name](user, context)
+                    samples[name].append(time.perf_counter() - started)
+                except Exception as e:
+                    key = f"HTTP {e.status}" if isinstance(e, HttpError) else type(e).__name__
+                    errors[name][key] = errors[name].get(key, 0) + 1
+                if think_ms:
+                    await asyncio.sleep(think_ms / 1000)
+        finally:
+            await user.client.close()
+
+    started = time.monotonic()
+    deadline = started + duration
+    await asyncio.gather(*(virtual_user(number, deadline) for number in range(concurrency)))
+    elapsed = time.monotonic() - started
+
+    scenarios = {}
+    for name in names:
+        latencies = sorted(samples[name])
+        failed = sum(errors[name].values())
+        total = len(latencies) + failed
+        scenarios[name] = {
+            "requests": total,
+            "errors": failed,
+            "error_rate": failed / total if total else 0.0,
+            "error_kinds": errors[name],
+            "rps": total / elapsed,
+            "mean_ms": (sum(latencies) / len(latencies) * 1000) if latencies else 0.0,
+            "p50_ms": percentile(latencies, 0.50) * 1000,
+            "p95_ms": percentile(latencies, 0.95) * 1000,
+            "p99_ms": percentile(latencies, 0.99) * 1000,
+        }
+
+    all_latencies = sorted(latency for values in samples.values() for latency in values)
+    total_requests = sum(result["requests"] for result in scenarios.values())
+    total_errors = sum(result["errors"] for result in scenarios.values())
+    return {
+        "url": url,
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 2),
+        "mix": mix,
+        "total": {
+            "requests": total_requests,
+            "errors": total_errors,
+            "error_rate": total_errors / total_requests if total_requests else 0.0,
+            "rps": total_requests / elapsed,
+            "p50_ms": percentile(all_latencies, 0.50) * 1000,
+            "p95_ms": percentile(all_latencies, 0.95) * 1000,
+            "p99_ms": percentile(all_latencies, 0.99) * 1000,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def print_report(results: Dict[str, Any]):
+    """Muestra los resultados por escenario."""
+    print(f"\n📊 {results['concurrency']} usuarios virtuales durante {results['duration_s']}s contra {results['url']}")
+    print(f"   {'escenario':<16} {'peticiones':>10} {'errores':>8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    rows = list(results["scenarios"].items()) + [("TOTAL", results["total"])]
+    for name, row in rows:
+        print(
+            f"   {name:<16} {row['requests']:>10} {row['error_rate']:>7.1%} {row['rps']:>8.1f} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f}"
+        )
+    for name, row in results["scenarios"].items():
+        for kind, count in row.get("error_kinds", {}).items():
+            print(f"   ⚠️  {name}: {count} × {kind}")
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> bool:
+    """
+    Compara con una baseline. Devuelve False si algún escenario empeora su p95
+    más de `tolerance` (fracción) o su tasa de error más de un punto.
+    """
+    ok = True
+    print(f"\n🔁 Comparación con la baseline (tolerancia p95 {tolerance:.0%}):")
+    for name, row in results["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if not base:
+            print(f"   ➕ {name}: sin baseline")
+            continue
+        p95_change = (row["p95_ms"] - base["p95_ms"]) / base["p95_ms"] if base["p95_ms"] else 0.0
+        rps_change = (row["rps"] - base["rps"]) / base["rps"] if base["rps"] else 0.0
+        regressed = p95_change > tolerance or row["error_rate"] > base["error_rate"] + 0.01
+        ok = ok and not regressed
+        print(f"   {'❌' if regressed else '✅'} {name}: p95 {base['p95_ms']:.1f} → {row['p95_ms']:.1f} ms "
+              f"({p95_change:+.0%}), req/s {rps_change:+.0%}, errores {base['error_rate']:.1%} → {row['error_rate']:.1%}")
+    return ok
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """Convierte "signin:2,me:6" en {"signin": 2.0, "me": 6.0}."""
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition(':')
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario: {name} (available: {', '.join(SCENARIOS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def main():
+    """Función principal."""
+    options = {"url": "http://127.0.0.1:8000", "concurrency": "20", "duration": "30", "mix": DEFAULT_MIX,
+               "think": "0", "rtt": "20", "jitter": "0", "users": "10000", "seed": "42",
+               "save-baseline": "", "compare": "", "tolerance": "0.2", "json": ""}
+    for arg in sys.argv[1:]:
+        for name in options:
+            if arg.startswith(f"--{name}="):
+                options[name] = arg.split('=', 1)[1]
+
+    try:
+        mix = parse_mix(options["mix"])
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+
+    concurrency = int(options["concurrency"])
+    seed = int(options["seed"])
+    context = None
+    if SERVICE_SCENARIOS & set(mix):
+        print(f"🗄️  Preparando base de datos en memoria para los escenarios de servicio (RTT {options['rtt']} ms)...")
+        context = ServiceContext(float(options["rtt"]), float(options["jitter"]), int(options["users"]), concurrency, seed)
+
+    print(f"🚀 Carga: {concurrency} usuarios virtuales, {options['duration']}s, mezcla {options['mix']}")
+    try:
+        results = asyncio.run(run_load(
+            options["url"], mix, concurrency, float(options["duration"]), float(options["think"]), context, seed
+        ))
+    except (ConnectionError, OSError) as e:
+        print(f"❌ No se pudo conectar con {options['url']}: {e}")
+        print("   Arranca la API antes, por ejemplo: python benchmarks/loadtest_server.py")
+        sys.exit(1)
+
+    print_report(results)
+
+    if options["json"]:
+        Path(options["json"]).write_text(json.dumps(results, indent=2), encoding='utf-8')
+        print(f"\n💾 Resultados guardados en {options['json']}")
+
+    if options["save-baseline"]:
+        BASELINES_DIR.mkdir(exist_ok=True)
+        path = BASELINES_DIR / f"{options['save-baseline']}.json"
+        path.write_text(json.dumps(results, indent=2), encoding='utf-8')
+        print(f"\n💾 Baseline guardada en {path}")
+
+    if options["compare"]:
+        path = BASELINES_DIR / f"{options['compare']}.json"
+        baseline = json.loads(path.read_text(encoding='utf-8'))
+        if not compare(results, baseline, float(options["tolerance"])):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
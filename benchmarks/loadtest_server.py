@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Arranca la API (backend.main:app) con uvicorn sobre una Realtime Database en
+memoria, para las pruebas de carga sin Firebase ni red.
+
+La base de datos se rellena con el generador de datos sintéticos y añade a cada
+llamada la latencia indicada. La subida a Cloudinary se sustituye por una
+respuesta local con la misma latencia, para que el escenario de foto de perfil
+no dependa de un servicio externo.
+
+Uso:
+    python benchmarks/loadtest_server.py                       # Puerto 8000, RTT 20 ms
+    python benchmarks/loadtest_server.py --rtt=50 --jitter=10 --users=100000
+    python benchmarks/loadtest_server.py --port=8001 --rtt=0
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Agregar la raíz del proyecto al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.config.firebase_config import use_database
+from backend.utils.fake_rtdb import FakeDatabase
+from benchmarks.generate_dataset import DatasetGenerator
+
+
+def build_database(users: int, orders: int, rtt: float, jitter: float, seed: int) -> FakeDatabase:
+    """Base de datos falsa con un conjunto de datos sintético."""
+    generator = DatasetGenerator(products=500, users=users, orders=orders, carts=users // 10, seed=seed)
+    data = {name: dict(items()) for name, items in generator.collections().items()}
+    return FakeDatabase(data, latency_ms=rtt, jitter_ms=jitter, seed=seed)
+
+
+def install_local_uploads(rtt: float):
+    """Sustituye la subida a Cloudinary por una respuesta local con latencia."""
+    import backend.config.cloudinary_config as cloudinary_config
+
+    def upload_image(file_content: bytes, folder: str = "profile_pictures", public_id: str = None) -> dict:
+        time.sleep(rtt / 1000)
+        return {
+            "secure_url": f"https://res.cloudinary.invalid/{folder}/{public_id}.jpg",
+            "public_id": f"{folder}/{public_id}",
+            "width": 500,
+            "height": 500,
+        }
+
+    cloudinary_config.upload_image = upload_image
+
+
+def main():
+    """Función principal."""
+    options = {"host": "127.0.0.1", "port": "8000", "rtt": "20", "jitter": "0",
+               "users": "10000", "orders": "20000", "seed": "42"}
+    for arg in sys.argv[1:]:
+        for name in options:
+            if arg.startswith(f"--{name}="):
+                options[name] = arg.split('=', 1)[1]
+
+    rtt = float(options["rtt"])
+    print(f"🗄️  Generando base de datos en memoria ({options['users']} usuarios, {options['orders']} pedidos)...")
+    database = build_database(int(options["users"]), int(options["orders"]), rtt, float(options["jitter"]), int(options["seed"]))
+    use_database(database)
+    install_local_uploads(rtt)
+    print(f"🌐 RTT simulado: {rtt:g} ms (+/- {options['jitter']} ms)")
+
+    import uvicorn
+    from backend.main import app
+
+    uvicorn.run(app, host=options["host"], port=int(options["port"]), log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
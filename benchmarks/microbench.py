@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks de las rutas Python más usadas (sin red).
+
+Mide el coste de CPU de:
+    products.map_product        ProductService._map_product (frontend)
+    products.search_products    búsqueda sobre un catálogo de N productos
+    products.by_sport           get_products_by_sport sobre N productos
+    cart.get_cart               construcción del modelo Cart con N líneas
+    cart.update_totals          CartService._update_cart_totals con N líneas
+    order.get_order             hidratación Pydantic de un pedido con N líneas
+    jwt.encode / jwt.decode     create_access_token / decode_access_token
+
+N se fija con --sizes. Los datos salen de DatasetGenerator con una semilla fija,
+y los servicios del backend usan FakeDatabase sin latencia, así que solo se mide
+el código Python. Los servicios de productos del frontend leen el catálogo desde
+memoria en lugar de data/BBDD.json.
+
+Cada medida es la mediana de --repeat muestras. Cada muestra repite la
+operación las veces necesarias para durar al menos --min-time segundos, con el
+recolector de basura desactivado (como timeit).
+
+Uso:
+    python benchmarks/microbench.py                            # Tamaños 10, 100 y 1000
+    python benchmarks/microbench.py --sizes=100,10000 --repeat=9
+    python benchmarks/microbench.py --filter=cart.
+    python benchmarks/microbench.py --json=bench-$(git rev-parse --short HEAD).json
+    python benchmarks/microbench.py --compare=bench-main.json --tolerance=0.1
+"""
+
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import timeit
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# Agregar la raíz del proyecto al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.config.firebase_config import use_database
+from backend.core.security import create_access_token, decode_access_token
+from backend.services.bestsellers_service import BestsellersService
+from backend.services.cart_service import CartService
+from backend.services.order_service import OrderService
+from backend.utils.fake_rtdb import FakeDatabase
+from benchmarks.fixtures import make_cart, make_order_create, user_email
+from benchmarks.generate_dataset import DatasetGenerator
+from frontend.services.product_service import ProductService
+
+DEFAULT_SIZES = [10, 100, 1000]
+
+
+def catalog(size: int, seed: int) -> List[Dict[str, Any]]:
+    """Catálogo sintético de `size` productos."""
+    return DatasetGenerator(products=size, users=1, orders=0, carts=0, seed=seed).catalog()
+
+
+def benchmarks(size: int, seed: int) -> Tuple[FakeDatabase, Dict[str, Callable[[], Any]]]:
+    """
+    Prepara las operaciones a medir para un tamaño.
+
+    Deja instalada una FakeDatabase con el catálogo, un carrito de `size` líneas
+    (usuario 1) y un pedido de `size` líneas.
+
+    Returns:
+        Tuple[FakeDatabase, Dict[str, Callable[[], Any]]]: Base de datos instalada
+            y nombre -> función sin argumentos
+    """
+    rng = random.Random(seed)
+    products = catalog(size, seed)
+
+    fake = FakeDatabase({"products": {str(product["id"]): product for product in products}}, seed=seed)
+    fake.reference().child("carts/1").set(make_cart(1, products, size, rng))
+    use_database(fake)
+
+    # Pedido con `size` líneas (se repiten productos si el catálogo es más pequeño)
+    order_create = make_order_create(products, rng, lines=min(size, len(products)))
+    order_create.items = [order_create.items[index % len(order_create.items)] for index in range(size)]
+    order_id = OrderService.create_order("1", user_email(1), order_create).order_id
+    BestsellersService.flush()
+
+    data = {"products": products, "categories": [], "leagues": []}
+    ProductService._load_data = staticmethod(lambda: data)
+
+    product = products[0]
+    token = create_access_token({"sub": user_email(1), "user_id": 1}, timedelta(hours=1))
+
+    return fake, {
+        "products.map_product": lambda: ProductService._map_product(product),
+        "products.search_products": lambda: ProductService.search_products("barcelona"),
+        "products.by_sport": lambda: ProductService.get_products_by_sport("futbol", limit=size),
+        "cart.get_cart": lambda: CartService.get_cart("1"),
+        "cart.update_totals": lambda: CartService._update_cart_totals("1"),
+        "order.get_order": lambda: OrderService.get_order(order_id),
+        "jwt.encode": lambda: create_access_token({"sub": user_email(1), "user_id": 1}, timedelta(hours=1)),
+        "jwt.decode": lambda: decode_access_token(token),
+    }
+
+
+def measure(operation: Callable[[], Any], repeat: int, min_time: float, setup: Callable[[], Any] = None) -> Dict[str, Any]:
+    """
+    Mide una operación. `setup` se ejecuta, sin medirse, antes de cada muestra.
+
+    Returns:
+        Dict[str, Any]: Repeticiones por muestra y tiempos por operación en µs
+    """
+    timer = timeit.Timer(operation, setup=setup or (lambda: None))
+    loops = 1
+    while timer.timeit(loops) < min_time:
+        loops *= 2
+
+    samples = [timer.timeit(loops) / loops * 1e6 for _ in range(repeat)]
+    return {
+        "loops": loops,
+        "median_us": statistics.median(samples),
+        "min_us": min(samples),
+        "stdev_us": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def run(sizes: List[int], repeat: int, min_time: float, seed: int, name_filter: str = "") -> List[Dict[str, Any]]:
+    """Ejecuta todos los microbenchmarks para cada tamaño."""
+    original_load_data = ProductService._load_data
+    results = []
+    try:
+        for size in sizes:
+            fake, operations = benchmarks(size, seed)
+            for name, operation in operations.items():
+                if name_filter and name_filter not in name:
+                    continue
+                # Vaciar el registro de llamadas de la base falsa para que no crezca entre muestras
+                results.append({"name": name, "size": size, **measure(operation, repeat, min_time, fake.reset_calls)})
+    finally:
+        ProductService._load_data = original_load_data
+        use_database(None)
+    return results
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> bool:
+    """
+    Compara las medianas con las de otro fichero de resultados.
+
+    Returns:
+        bool: False si alguna medida empeora más de `tolerance` (fracción)
+    """
+    previous = {(row["name"], row["size"]): row for row in baseline["results"]}
+    ok = True
+    print(f"\n🔁 Comparación con {baseline.get('commit') or 'la baseline'} (tolerancia {tolerance:.0%}):")
+    for row in results:
+        base = previous.get((row["name"], row["size"]))
+        if not base:
+            continue
+        change = row["median_us"] / base["median_us"] - 1
+        regressed = change > tolerance
+        ok = ok and not regressed
+        print(f"   {'❌' if regressed else '✅'} {row['name']:<26} n={row['size']:<7} "
+              f"{base['median_us']:>10.2f} → {row['median_us']:>10.2f} µs ({change:+.1%})")
+    return ok
+
+
+def main():
+    """Función principal."""
+    options = {"sizes": ",".join(map(str, DEFAULT_SIZES)), "repeat": "7", "min-time": "0.05", "seed": "42",
+               "filter": "", "json": "", "compare": "", "tolerance": "0.1"}
+    for arg in sys.argv[1:]:
+        for name in options:
+            if arg.startswith(f"--{name}="):
+                options[name] = arg.split('=', 1)[1]
+
+    sizes = [int(value) for value in options["sizes"].split(',')]
+    print(f"⏱️  Microbenchmarks (tamaños {sizes}, {options['repeat']} muestras, semilla {options['seed']})")
+    results = run(sizes, int(options["repeat"]), float(options["min-time"]), int(options["seed"]), options["filter"])
+
+    print(f"\n   {'operación':<26} {'n':>7} {'mediana µs':>12} {'mín µs':>10} {'desv %':>7}")
+    for row in results:
+        spread = row["stdev_us"] / row["median_us"] * 100 if row["median_us"] else 0.0
+        print(f"   {row['name']:<26} {row['size']:>7} {row['median_us']:>12.2f} {row['min_us']:>10.2f} {spread:>6.1f}%")
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": int(options["seed"]),
+        "repeat": int(options["repeat"]),
+        "results": results,
+    }
+    if options["json"]:
+        Path(options["json"]).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        print(f"\n💾 Resultados guardados en {options['json']}")
+
+    if options["compare"]:
+        baseline = json.loads(Path(options["compare"]).read_text(encoding='utf-8'))
+        if not compare(results, baseline, float(options["tolerance"])):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,10 @@ Componente UI completo con validación y estilos.
 import streamlit as st
 from services.auth_service import AuthService
 from config import SESSION_KEYS
+from profiling import profiled
 
 
+@profiled()
 def render_auth_form():
     """
     Renderiza el formulario principal de autenticación con pestañas de Login y Registro.
@@ -7,8 +7,10 @@ import streamlit as st
 import hydralit_components as hc
 from services.auth_service import AuthService
 from config import SESSION_KEYS
+from profiling import profiled
 
 
+@profiled()
 def render_navbar():
     """
     Renderiza la barra de navegación superior fija usando hydralit_components.
@@ -37,3 +37,7 @@ SESSION_KEYS = {
     "current_page": "current_page",
     "show_welcome": "show_welcome"
 }
+
+# Perfilado de renders (modo desarrollo): panel con tiempos por sección y log por rerun
+RENDER_PROFILING = os.getenv("RENDER_PROFILING", "False") == "True"
+RENDER_PROFILING_HISTORY = int(os.getenv("RENDER_PROFILING_HISTORY", "50"))  # Reruns guardados por sesión
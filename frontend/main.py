@@ -3,18 +3,11 @@ Aplicación principal de Streamlit para SportStyle Store.
 Punto de entrada del frontend con gestión de autenticación y navegación.
 """
 
+import importlib
 import streamlit as st
 from config import APP_NAME, APP_ICON, SESSION_KEYS
 from components.auth_form import render_auth_form
-from components.navbar import render_navbar, show_welcome_toast
-from pages.home import render_home_page
-from pages.catalog import render_catalog_page
-from pages.product_detail import render_product_detail_page
-from pages.cart import render_cart_page
-from pages.checkout import render_checkout_page
-from pages.order_confirmation import render_order_confirmation_page
-from pages.account import render_account_page
-from pages.admin import render_admin_page
+from profiling import profile_rerun, profile_section
 
 
 # Configuración de la página
@@ -62,7 +55,32 @@ def load_custom_css():
         """, unsafe_allow_html=True)
 
 
-# Todas las páginas ahora se importan desde frontend.pages.*
+# Registro de páginas: clave en session_state -> (módulo, función de render).
+# Cada módulo se importa la primera vez que se visita la página (después queda
+# en sys.modules), así una sesión nueva no carga plotly, pandas ni el backend
+# de páginas que no ha abierto.
+PAGES = {
+    "home": ("pages.home", "render_home_page"),
+    "catalog": ("pages.catalog", "render_catalog_page"),
+    "product_detail": ("pages.product_detail", "render_product_detail_page"),
+    "cart": ("pages.cart", "render_cart_page"),
+    "checkout": ("pages.checkout", "render_checkout_page"),
+    "order_confirmation": ("pages.order_confirmation", "render_order_confirmation_page"),
+    "account": ("pages.account", "render_account_page"),
+    "admin": ("pages.admin", "render_admin_page"),
+}
+
+
+def render_page(current_page: str):
+    """
+    Renderiza la página indicada (home si no existe), importándola si hace falta.
+
+    Args:
+        current_page: Clave de la página en session_state
+    """
+    module_name, function_name = PAGES.get(current_page, PAGES["home"])
+    render = getattr(importlib.import_module(module_name), function_name)
+    render()
 
 
 def main():
@@ -73,56 +91,36 @@ def main():
     # Inicializar estado
     initialize_session_state()
 
-    # Cargar estilos
-    load_custom_css()
-
     # Verificar si el usuario está autenticado
     is_authenticated = st.session_state.get(SESSION_KEYS["authenticated"], False)
+    rerun_page = st.session_state.get(SESSION_KEYS["current_page"], "home") if is_authenticated else "auth"
 
-    if not is_authenticated:
-        # Mostrar formulario de autenticación
-        render_auth_form()
-
-    else:
-        # Usuario autenticado - Mostrar aplicación principal
-
-        # Mostrar mensaje de bienvenida (solo una vez)
-        show_welcome_toast()
+    # Con RENDER_PROFILING=True se mide el rerun y se muestra el panel de tiempos
+    with profile_rerun(rerun_page, st.session_state):
+        # Cargar estilos
+        load_custom_css()
 
-        # Renderizar navbar
-        render_navbar()
+        if not is_authenticated:
+            # Mostrar formulario de autenticación
+            render_auth_form()
 
-        # Obtener página actual
-        current_page = st.session_state.get(SESSION_KEYS["current_page"], "home")
-
-        # Renderizar la página correspondiente
-        if current_page == "home":
-            render_home_page()
-
-        elif current_page == "catalog":
-            render_catalog_page()
-
-        elif current_page == "product_detail":
-            render_product_detail_page()
-
-        elif current_page == "cart":
-            render_cart_page()
-
-        elif current_page == "checkout":
-            render_checkout_page()
+        else:
+            # Usuario autenticado - Mostrar aplicación principal
+            # (el navbar se importa aquí: el formulario de login no necesita hydralit)
+            from components.navbar import render_navbar, show_welcome_toast
 
-        elif current_page == "order_confirmation":
-            render_order_confirmation_page()
+            # Mostrar mensaje de bienvenida (solo una vez)
+            show_welcome_toast()
 
-        elif current_page == "account":
-            render_account_page()
+            # Renderizar navbar
+            render_navbar()
 
-        elif current_page == "admin":
-            render_admin_page()
+            # Obtener página actual
+            current_page = st.session_state.get(SESSION_KEYS["current_page"], "home")
 
-        else:
-            # Página por defecto
-            render_home_page()
+            # Renderizar la página correspondiente
+            with profile_section(f"page:{current_page}"):
+                render_page(current_page)
 
 
 if __name__ == "__main__":
@@ -7,10 +7,12 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
 import json
 from config import SESSION_KEYS
+from services.admin_service import AdminService
+from services.product_service import ProductService
+from profiling import profiled
 
 
 def render_admin_page():
@@ -36,8 +38,12 @@ def render_admin_page():
 
     # Mostrar loader mientras carga
     with st.spinner("Cargando métricas del dashboard..."):
+        # KPIs y stock desde los agregados materializados (lecturas pequeñas)
+        metrics = AdminService.get_main_metrics()
+        stock = AdminService.get_stock_summary()
+
         # Métricas principales en cards animados
-        render_main_metrics_animated()
+        render_main_metrics_animated(metrics)
 
         st.markdown("<br>", unsafe_allow_html=True)
 
@@ -55,17 +61,20 @@ def render_admin_page():
 
             st.markdown("<br>", unsafe_allow_html=True)
 
-            # Mapa de España con heatmap de usuarios
+            # Mapa de España con heatmap de pedidos por comunidad
             render_spain_heatmap()
 
         with col_right:
             # Stock por categorías
-            render_stock_by_category()
+            render_stock_by_category(stock)
+
+            # Tallas con stock bajo
+            render_low_stock(stock)
 
             st.markdown("<br>", unsafe_allow_html=True)
 
             # Métricas adicionales
-            render_additional_metrics()
+            render_additional_metrics(metrics, stock)
 
 
 def is_admin() -> bool:
@@ -109,20 +118,26 @@ def render_access_denied():
         st.rerun()
 
 
-def render_main_metrics_animated():
+@profiled()
+def render_main_metrics_animated(metrics: dict):
     """
     Renderiza las métricas principales en cards con animaciones hover.
+
+    Args:
+        metrics: KPIs obtenidos de AdminService.get_main_metrics()
     """
-    # Datos mock
-    total_users = 1247
-    new_users_today = 23
-    users_change = 27.8
+    total_users = metrics["total_users"]
+    new_users_today = metrics["new_users_today"]
+    users_change = metrics["new_users_change"]
+    users_change_class = "positive" if users_change >= 0 else "negative"
+    users_change_arrow = "▲" if users_change >= 0 else "▼"
 
-    total_revenue = 45678.90
-    revenue_change_year = 3600.2
-    revenue_change_month = 17.3
+    active_users = metrics["active_users"]
 
-    total_orders = 543
+    total_revenue = metrics["total_revenue"]
+
+    total_orders = metrics["total_orders"]
+    pending_orders = metrics["pending_orders"]
 
     # CSS para animaciones hover
     st.markdown("""
@@ -187,7 +202,7 @@ def render_main_metrics_animated():
             <p class="metric-label">Usuarios Totales</p>
             <p class="metric-value">{total_users:,}</p>
             <p class="metric-label">{new_users_today} nuevos hoy</p>
-            <p class="metric-change positive">▲ {users_change:.1f}%</p>
+            <p class="metric-change {users_change_class}">{users_change_arrow} {abs(users_change):.1f}% vs ayer</p>
         </div>
         """, unsafe_allow_html=True)
 
@@ -197,17 +212,16 @@ def render_main_metrics_animated():
             <span class="metric-icon">💰</span>
             <p class="metric-label">Ingresos Totales</p>
             <p class="metric-value">{total_revenue:,.2f}€</p>
-            <p class="metric-change positive">▲ {revenue_change_year:.1f}% vs ayer</p>
+            <p class="metric-label">Sin pedidos cancelados</p>
         </div>
         """, unsafe_allow_html=True)
 
     with col3:
         st.markdown(f"""
         <div class="metric-card-animated">
-            <span class="metric-icon">📈</span>
-            <p class="metric-label">Ingresos Mes</p>
-            <p class="metric-value">{total_revenue:,.2f}€</p>
-            <p class="metric-change positive">▲ {revenue_change_month:.1f}% vs mes anterior</p>
+            <span class="metric-icon">✅</span>
+            <p class="metric-label">Usuarios Activos</p>
+            <p class="metric-value">{active_users:,}</p>
         </div>
         """, unsafe_allow_html=True)
 
@@ -217,19 +231,26 @@ def render_main_metrics_animated():
             <span class="metric-icon">📦</span>
             <p class="metric-label">Pedidos Totales</p>
             <p class="metric-value">{total_orders:,}</p>
+            <p class="metric-label">{pending_orders} pendientes</p>
         </div>
         """, unsafe_allow_html=True)
 
 
+@profiled()
 def render_revenue_chart_plotly():
     """
     Renderiza el gráfico de ingresos interactivo con Plotly (hover con cifras exactas).
     """
     st.markdown("### 📈 Ingresos - Últimos 30 Días")
 
-    # Generar datos mock
-    dates = [(datetime.now() - timedelta(days=i)).strftime("%d %b") for i in range(30, 0, -1)]
-    revenues = [random.uniform(800, 2000) for _ in range(30)]
+    # Serie diaria precalculada (30 buckets, sin recorrer pedidos)
+    series = AdminService.get_revenue_series("day", 30)
+    if not series:
+        st.info("No hay datos de ingresos disponibles")
+        return
+
+    dates = [datetime.strptime(point["bucket"], "%Y-%m-%d").strftime("%d %b") for point in series]
+    revenues = [point["revenue"] for point in series]
 
     # Crear gráfico interactivo con Plotly
     fig = go.Figure()
@@ -274,8 +295,11 @@ def render_revenue_chart_plotly():
 
     st.plotly_chart(fig, use_container_width=True)
 
+    # Ingresos del mes actual frente al anterior
+    months = AdminService.get_revenue_series("month", 2)
+
     # Resumen con métricas
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
 
     with col1:
         avg_revenue = sum(revenues) / len(revenues)
@@ -289,40 +313,30 @@ def render_revenue_chart_plotly():
         min_revenue = min(revenues)
         st.metric("📉 Mínimo", f"{min_revenue:.2f}€")
 
+    with col4:
+        if len(months) == 2:
+            previous_month, current_month = months[0]["revenue"], months[1]["revenue"]
+            delta = f"{(current_month - previous_month) / previous_month * 100:+.1f}% vs mes anterior" if previous_month else None
+            st.metric("📅 Este Mes", f"{current_month:.2f}€", delta)
+
 
+@profiled()
 def render_spain_heatmap():
     """
-    Renderiza mapa de España con heatmap de usuarios por comunidad autónoma.
+    Renderiza mapa de España con heatmap de pedidos por comunidad autónoma.
     """
-    st.markdown("### 🗺️ Usuarios por Comunidad Autónoma")
-
-    # Datos mock de usuarios por comunidad con coordenadas aproximadas
-    regions_data = {
-        "Madrid": {"users": 287, "percentage": 23.0, "lat": 40.4168, "lon": -3.7038},
-        "Cataluña": {"users": 245, "percentage": 19.6, "lat": 41.3851, "lon": 2.1734},
-        "Andalucía": {"users": 198, "percentage": 15.9, "lat": 37.3891, "lon": -5.9845},
-        "Valencia": {"users": 156, "percentage": 12.5, "lat": 39.4699, "lon": -0.3763},
-        "País Vasco": {"users": 98, "percentage": 7.9, "lat": 43.2630, "lon": -2.9350},
-        "Galicia": {"users": 76, "percentage": 6.1, "lat": 42.8782, "lon": -8.5448},
-        "Castilla y León": {"users": 54, "percentage": 4.3, "lat": 41.6523, "lon": -4.7245},
-        "Aragón": {"users": 43, "percentage": 3.4, "lat": 41.6488, "lon": -0.8891},
-        "Murcia": {"users": 38, "percentage": 3.0, "lat": 37.9922, "lon": -1.1307},
-        "Castilla-La Mancha": {"users": 35, "percentage": 2.8, "lat": 39.8628, "lon": -4.0273},
-        "Canarias": {"users": 17, "percentage": 1.5, "lat": 28.2916, "lon": -16.6291}
-    }
+    st.markdown("### 🗺️ Pedidos por Comunidad Autónoma")
+
+    # Agregados por comunidad (/stats/regions), solo las que tienen pedidos
+    regions_data = [region for region in AdminService.get_orders_by_region() if region["orders"]]
+
+    if not regions_data:
+        st.info("Todavía no hay pedidos con dirección de envío en España.")
+        return
 
     # Preparar datos para el mapa
-    df_map = pd.DataFrame([
-        {
-            "region": region,
-            "users": data["users"],
-            "percentage": data["percentage"],
-            "lat": data["lat"],
-            "lon": data["lon"],
-            "size": data["users"] / 5  # Para el tamaño de los marcadores
-        }
-        for region, data in regions_data.items()
-    ])
+    df_map = pd.DataFrame(regions_data)
+    max_orders = df_map['orders'].max()
 
     # Crear mapa con Plotly
     fig = go.Figure()
@@ -331,16 +345,17 @@ def render_spain_heatmap():
     fig.add_trace(go.Scattergeo(
         lon=df_map['lon'],
         lat=df_map['lat'],
-        text=df_map['region'],
+        text=df_map['name'],
+        customdata=df_map['revenue'],
         mode='markers',
         marker=dict(
-            size=df_map['users'] / 10,  # Tamaño reducido para que no sean tan grandes
-            color=df_map['users'],
+            size=10 + 30 * df_map['orders'] / max_orders,  # Proporcional a los pedidos
+            color=df_map['orders'],
             colorscale='Purples',
             cmin=0,
-            cmax=300,
+            cmax=max_orders,
             colorbar=dict(
-                title="Usuarios",
+                title="Pedidos",
                 thickness=15,
                 len=0.7,
                 bgcolor='#f3f4f6',
@@ -353,7 +368,8 @@ def render_spain_heatmap():
             opacity=0.7
         ),
         hovertemplate='<b>%{text}</b><br>' +
-                      'Usuarios: %{marker.color:,}<br>' +
+                      'Pedidos: %{marker.color:,}<br>' +
+                      'Ingresos: %{customdata:,.2f}€<br>' +
                       '<extra></extra>'
     ))
 
@@ -394,12 +410,10 @@ def render_spain_heatmap():
     with st.expander("📋 Ver Detalles por Comunidad", expanded=False):
         st.markdown("#### Desglose Detallado")
 
-        # Ordenar por usuarios descendente
-        sorted_regions = sorted(regions_data.items(), key=lambda x: x[1]['users'], reverse=True)
-
-        for region, data in sorted_regions:
+        # Ya vienen ordenadas por pedidos descendente
+        for data in regions_data:
             # Calcular intensidad del color según porcentaje
-            intensity = data['percentage'] / 25
+            intensity = min(data['percentage'] / 25, 1)
 
             st.markdown(f"""
             <div style="
@@ -417,16 +431,17 @@ def render_spain_heatmap():
                 transition: all 0.3s ease;
             ">
                 <div style="flex: 1;">
-                    <span style="color: #ffffff; font-weight: 600;">{region}</span>
+                    <span style="color: #ffffff; font-weight: 600;">{data['name']}</span>
                 </div>
                 <div style="text-align: right;">
-                    <span style="color: #a78bfa; font-weight: 700; margin-right: 1rem;">{data['users']} usuarios</span>
+                    <span style="color: #a78bfa; font-weight: 700; margin-right: 1rem;">{data['orders']} pedidos · {data['revenue']:,.0f}€</span>
                     <span style="color: #d1d5db; font-size: 0.875rem;">({data['percentage']:.1f}%)</span>
                 </div>
             </div>
             """, unsafe_allow_html=True)
 
 
+@profiled()
 def render_top_products_section():
     """
     Renderiza sección destacada de Top 3 productos más vendidos.
@@ -439,11 +454,22 @@ def render_top_products_section():
     </div>
     """, unsafe_allow_html=True)
 
-    top_products = [
-        {"name": "Camiseta Real Madrid", "sales": 234, "revenue": "9,360€", "icon": "⚽", "color": "#10b981"},
-        {"name": "Camiseta FC Barcelona", "sales": 198, "revenue": "7,920€", "icon": "⚽", "color": "#3b82f6"},
-        {"name": "Gorra Ferrari F1", "sales": 156, "revenue": "3,120€", "icon": "🏎️", "color": "#f59e0b"}
-    ]
+    sport_icons = {sport["id"]: sport["icon"] for sport in ProductService.get_sports()}
+
+    # Top 3 de los últimos 30 días desde los resúmenes de /stats/bestsellers
+    top_products = []
+    for product in AdminService.get_top_products(window="30d", by="units", limit=3):
+        catalog_product = ProductService.get_product_by_id(product["id"]) or {}
+        top_products.append({
+            "name": product["name"] or catalog_product.get("name", product["id"]),
+            "sales": int(product["units"]),
+            "revenue": f"{product['revenue'] or 0:,.0f}€",
+            "icon": sport_icons.get(catalog_product.get("deporte"), "🏷️")
+        })
+
+    if not top_products:
+        st.info("Todavía no hay ventas en los últimos 30 días.")
+        return
 
     medals = ["🥇", "🥈", "🥉"]
 
@@ -511,23 +537,27 @@ def render_top_products_section():
             """, unsafe_allow_html=True)
 
 
-def render_stock_by_category():
+@profiled()
+def render_stock_by_category(stock: dict):
     """
     Renderiza el stock por categorías con gráfico de dona interactivo.
+
+    Args:
+        stock: Stock agregado obtenido de AdminService.get_stock_summary()
     """
     st.markdown("### 📦 Stock por Categoría")
 
-    # Datos mock
+    sports = {sport["id"]: sport for sport in ProductService.get_sports()}
     stock_data = [
-        {"categoria": "Camisetas", "stock": 4567, "color": "#10b981"},
-        {"categoria": "Sudaderas", "stock": 2341, "color": "#3b82f6"},
-        {"categoria": "Gorras", "stock": 1876, "color": "#f59e0b"},
-        {"categoria": "Bufandas", "stock": 1543, "color": "#a78bfa"},
-        {"categoria": "Chaquetas", "stock": 1234, "color": "#ef4444"},
-        {"categoria": "Pantalones", "stock": 889, "color": "#8b5cf6"}
+        {
+            "categoria": sports.get(category, {}).get("name", category),
+            "stock": units,
+            "color": sports.get(category, {}).get("color", "#a78bfa")
+        }
+        for category, units in sorted(stock["by_category"].items(), key=lambda item: item[1], reverse=True)
     ]
 
-    total_stock = sum(item['stock'] for item in stock_data)
+    total_stock = stock["total"]
 
     # Total
     st.markdown(f"""
@@ -576,9 +606,47 @@ def render_stock_by_category():
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_additional_metrics():
+def render_low_stock(stock: dict, limit: int = 5):
+    """
+    Renderiza las tallas con stock bajo.
+
+    Args:
+        stock: Stock agregado obtenido de AdminService.get_stock_summary()
+        limit: Número máximo de tallas a mostrar
+    """
+    low_stock = stock["low_stock"]
+
+    if not low_stock:
+        st.success("✅ Ninguna talla con stock bajo")
+        return
+
+    with st.expander(f"⚠️ Stock Bajo ({len(low_stock)} tallas)", expanded=True):
+        for entry in low_stock[:limit]:
+            color = "#ef4444" if entry["stock"] == 0 else "#f59e0b"
+            st.markdown(f"""
+            <div style="
+                background: #181633;
+                border: 1px solid #2d2d3a;
+                border-left: 4px solid {color};
+                border-radius: 8px;
+                padding: 0.5rem 1rem;
+                margin-bottom: 0.5rem;
+                display: flex;
+                justify-content: space-between;
+            ">
+                <span style="color: #ffffff;">{entry["name"]} · {entry["size"]}</span>
+                <span style="color: {color}; font-weight: 700;">{entry["stock"]} uds</span>
+            </div>
+            """, unsafe_allow_html=True)
+
+
+def render_additional_metrics(metrics: dict, stock: dict):
     """
     Renderiza métricas adicionales con animaciones.
+
+    Args:
+        metrics: KPIs obtenidos de AdminService.get_main_metrics()
+        stock: Stock agregado obtenido de AdminService.get_stock_summary()
     """
     st.markdown("### 📊 Métricas Adicionales")
 
@@ -611,19 +679,19 @@ def render_additional_metrics():
     """, unsafe_allow_html=True)
 
     # Ticket medio
-    st.markdown("""
+    st.markdown(f"""
     <div class="additional-metric">
         <p style="color: #9ca3af; font-size: 0.875rem; margin: 0 0 0.5rem 0;">Ticket Medio</p>
-        <p style="color: #a78bfa; font-size: 2rem; font-weight: 700; margin: 0;">84.12€</p>
-        <p style="color: #ef4444; font-size: 0.875rem; margin: 0.5rem 0 0 0;">▼ 2.3% vs mes anterior</p>
+        <p style="color: #a78bfa; font-size: 2rem; font-weight: 700; margin: 0;">{metrics["average_ticket"]:,.2f}€</p>
+        <p style="color: #d1d5db; font-size: 0.875rem; margin: 0.5rem 0 0 0;">Pedidos no cancelados</p>
     </div>
     """, unsafe_allow_html=True)
 
     # Productos activos
-    st.markdown("""
+    st.markdown(f"""
     <div class="additional-metric">
         <p style="color: #9ca3af; font-size: 0.875rem; margin: 0 0 0.5rem 0;">Productos Activos</p>
-        <p style="color: #3b82f6; font-size: 2rem; font-weight: 700; margin: 0;">247</p>
+        <p style="color: #3b82f6; font-size: 2rem; font-weight: 700; margin: 0;">{stock["active_products"]}</p>
         <p style="color: #d1d5db; font-size: 0.875rem; margin: 0.5rem 0 0 0;">En catálogo</p>
     </div>
     """, unsafe_allow_html=True)
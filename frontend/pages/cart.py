@@ -8,6 +8,7 @@ from components.cart_item import render_cart_item
 from components.navbar import show_success_toast, show_error_toast
 from config import SESSION_KEYS
 from services.cart_service import CartService
+from profiling import profiled
 
 
 # Constantes (deberían venir de config)
@@ -70,6 +71,7 @@ def render_empty_cart():
             st.rerun()
 
 
+@profiled()
 def render_cart_items(cart: list):
     """
     Renderiza la lista de items en el carrito.
@@ -94,6 +96,7 @@ def render_cart_items(cart: list):
         render_cart_item(item, index)
 
 
+@profiled()
 def render_cart_summary(cart: list):
     """
     Renderiza el resumen del carrito con totales y opciones de checkout.
@@ -7,6 +7,7 @@ import streamlit as st
 from typing import List, Dict
 from services.product_service import ProductService
 from components.product_card import render_product_card
+from profiling import profiled
 
 
 def render_catalog_page():
@@ -25,6 +26,7 @@ def render_catalog_page():
         render_products_grid(filters)
 
 
+@profiled()
 def render_filters_sidebar() -> dict:
     """
     Renderiza la barra lateral de filtros.
@@ -241,6 +243,7 @@ def sort_products(products: List[Dict], sort_by: str) -> List[Dict]:
         return products
 
 
+@profiled()
 def render_product_grid(products: List[Dict]):
     """
     Renderiza el grid de productos.
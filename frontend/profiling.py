@@ -0,0 +1,320 @@
+"""
+Perfilado de los renders de Streamlit (modo desarrollo).
+
+Cada interacción vuelve a ejecutar main() de arriba abajo (un "rerun"). Con
+RENDER_PROFILING=True se mide cada rerun y las secciones marcadas con
+@profiled o `with profile_section(...)`: tiempo de reloj y llamadas al
+backend (Realtime Database en proceso y peticiones HTTP a la API).
+
+Al terminar el rerun:
+- se registra en el log (logger "sportstyle.render") con la duración, las
+  llamadas al backend y las secciones más lentas;
+- render_overlay() muestra un panel con las secciones del rerun actual y los
+  reruns más lentos de la sesión.
+
+Sin RENDER_PROFILING el decorador llama a la función directamente y
+profile_section no hace nada.
+
+Uso:
+    from profiling import profiled, profile_rerun, profile_section
+
+    with profile_rerun(current_page, st.session_state):   # en main()
+        ...
+
+    @profiled()
+    def render_product_grid(products):
+        ...
+
+    with profile_section("page:catalog"):
+        render_catalog_page()
+"""
+
+import functools
+import os
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+from config import RENDER_PROFILING, RENDER_PROFILING_HISTORY
+
+# Agregar path del backend para el logging y la instrumentación compartidos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.core.logger import get_logger
+
+logger = get_logger("render")
+
+# Clave de session_state con los últimos reruns de la sesión
+HISTORY_KEY = "_render_profile_history"
+
+# Secciones mostradas en el log y en el panel
+TOP_SECTIONS = 8
+
+_current_rerun: ContextVar[Optional["Rerun"]] = ContextVar("current_rerun", default=None)
+
+
+class Section:
+    """Una sección medida dentro de un rerun."""
+
+    __slots__ = ("name", "depth", "duration_ms", "backend_calls", "backend_ms")
+
+    def __init__(self, name: str, depth: int):
+        self.name = name
+        self.depth = depth
+        self.duration_ms = 0.0
+        self.backend_calls = 0
+        self.backend_ms = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "depth": self.depth,
+            "duration_ms": round(self.duration_ms, 2),
+            "backend_calls": self.backend_calls,
+            "backend_ms": round(self.backend_ms, 2),
+        }
+
+
+class Rerun:
+    """Una ejecución completa del script con sus secciones."""
+
+    def __init__(self, page: str):
+        self.page = page
+        self.started_at = time.time()
+        self.duration_ms = 0.0
+        self.backend_calls = 0
+        self.backend_ms = 0.0
+        self.sections: List[Section] = []
+        self._stack: List[Section] = []
+        self._started = time.perf_counter()
+
+    def record_backend_call(self, seconds: float):
+        """Cuenta una llamada al backend en el rerun y en las secciones abiertas."""
+        self.backend_calls += 1
+        self.backend_ms += seconds * 1000
+        for section in self._stack:
+            section.backend_calls += 1
+            section.backend_ms += seconds * 1000
+
+    def slowest_sections(self, limit: int = TOP_SECTIONS) -> List[Section]:
+        return sorted(self.sections, key=lambda section: section.duration_ms, reverse=True)[:limit]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "page": self.page,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 2),
+            "backend_calls": self.backend_calls,
+            "backend_ms": round(self.backend_ms, 2),
+            "sections": [section.to_dict() for section in self.sections],
+        }
+
+
+@contextmanager
+def profile_section(name: str):
+    """
+    Mide un bloque del rerun en curso.
+
+    Fuera de un rerun perfilado (o sin RENDER_PROFILING) no hace nada.
+
+    Args:
+        name: Nombre de la sección (p. ej. "page:catalog")
+    """
+    rerun = _current_rerun.get()
+    if rerun is None:
+        yield
+        return
+
+    section = Section(name, len(rerun._stack))
+    # Se añade al empezar para que las secciones queden en orden de ejecución
+    rerun.sections.append(section)
+    rerun._stack.append(section)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        section.duration_ms = (time.perf_counter() - started) * 1000
+        rerun._stack.pop()
+
+
+def profiled(name: Optional[str] = None) -> Callable:
+    """
+    Decorador que mide cada llamada a la función como una sección.
+
+    Args:
+        name: Nombre de la sección (por defecto, el de la función)
+    """
+    def decorator(func: Callable) -> Callable:
+        if not RENDER_PROFILING:
+            return func
+        section_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_section(section_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def start_rerun(page: str) -> Optional[Rerun]:
+    """
+    Empieza a medir un rerun (al principio de main()).
+
+    Args:
+        page: Página que se va a renderizar
+
+    Returns:
+        Optional[Rerun]: El rerun en curso, o None sin RENDER_PROFILING
+    """
+    if not RENDER_PROFILING:
+        return None
+    _install_backend_hooks()
+    rerun = Rerun(page)
+    _current_rerun.set(rerun)
+    return rerun
+
+
+def finish_rerun(history: Optional[list] = None) -> Optional[Rerun]:
+    """
+    Termina el rerun en curso, lo registra en el log y lo guarda en el historial.
+
+    Args:
+        history: Lista donde guardar el resumen (los últimos
+            RENDER_PROFILING_HISTORY reruns de la sesión)
+
+    Returns:
+        Optional[Rerun]: El rerun terminado, o None si no había ninguno
+    """
+    rerun = _current_rerun.get()
+    if rerun is None:
+        return None
+    _current_rerun.set(None)
+    rerun.duration_ms = (time.perf_counter() - rerun._started) * 1000
+
+    logger.info(f"rerun {rerun.page}", extra={
+        "page": rerun.page,
+        "duration_ms": round(rerun.duration_ms, 2),
+        "backend_calls": rerun.backend_calls,
+        "backend_ms": round(rerun.backend_ms, 2),
+        "slowest": [section.to_dict() for section in rerun.slowest_sections()],
+    })
+
+    if history is not None:
+        history.append(rerun.summary())
+        del history[:-RENDER_PROFILING_HISTORY]
+    return rerun
+
+
+@contextmanager
+def profile_rerun(page: str, session_state):
+    """
+    Mide el rerun completo y, si termina con normalidad, muestra el panel.
+
+    Si el rerun se interrumpe (st.rerun(), st.stop() o un error) se registra
+    igualmente, pero no se muestra el panel.
+
+    Args:
+        page: Página que se va a renderizar
+        session_state: st.session_state (guarda el historial de la sesión)
+    """
+    if not RENDER_PROFILING:
+        yield
+        return
+
+    start_rerun(page)
+    history = session_state.setdefault(HISTORY_KEY, [])
+    try:
+        yield
+    finally:
+        rerun = finish_rerun(history)
+    render_overlay(rerun, history)
+
+
+def _on_storage_call(op: str, path: str, started: float, seconds: float, error: Optional[BaseException]):
+    # Las llamadas de otros hilos (p. ej. volcados en segundo plano) no tienen rerun
+    rerun = _current_rerun.get()
+    if rerun is not None:
+        rerun.record_backend_call(seconds)
+
+
+_hooks_installed = False
+
+
+def _install_backend_hooks():
+    """
+    Cuenta las llamadas al backend del rerun en curso.
+
+    Los servicios del frontend usan los del backend en proceso (Realtime
+    Database, vía instrumented_rtdb) y la API HTTP con requests (AuthService).
+    """
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    _hooks_installed = True
+
+    from backend.utils import instrumented_rtdb
+    instrumented_rtdb.add_listener(_on_storage_call)
+
+    import requests
+    original_request = requests.Session.request
+
+    @functools.wraps(original_request)
+    def timed_request(self, *args, **kwargs):
+        rerun = _current_rerun.get()
+        if rerun is None:
+            return original_request(self, *args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return original_request(self, *args, **kwargs)
+        finally:
+            rerun.record_backend_call(time.perf_counter() - started)
+
+    requests.Session.request = timed_request
+
+
+def render_overlay(rerun: Optional[Rerun], history: List[Dict[str, Any]]):
+    """
+    Muestra el panel de desarrollo: secciones del rerun actual y reruns más lentos.
+
+    Args:
+        rerun: Rerun recién terminado (finish_rerun)
+        history: Resúmenes de los últimos reruns de la sesión
+    """
+    if rerun is None:
+        return
+    import streamlit as st
+
+    rows = "".join(
+        f"<tr><td>{'&nbsp;' * 2 * section.depth}{section.name}</td>"
+        f"<td>{section.duration_ms:.1f} ms</td><td>{section.backend_calls}</td></tr>"
+        for section in rerun.slowest_sections()
+    )
+    st.markdown(f"""
+    <div style="position: fixed; bottom: 1rem; right: 1rem; z-index: 1000000;
+                background: rgba(18, 17, 39, 0.92); border: 1px solid #a78bfa; border-radius: 8px;
+                padding: 0.5rem 0.75rem; font-family: monospace; font-size: 0.75rem; color: #d1d5db;">
+        <div style="color: #a78bfa; font-weight: bold;">
+            ⏱️ {rerun.page}: {rerun.duration_ms:.1f} ms · {rerun.backend_calls} llamadas ({rerun.backend_ms:.1f} ms)
+        </div>
+        <table>{rows}</table>
+    </div>
+    """, unsafe_allow_html=True)
+
+    with st.sidebar.expander("⏱️ Reruns más lentos"):
+        slowest = sorted(history, key=lambda item: item["duration_ms"], reverse=True)[:TOP_SECTIONS]
+        st.table([
+            {
+                "Página": item["page"],
+                "Hora": time.strftime("%H:%M:%S", time.localtime(item["started_at"])),
+                "ms": item["duration_ms"],
+                "Llamadas": item["backend_calls"],
+                "Backend ms": item["backend_ms"],
+                "Sección más lenta": max(item["sections"], key=lambda s: s["duration_ms"])["name"] if item["sections"] else "",
+            }
+            for item in slowest
+        ])
@@ -0,0 +1,181 @@
+"""
+Servicio de administración para el frontend.
+Obtiene los KPIs del dashboard desde los agregados materializados en Firebase
+(/stats), sin recorrer las colecciones de usuarios ni pedidos.
+"""
+
+from typing import Dict, List
+import sys
+import os
+
+# Agregar path del backend para importar servicios
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from backend.services.metrics_service import MetricsService
+    from backend.services.timeseries_service import TimeSeriesService
+    from backend.services.bestsellers_service import BestsellersService
+    from backend.services.regions_service import RegionsService
+    from backend.services.stock_service import StockService
+    FIREBASE_AVAILABLE = True
+except Exception as e:
+    logger.warning("Firebase no disponible", extra={"error": str(e)})
+    FIREBASE_AVAILABLE = False
+
+
+class AdminService:
+    """
+    Servicio de lectura de métricas para el dashboard de administración.
+    """
+
+    @staticmethod
+    def _percentage_change(current: float, previous: float) -> float:
+        """
+        Calcula la variación porcentual entre dos valores.
+
+        Args:
+            current: Valor actual
+            previous: Valor de referencia
+
+        Returns:
+            float: Variación en % (0 si no hay referencia)
+        """
+        if not previous:
+            return 0.0
+        return (current - previous) / previous * 100
+
+    @staticmethod
+    def get_main_metrics() -> Dict:
+        """
+        Obtiene las métricas principales del dashboard.
+
+        Returns:
+            Dict: KPIs (todos a 0 si Firebase no está disponible)
+        """
+        metrics = {
+            "total_users": 0,
+            "active_users": 0,
+            "new_users_today": 0,
+            "new_users_change": 0.0,
+            "total_orders": 0,
+            "pending_orders": 0,
+            "total_revenue": 0.0,
+            "average_ticket": 0.0,
+        }
+
+        if not FIREBASE_AVAILABLE:
+            return metrics
+
+        try:
+            summary = MetricsService.get_summary()
+            yesterday, today = MetricsService.get_new_users(days=2).values()
+
+            metrics.update({
+                "total_users": summary["total_users"],
+                "active_users": summary["active_users"],
+                "new_users_today": today,
+                "new_users_change": AdminService._percentage_change(today, yesterday),
+                "total_orders": summary["total_orders"],
+                "pending_orders": summary["orders_by_status"].get("pending", 0),
+                "total_revenue": summary["total_revenue"],
+                "average_ticket": summary["average_ticket"],
+            })
+        except Exception as e:
+            logger.warning("Error al obtener métricas del dashboard", extra={"error": str(e)})
+
+        return metrics
+
+    @staticmethod
+    def get_revenue_series(resolution: str = "day", count: int = 30) -> List[Dict]:
+        """
+        Obtiene la serie de ingresos y pedidos de los últimos N buckets.
+
+        Args:
+            resolution: "hour", "day" o "month"
+            count: Número de buckets (incluido el actual)
+
+        Returns:
+            List[Dict]: Buckets en orden cronológico (bucket, revenue, orders);
+                lista vacía si Firebase no está disponible
+        """
+        if not FIREBASE_AVAILABLE:
+            return []
+
+        try:
+            return TimeSeriesService.get_last(resolution, count)
+        except Exception as e:
+            logger.warning("Error al obtener la serie de ingresos", extra={"error": str(e)})
+            return []
+
+    @staticmethod
+    def get_top_products(window: str = "30d", by: str = "units", limit: int = 3) -> List[Dict]:
+        """
+        Obtiene los productos más vendidos de una ventana (24h, 7d o 30d).
+
+        Args:
+            window: "24h", "7d" o "30d"
+            by: Métrica de ordenación: "units" o "revenue"
+            limit: Número de productos
+
+        Returns:
+            List[Dict]: Productos (id, name, team, image, units, revenue);
+                lista vacía si Firebase no está disponible
+        """
+        if not FIREBASE_AVAILABLE:
+            return []
+
+        try:
+            return BestsellersService.get_top(window, by, limit)
+        except Exception as e:
+            logger.warning("Error al obtener los productos más vendidos", extra={"error": str(e)})
+            return []
+
+    @staticmethod
+    def get_orders_by_region() -> List[Dict]:
+        """
+        Obtiene pedidos e ingresos por comunidad autónoma.
+
+        Returns:
+            List[Dict]: Comunidades (slug, name, lat, lon, orders, revenue, percentage)
+                ordenadas por pedidos; lista vacía si Firebase no está disponible
+        """
+        if not FIREBASE_AVAILABLE:
+            return []
+
+        try:
+            return RegionsService.get_regions()
+        except Exception as e:
+            logger.warning("Error al obtener los pedidos por región", extra={"error": str(e)})
+            return []
+
+    @staticmethod
+    def get_stock_summary() -> Dict:
+        """
+        Obtiene el stock agregado por categoría, liga y equipo.
+
+        Returns:
+            Dict: total, active_products, by_category, by_league, by_team y
+                low_stock (vacíos si Firebase no está disponible)
+        """
+        summary = {
+            "total": 0,
+            "active_products": 0,
+            "by_category": {},
+            "by_league": {},
+            "by_team": {},
+            "low_stock": [],
+        }
+
+        if not FIREBASE_AVAILABLE:
+            return summary
+
+        try:
+            summary.update(StockService.get_summary())
+        except Exception as e:
+            logger.warning("Error al obtener el stock agregado", extra={"error": str(e)})
+
+        return summary
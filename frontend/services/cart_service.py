@@ -11,13 +11,33 @@ import os
 # Agregar path del backend para importar modelos y servicios
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-try:
-    from backend.services.cart_service import CartService as BackendCartService
-    from backend.models.models import CartItemCreate, Personalization
-    FIREBASE_AVAILABLE = True
-except Exception as e:
-    print(f"⚠️ Firebase no disponible: {e}")
-    FIREBASE_AVAILABLE = False
+from backend.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Los servicios del backend (firebase_admin, modelos Pydantic) se importan en la
+# primera operación con Firebase y no al cargar las páginas que usan el carrito
+FIREBASE_AVAILABLE: Optional[bool] = None
+BackendCartService = CartItemCreate = Personalization = None
+
+
+def _firebase_available() -> bool:
+    """
+    Importa el servicio de carrito del backend la primera vez que se necesita.
+
+    Returns:
+        bool: True si Firebase está disponible
+    """
+    global FIREBASE_AVAILABLE, BackendCartService, CartItemCreate, Personalization
+    if FIREBASE_AVAILABLE is None:
+        try:
+            from backend.services.cart_service import CartService as BackendCartService
+            from backend.models.models import CartItemCreate, Personalization
+            FIREBASE_AVAILABLE = True
+        except Exception as e:
+            logger.warning("Firebase no disponible", extra={"error": str(e)})
+            FIREBASE_AVAILABLE = False
+    return FIREBASE_AVAILABLE
 
 from services.product_service import ProductService
 
@@ -50,7 +70,7 @@ class CartService:
         Args:
             user_id: ID del usuario
         """
-        if not FIREBASE_AVAILABLE:
+        if not _firebase_available():
             return
 
         try:
@@ -72,7 +92,7 @@ class CartService:
                     'size': item.size,
                     'unit_price': item.unit_price,
                     'personalization_price': item.personalization_price,
-                    'personalization': item.personalization.dict() if item.personalization else None,
+                    'personalization': item.personalization.model_dump() if item.personalization else None,
                     'subtotal': item.subtotal
                 }
                 for item in firebase_cart.items
@@ -80,7 +100,7 @@ class CartService:
             st.session_state[CartService.CART_COUNT_KEY] = firebase_cart.total_items
             st.session_state[CartService.CART_TOTAL_KEY] = firebase_cart.subtotal
         except Exception as e:
-            print(f"Error al sincronizar con Firebase: {e}")
+            logger.warning("Error al sincronizar con Firebase", extra={"user_id": user_id, "error": str(e)})
 
     @staticmethod
     def initialize_cart():
@@ -99,7 +119,7 @@ class CartService:
 
         # Sincronizar con Firebase si el usuario está autenticado
         user_id = CartService._get_user_id()
-        if user_id and FIREBASE_AVAILABLE:
+        if user_id and _firebase_available():
             CartService._sync_with_firebase(user_id)
 
     @staticmethod
@@ -193,7 +213,7 @@ class CartService:
 
         # Sincronizar con Firebase si el usuario está autenticado
         user_id = CartService._get_user_id()
-        if user_id and FIREBASE_AVAILABLE:
+        if user_id and _firebase_available():
             try:
                 # Obtener email del usuario
                 user_email = CartService._get_user_email()
@@ -230,7 +250,7 @@ class CartService:
                 CartService._sync_with_firebase(user_id)
 
             except Exception as e:
-                print(f"Error al añadir a Firebase: {e}")
+                logger.warning("Error al añadir a Firebase", extra={"user_id": user_id, "error": str(e)})
                 # Continuar con carrito local
                 st.session_state[CartService.CART_KEY].append(cart_item)
                 CartService._update_totals()
@@ -259,7 +279,7 @@ class CartService:
 
             # Sincronizar con Firebase si está disponible
             user_id = CartService._get_user_id()
-            if user_id and FIREBASE_AVAILABLE and 'id' in item:
+            if user_id and _firebase_available() and 'id' in item:
                 try:
                     from backend.models.models import CartItemUpdate
 
@@ -272,7 +292,7 @@ class CartService:
                     CartService._sync_with_firebase(user_id)
                     return
                 except Exception as e:
-                    print(f"Error al actualizar en Firebase: {e}")
+                    logger.warning("Error al actualizar en Firebase", extra={"user_id": user_id, "error": str(e)})
 
             # Actualización local si Firebase no está disponible
             if quantity is not None:
@@ -303,13 +323,13 @@ class CartService:
 
             # Sincronizar con Firebase si está disponible
             user_id = CartService._get_user_id()
-            if user_id and FIREBASE_AVAILABLE and 'id' in item:
+            if user_id and _firebase_available() and 'id' in item:
                 try:
                     BackendCartService.remove_item(user_id, item['id'])
                     CartService._sync_with_firebase(user_id)
                     return
                 except Exception as e:
-                    print(f"Error al eliminar de Firebase: {e}")
+                    logger.warning("Error al eliminar de Firebase", extra={"user_id": user_id, "error": str(e)})
 
             # Eliminación local si Firebase no está disponible
             cart.pop(index)
@@ -319,11 +339,11 @@ class CartService:
     def clear_cart():
         """Vacía completamente el carrito."""
         user_id = CartService._get_user_id()
-        if user_id and FIREBASE_AVAILABLE:
+        if user_id and _firebase_available():
             try:
                 BackendCartService.clear_cart(user_id)
             except Exception as e:
-                print(f"Error al limpiar carrito en Firebase: {e}")
+                logger.warning("Error al limpiar carrito en Firebase", extra={"user_id": user_id, "error": str(e)})
 
         # Limpiar local
         st.session_state[CartService.CART_KEY] = []
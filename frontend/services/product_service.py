@@ -5,8 +5,17 @@ Gestiona la obtención y filtrado de productos desde BBDD.json.
 
 import json
 import os
+import sys
 from typing import List, Dict, Optional
 
+# Agregar path del backend para el logging compartido
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.core.logger import get_logger
+from backend.utils.fast_json import load_file
+
+logger = get_logger(__name__)
+
 
 class ProductService:
     """
@@ -26,13 +35,12 @@ class ProductService:
         json_path = os.path.join(current_dir, 'data', 'BBDD.json')
 
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_file(json_path)
         except FileNotFoundError:
-            print(f"⚠️ No se encontró el archivo BBDD.json en {json_path}")
+            logger.warning("No se encontró el archivo BBDD.json", extra={"path": json_path})
             return {"products": [], "categories": [], "leagues": []}
         except json.JSONDecodeError:
-            print(f"⚠️ Error al decodificar el archivo BBDD.json")
+            logger.error("Error al decodificar el archivo BBDD.json", extra={"path": json_path}, exc_info=True)
             return {"products": [], "categories": [], "leagues": []}
 
     @staticmethod
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Script para exportar pedidos, líneas de pedido y usuarios a Parquet particionado
+por mes, de forma incremental (solo lo nuevo desde la última exportación).
+
+Uso:
+    python scripts/export_analytics.py                      # Exporta a exports/analytics
+    python scripts/export_analytics.py ruta/destino         # Directorio personalizado
+    python scripts/export_analytics.py --full               # Regenera la exportación completa
+    python scripts/export_analytics.py --page-size=2000     # Registros por lectura de Firebase
+
+Pensado para ejecutarse también como tarea periódica (cron), p. ej. cada noche:
+    0 3 * * * cd /ruta/al/proyecto && python scripts/export_analytics.py
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar la raíz del proyecto al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.services.analytics_export_service import AnalyticsExportService
+
+
+def main():
+    """Función principal."""
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('-')]
+    output_dir = Path(args[0]) if args else project_root / "exports" / "analytics"
+
+    full = '--full' in sys.argv
+    page_size = 1000
+    for arg in sys.argv[1:]:
+        if arg.startswith('--page-size='):
+            page_size = int(arg.split('=', 1)[1])
+
+    try:
+        mode = "completa" if full else "incremental"
+        print(f"\n📤 Exportación {mode} a {output_dir}...")
+        report = AnalyticsExportService.export(output_dir, full=full, page_size=page_size)
+
+        for dataset, result in report.items():
+            print(f"   📄 {dataset}: {result['rows']} filas en {result['files']} ficheros")
+
+        print("\n✅ Exportación completada")
+        print("   Ejemplo: pyarrow.dataset.dataset(ruta, partitioning='hive') o DuckDB read_parquet('.../orders/*/*.parquet')")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Script para aplicar las migraciones de datos de backend/migrations.
+
+Las migraciones se aplican en orden de versión, por páginas y en lotes
+multi-ruta con varios hilos; el progreso se guarda en /migrations, así que una
+migración interrumpida continúa donde se quedó al volver a ejecutarla.
+
+Uso:
+    python scripts/migrate.py                      # Estado de las migraciones
+    python scripts/migrate.py up                   # Aplica las pendientes
+    python scripts/migrate.py up 0002              # Solo las versiones indicadas
+    python scripts/migrate.py up --dry-run         # Muestra los cambios sin escribir
+    python scripts/migrate.py up 0002 --force      # Vuelve a aplicar una ya hecha
+    python scripts/migrate.py up --yes --workers=8 --batch-size=1000 --page-size=1000
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar la raíz del proyecto al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.migrations import MIGRATIONS, MigrationRunner
+
+
+def show_status():
+    """Muestra el estado de cada migración registrada."""
+    print("\n📋 Migraciones:")
+    print("=" * 60)
+    for migration in MIGRATIONS:
+        state = MigrationRunner.get_state(migration)
+        status = state.get('status', 'pending')
+        icon = {"done": "✅", "running": "⏸️ "}.get(status, "⏳")
+        print(f"{icon} {migration.version} [{status}] {migration.description}")
+        if status == 'running':
+            print(f"      última clave: {state.get('last_key')} · {state.get('scanned', 0)} recorridos")
+    print("=" * 60)
+
+
+def main():
+    """Función principal."""
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('-')]
+    command = args[0] if args else "status"
+    versions = args[1:]
+
+    options = {"page_size": 500, "batch_size": 500, "workers": 4}
+    for arg in sys.argv[1:]:
+        for name in options:
+            flag = f"--{name.replace('_', '-')}="
+            if arg.startswith(flag):
+                options[name] = int(arg.split('=', 1)[1])
+
+    dry_run = '--dry-run' in sys.argv
+    force = '--force' in sys.argv
+    confirm = '--yes' not in sys.argv and '-y' not in sys.argv
+
+    try:
+        if command == "status":
+            show_status()
+            return
+
+        if command != "up":
+            print(f"❌ Comando desconocido: {command} (usa status o up)")
+            sys.exit(1)
+
+        unknown = set(versions) - {migration.version for migration in MIGRATIONS}
+        if unknown:
+            print(f"❌ Versiones desconocidas: {', '.join(sorted(unknown))}")
+            sys.exit(1)
+
+        selected = [migration for migration in MIGRATIONS if not versions or migration.version in versions]
+        if not force:
+            selected = [
+                migration for migration in selected
+                if MigrationRunner.get_state(migration).get('status') != 'done'
+            ]
+
+        if not selected:
+            print("✅ No hay migraciones pendientes")
+            return
+
+        print("\n🗂️  Se aplicarán:")
+        for migration in selected:
+            print(f"   - {migration.version}: {migration.description} ({migration.collection})")
+
+        if confirm and not dry_run:
+            response = input("\n¿Deseas continuar? (sí/no): ").lower()
+            if response not in ['sí', 'si', 's', 'yes', 'y']:
+                print("❌ Operación cancelada")
+                return
+
+        runner = MigrationRunner(dry_run=dry_run, **options)
+        for migration in selected:
+            runner.run(migration, force=force)
+
+        print("\n🎉 Migraciones completadas" if not dry_run else "\n🔍 Dry run completado")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
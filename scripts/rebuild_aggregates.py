@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Script para reconstruir desde cero los agregados materializados (/stats, /timeseries).
+Útil para inicializarlos sobre datos existentes o repararlos tras una incidencia.
+
+Uso:
+    python scripts/rebuild_aggregates.py            # Reconstruye todo
+    python scripts/rebuild_aggregates.py metrics    # Solo las métricas del dashboard
+    python scripts/rebuild_aggregates.py timeseries # Solo las series de ingresos
+    python scripts/rebuild_aggregates.py bestsellers # Solo el top de ventas
+    python scripts/rebuild_aggregates.py regions    # Solo los pedidos por comunidad
+    python scripts/rebuild_aggregates.py stock      # Solo el stock por categoría/equipo
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar la raíz del proyecto al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.services.metrics_service import MetricsService
+from backend.services.timeseries_service import TimeSeriesService
+from backend.services.bestsellers_service import BestsellersService
+from backend.services.regions_service import RegionsService
+from backend.services.stock_service import StockService
+
+
+def rebuild_metrics(page_size: int):
+    """Reconstruye /stats/summary y /stats/users_by_day."""
+    summary = MetricsService.rebuild(page_size=page_size)
+    print(f"   👥 Usuarios: {summary['total_users']} ({summary['active_users']} activos)")
+    print(f"   📦 Pedidos: {summary['total_orders']}")
+    print(f"   💰 Ingresos: {summary['total_revenue']:.2f}€")
+
+
+def rebuild_timeseries(page_size: int):
+    """Reproduce todos los pedidos en /timeseries/orders (hora, día y mes)."""
+    buckets = TimeSeriesService.backfill(page_size=page_size)
+    for resolution, count in buckets.items():
+        print(f"   📈 {resolution}: {count} buckets")
+
+
+def rebuild_bestsellers(page_size: int):
+    """Reproduce todos los pedidos en los resúmenes top-K de /stats/bestsellers."""
+    buckets = BestsellersService.backfill(page_size=page_size)
+    print(f"   🏆 {buckets} buckets")
+
+
+def rebuild_regions(page_size: int):
+    """Reproduce todos los pedidos en /stats/regions (pedidos e ingresos por comunidad)."""
+    orders_by_region = RegionsService.backfill(page_size=page_size)
+    for slug, orders in sorted(orders_by_region.items(), key=lambda item: item[1], reverse=True):
+        print(f"   🗺️ {slug}: {orders} pedidos")
+
+
+def rebuild_stock(page_size: int):
+    """Recalcula /stats/stock desde /products (el catálogo se lee de una vez)."""
+    stats = StockService.rebuild()
+    print(f"   📦 Stock: {stats['total']} unidades en {stats['active_products']} productos activos")
+    print(f"   ⚠️ Tallas con stock bajo: {len(stats['low_stock'])}")
+
+
+# Agregados disponibles: nombre -> función de reconstrucción
+AGGREGATES = {
+    "metrics": rebuild_metrics,
+    "timeseries": rebuild_timeseries,
+    "bestsellers": rebuild_bestsellers,
+    "regions": rebuild_regions,
+    "stock": rebuild_stock,
+}
+
+
+def main():
+    """Función principal."""
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('-')]
+
+    page_size = 500
+    for arg in sys.argv[1:]:
+        if arg.startswith('--page-size='):
+            page_size = int(arg.split('=', 1)[1])
+
+    selected = args or list(AGGREGATES.keys())
+    unknown = [name for name in selected if name not in AGGREGATES]
+    if unknown:
+        print(f"❌ Agregados desconocidos: {', '.join(unknown)}")
+        print(f"   Disponibles: {', '.join(AGGREGATES.keys())}")
+        sys.exit(1)
+
+    try:
+        for name in selected:
+            print(f"\n🔄 Reconstruyendo {name}...")
+            AGGREGATES[name](page_size)
+            print(f"✅ {name} reconstruido")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Script para barrer los carritos abandonados de Firebase.
+
+Elimina (o archiva en /carts_archive) los carritos sin cambios desde hace más de
+N días, leyendo solo esos carritos por el índice de updated_at y borrándolos en
+lotes. Los carritos con actividad reciente no se tocan. Pensado para ejecutarse
+como tarea programada.
+
+Uso:
+    python scripts/sweep_carts.py                  # Carritos sin cambios en 30 días
+    python scripts/sweep_carts.py --days=14
+    python scripts/sweep_carts.py --archive        # Mueve a /carts_archive en lugar de borrar
+    python scripts/sweep_carts.py --dry-run        # Solo cuenta, sin escribir
+    python scripts/sweep_carts.py --page-size=1000 --batch-size=500
+
+Requiere en las reglas de la base de datos:
+    "carts": { ".indexOn": ["updated_at"] }
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar la raíz del proyecto al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.services.cart_service import CartService
+
+
+def main():
+    """Función principal."""
+    options = {
+        "days": CartService.ABANDONED_AFTER_DAYS,
+        "page_size": 500,
+        "batch_size": 200,
+    }
+    for arg in sys.argv[1:]:
+        for name in options:
+            flag = f"--{name.replace('_', '-')}="
+            if arg.startswith(flag):
+                options[name] = int(arg.split('=', 1)[1])
+
+    dry_run = '--dry-run' in sys.argv
+    archive = '--archive' in sys.argv
+
+    action = "archivando" if archive else "eliminando"
+    print(f"🧹 Barriendo carritos sin cambios en {options['days']} días ({'dry run' if dry_run else action})...")
+
+    try:
+        result = CartService.sweep_abandoned(
+            max_idle_days=options["days"],
+            archive=archive,
+            page_size=options["page_size"],
+            batch_size=options["batch_size"],
+            dry_run=dry_run
+        )
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+    print(f"   📅 Corte: updated_at <= {result['cutoff']}")
+    if dry_run:
+        print(f"🔍 Se barrerían {result['carts']} carritos ({result['items']} líneas); no se ha modificado nada")
+    else:
+        print(f"✅ {result['carts']} carritos barridos ({result['items']} líneas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,51 +2,205 @@
 """
 Script interactivo para sincronizar solo productos con Firebase.
 Útil para actualizar solo los productos sin tocar otros datos.
+
+La sincronización es incremental: cada producto se resume con un hash de su
+contenido y se compara con el manifiesto guardado en /catalog/manifest (o con
+el estado real de /products usando --remote). Solo se suben los productos
+nuevos o modificados y se eliminan los que ya no están en el JSON, en lotes de
+escrituras multi-ruta, sin vaciar nunca el catálogo.
+
+Uso:
+    python scripts/sync_products.py                 # Interactivo
+    python scripts/sync_products.py --yes           # Sin confirmación
+    python scripts/sync_products.py --dry-run       # Solo muestra los cambios
+    python scripts/sync_products.py --remote        # Compara con /products en lugar del manifiesto
+    python scripts/sync_products.py ruta/al.json
 """
 
 import sys
 import json
+import hashlib
 from pathlib import Path
+from typing import Dict, Any, List, Tuple
+
+# Agregar la raíz del proyecto al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.config.firebase_config import get_database
+from backend.utils.fast_json import load_file
+from backend.services.stock_service import StockService
+from backend.utils.rtdb import as_dict
+
+
+MANIFEST_PATH = "catalog/manifest"
+
+# Productos por escritura multi-ruta (cada producto son 2 rutas: dato y hash)
+BATCH_SIZE = 100
+
+
+def product_hash(product: Dict[str, Any]) -> str:
+    """
+    Calcula el hash del contenido de un producto (independiente del orden de claves).
+
+    Args:
+        product: Producto en formato JSON
+
+    Returns:
+        str: Hash corto (16 caracteres hex)
+    """
+    canonical = json.dumps(product, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
 
-# Agregar el directorio backend al path
-backend_path = Path(__file__).parent.parent / "backend"
-sys.path.insert(0, str(backend_path))
 
-from config.firebase_config import get_database
+def load_local_products(json_file: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Lee los productos del JSON indexados por ID (como string, igual que en Firebase).
 
+    Args:
+        json_file: Ruta al archivo JSON
 
-def preview_products(json_path: Path):
-    """Muestra un preview de los productos a subir."""
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    Returns:
+        Dict[str, Dict]: Productos por ID
+    """
+    data = load_file(json_file)
 
-    products = data.get('products', [])
-    print(f"\n📦 Se encontraron {len(products)} productos:")
+    products_dict = {}
+    for product in data.get('products', []):
+        product_id = product.get('id')
+        if product_id:
+            # Convertir ID a string para Firebase (las claves deben ser strings)
+            products_dict[str(product_id)] = product
+        else:
+            print(f"⚠️  Producto sin ID encontrado: {product.get('name', 'Sin nombre')}")
+
+    return products_dict
+
+
+def load_remote_hashes(db, use_remote: bool) -> Tuple[Dict[str, str], bool]:
+    """
+    Obtiene los hashes de los productos que hay en Firebase.
+
+    Por defecto lee solo el manifiesto (/catalog/manifest, un hash por producto).
+    Si se pide --remote o el manifiesto no existe todavía, lee /products y
+    calcula los hashes del contenido real.
+
+    Args:
+        db: Referencia a la raíz de la base de datos
+        use_remote: Comparar con /products en lugar del manifiesto
+
+    Returns:
+        Tuple[Dict[str, str], bool]: Hash por ID de producto y si salen del manifiesto
+    """
+    if not use_remote:
+        manifest = as_dict(db.child(MANIFEST_PATH).get())
+        if manifest:
+            return manifest, True
+        print("ℹ️  No hay manifiesto en Firebase: se compara con /products")
+
+    remote_products = as_dict(db.child('products').get())
+    return {product_id: product_hash(product) for product_id, product in remote_products.items()}, False
+
+
+def diff_products(local_hashes: Dict[str, str], remote_hashes: Dict[str, str]) -> Dict[str, List[str]]:
+    """
+    Compara los hashes locales con los remotos.
+
+    Returns:
+        Dict[str, List[str]]: IDs en added, changed, deleted y unchanged
+    """
+    def by_id(ids):
+        return sorted(ids, key=lambda product_id: (len(product_id), product_id))
+
+    return {
+        "added": by_id(set(local_hashes) - set(remote_hashes)),
+        "changed": by_id(
+            product_id for product_id in set(local_hashes) & set(remote_hashes)
+            if local_hashes[product_id] != remote_hashes[product_id]
+        ),
+        "deleted": by_id(set(remote_hashes) - set(local_hashes)),
+        "unchanged": by_id(
+            product_id for product_id in set(local_hashes) & set(remote_hashes)
+            if local_hashes[product_id] == remote_hashes[product_id]
+        ),
+    }
+
+
+def preview_changes(diff: Dict[str, List[str]], products_dict: Dict[str, Dict[str, Any]]):
+    """Muestra un preview de los cambios a subir."""
+    print(f"\n📦 Cambios en el catálogo:")
     print("=" * 60)
 
-    for i, product in enumerate(products, 1):
-        print(f"{i}. {product.get('name', 'Sin nombre')} - {product.get('price', 0)}€")
-        print(f"   ID: {product.get('id', 'Sin ID')}")
-        print(f"   Categoría: {product.get('category', 'N/A')} | Liga: {product.get('league', 'N/A')}")
-        if 'images' in product:
-            main_img = product['images'].get('main', '')
-            if main_img:
-                img_name = main_img.split('/')[-1]
-                print(f"   Imagen: {img_name}")
-            else:
-                print(f"   Imagen: ❌ Sin imagen")
-        print()
+    labels = {"added": "➕ Nuevos", "changed": "✏️  Modificados", "deleted": "🗑️  Eliminados"}
+    for kind, label in labels.items():
+        print(f"{label}: {len(diff[kind])}")
+        for product_id in diff[kind]:
+            product = products_dict.get(product_id, {})
+            name = product.get('name', '(eliminado del JSON)')
+            print(f"   {product_id}. {name}")
 
+    print(f"✔️  Sin cambios: {len(diff['unchanged'])}")
     print("=" * 60)
 
 
-def sync_products_to_firebase(json_path: str, confirm: bool = True):
+def build_batches(
+    diff: Dict[str, List[str]],
+    products_dict: Dict[str, Dict[str, Any]],
+    local_hashes: Dict[str, str],
+    manifest_only: List[str] = ()
+) -> List[Dict[str, Any]]:
     """
-    Sincroniza solo los productos a Firebase.
+    Agrupa los cambios en escrituras multi-ruta de como mucho BATCH_SIZE productos.
+
+    Cada producto se escribe junto con su hash del manifiesto, así que un lote
+    aplicado deja ambos coherentes aunque falle un lote posterior. Los IDs de
+    manifest_only (productos ya iguales en Firebase) solo escriben su hash.
+
+    Returns:
+        List[Dict[str, Any]]: Lotes de rutas (desde la raíz) y valores
+    """
+    batches = []
+    current: Dict[str, Any] = {}
+
+    for kind in ("added", "changed", "deleted"):
+        for product_id in diff[kind]:
+            if kind == "deleted":
+                current[f"products/{product_id}"] = None
+                current[f"{MANIFEST_PATH}/{product_id}"] = None
+            else:
+                current[f"products/{product_id}"] = products_dict[product_id]
+                current[f"{MANIFEST_PATH}/{product_id}"] = local_hashes[product_id]
+
+            if len(current) >= BATCH_SIZE * 2:
+                batches.append(current)
+                current = {}
+
+    for product_id in manifest_only:
+        current[f"{MANIFEST_PATH}/{product_id}"] = local_hashes[product_id]
+        if len(current) >= BATCH_SIZE * 2:
+            batches.append(current)
+            current = {}
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+def sync_products_to_firebase(
+    json_path: str,
+    confirm: bool = True,
+    dry_run: bool = False,
+    use_remote: bool = False
+):
+    """
+    Sincroniza solo los productos modificados a Firebase.
 
     Args:
         json_path: Ruta al archivo JSON
         confirm: Si es True, pide confirmación antes de subir
+        dry_run: Si es True, solo muestra los cambios sin escribir nada
+        use_remote: Comparar con /products en lugar del manifiesto de hashes
     """
     json_file = Path(json_path)
 
@@ -54,47 +208,64 @@ def sync_products_to_firebase(json_path: str, confirm: bool = True):
         print(f"❌ Error: No se encontró el archivo {json_path}")
         return False
 
-    # Mostrar preview
-    preview_products(json_file)
-
-    # Pedir confirmación
-    if confirm:
-        response = input("\n¿Deseas subir estos productos a Firebase? (sí/no): ").lower()
-        if response not in ['sí', 'si', 's', 'yes', 'y']:
-            print("❌ Operación cancelada")
-            return False
-
     # Leer datos
     print("\n🔄 Leyendo archivo JSON...")
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    products = data.get('products', [])
+    products_dict = load_local_products(json_file)
 
-    if not products:
+    if not products_dict:
         print("⚠️  No se encontraron productos en el JSON")
         return False
 
+    local_hashes = {product_id: product_hash(product) for product_id, product in products_dict.items()}
+
     # Conectar a Firebase
     print("🔗 Conectando a Firebase...")
     db = get_database()
 
-    # Convertir array de productos a diccionario
-    products_dict = {}
-    for product in products:
-        product_id = product.get('id')
-        if product_id:
-            # Convertir ID a string para Firebase (las claves deben ser strings)
-            products_dict[str(product_id)] = product
-        else:
-            print(f"⚠️  Producto sin ID encontrado: {product.get('name', 'Sin nombre')}")
+    remote_hashes, from_manifest = load_remote_hashes(db, use_remote)
+    diff = diff_products(local_hashes, remote_hashes)
+
+    # Si se comparó con /products, completar el manifiesto de los productos iguales
+    manifest_only = [] if from_manifest else diff["unchanged"]
+
+    # Mostrar preview
+    preview_changes(diff, products_dict)
+
+    pending = len(diff["added"]) + len(diff["changed"]) + len(diff["deleted"])
+    if pending == 0 and not manifest_only:
+        print("\n✅ El catálogo ya está actualizado")
+        return True
+
+    if dry_run:
+        print(f"\n🔍 Dry run: se escribirían {pending} productos (no se ha modificado nada)")
+        return True
+
+    # Pedir confirmación
+    if confirm:
+        response = input("\n¿Deseas subir estos cambios a Firebase? (sí/no): ").lower()
+        if response not in ['sí', 'si', 's', 'yes', 'y']:
+            print("❌ Operación cancelada")
+            return False
+
+    # Subir los cambios por lotes; la versión del catálogo va en el último
+    version = StockService.catalog_version(products_dict)
+    batches = build_batches(diff, products_dict, local_hashes, manifest_only)
+    batches[-1][StockService.CATALOG_VERSION_PATH] = version
+
+    print(f"📤 Subiendo {pending} productos en {len(batches)} lotes (versión {version})...")
+    if manifest_only:
+        print(f"   Registrando {len(manifest_only)} productos sin cambios en el manifiesto")
+    for index, batch in enumerate(batches, 1):
+        db.update(batch)
+        print(f"   Lote {index}/{len(batches)} ✔️")
 
-    # Subir productos
-    print(f"📤 Subiendo {len(products_dict)} productos a Firebase...")
-    db.child('products').set(products_dict)
+    # Recalcular los agregados de stock para esta versión (desde /products, que
+    # conserva el stock en vivo de los productos que no han cambiado)
+    stock = StockService.rebuild(version=version)
+    print(f"📦 Stock total: {stock['total']} unidades ({len(stock['low_stock'])} tallas con stock bajo)")
 
     print("\n✅ ¡Productos sincronizados exitosamente!")
-    print(f"📊 Total: {len(products_dict)} productos")
+    print(f"📊 Total: {len(products_dict)} productos ({pending} actualizados)")
     print(f"🔗 URL: https://sportstyle-store-default-rtdb.firebaseio.com")
 
     return True
@@ -110,9 +281,11 @@ def main():
 
     # Permitir modo sin confirmación con flag --yes
     confirm = '--yes' not in sys.argv and '-y' not in sys.argv
+    dry_run = '--dry-run' in sys.argv
+    use_remote = '--remote' in sys.argv
 
     try:
-        success = sync_products_to_firebase(json_path, confirm)
+        success = sync_products_to_firebase(json_path, confirm, dry_run, use_remote)
         sys.exit(0 if success else 1)
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -1,26 +1,194 @@
 #!/usr/bin/env python3
 """
 Script para subir los datos del JSON a Firebase Realtime Database.
-Uso: python scripts/upload_to_firebase.py
+
+El JSON se lee en streaming (elemento a elemento, sin cargarlo entero en
+memoria) y se sube en lotes de escrituras multi-ruta con varios hilos, con
+reintentos y backoff ante errores. El progreso se guarda en un fichero de
+checkpoint, así que una carga interrumpida continúa donde se quedó.
+
+Uso:
+    python scripts/upload_to_firebase.py                        # data/BBDD.json
+    python scripts/upload_to_firebase.py path/to/custom.json
+    python scripts/upload_to_firebase.py --workers=8 --chunk-size=1000
+    python scripts/upload_to_firebase.py --merge                # No vacía las colecciones antes
+    python scripts/upload_to_firebase.py --restart              # Ignora el checkpoint existente
 """
 
 import sys
 import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
+from typing import Dict, Any, Iterator, Tuple
+
+# Agregar la raíz del proyecto al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.config.firebase_config import get_database
+from backend.utils.json_stream import iter_collections
+from backend.utils.retry import call_with_retries
 
-# Agregar el directorio backend al path
-backend_path = Path(__file__).parent.parent / "backend"
-sys.path.insert(0, str(backend_path))
 
-from config.firebase_config import get_database
+# Colecciones que se suben (el resto del JSON se ignora)
+COLLECTIONS = ['products', 'categories', 'leagues', 'users', 'orders', 'carts', 'cart_items']
 
+DEFAULT_WORKERS = 4
+DEFAULT_CHUNK_SIZE = 500
+PROGRESS_INTERVAL_SECONDS = 2.0
 
-def upload_json_to_firebase(json_file_path: str):
+
+class Checkpoint:
+    """
+    Progreso de una carga: lotes ya escritos por colección.
+
+    Solo es válido para el mismo fichero de origen (tamaño y fecha de
+    modificación) y el mismo tamaño de lote; si no coinciden se empieza de cero.
     """
-    Lee el archivo JSON y sube los datos a Firebase Realtime Database.
+
+    SAVE_INTERVAL_SECONDS = 1.0
+
+    def __init__(self, path: Path, source: Path, chunk_size: int, restart: bool = False):
+        self.path = path
+        self._last_save = 0.0
+
+        stat = source.stat()
+        fresh = {
+            "source": str(source.resolve()),
+            "source_size": stat.st_size,
+            "source_mtime": stat.st_mtime,
+            "chunk_size": chunk_size,
+            "collections": {},
+        }
+
+        self.data = fresh
+        self.resumed = False
+        self._done: Dict[str, set] = {}
+        if path.exists() and not restart:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            same_source = all(saved.get(key) == fresh[key] for key in ("source", "source_size", "source_mtime"))
+            if same_source and saved.get("chunk_size") == chunk_size:
+                self.data = saved
+                self.resumed = True
+                self._done = {
+                    collection: set(progress["done"])
+                    for collection, progress in saved["collections"].items()
+                }
+            else:
+                print("⚠️  El checkpoint existente es de otro fichero o tamaño de lote: se empieza de cero")
+
+    def _collection(self, collection: str) -> Dict[str, Any]:
+        return self.data["collections"].setdefault(collection, {"cleared": False, "done": []})
+
+    def is_done(self, collection: str, chunk_index: int) -> bool:
+        return chunk_index in self._done.get(collection, ())
+
+    def mark_done(self, collection: str, chunk_index: int):
+        self._collection(collection)["done"].append(chunk_index)
+        self._done.setdefault(collection, set()).add(chunk_index)
+
+    def is_cleared(self, collection: str) -> bool:
+        return self._collection(collection)["cleared"]
+
+    def mark_cleared(self, collection: str):
+        self._collection(collection)["cleared"] = True
+        self.save(force=True)
+
+    def save(self, force: bool = False):
+        """Guarda el checkpoint (como mucho una vez por segundo salvo force)."""
+        now = time.monotonic()
+        if not force and now - self._last_save < self.SAVE_INTERVAL_SECONDS:
+            return
+        self._last_save = now
+
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f)
+        os.replace(tmp_path, self.path)
+
+    def delete(self):
+        self.path.unlink(missing_ok=True)
+
+
+def item_key(index, item: Any) -> str:
+    """
+    Clave de Firebase de un elemento de una colección.
+
+    Los elementos de un array usan su 'id' (como string) o, si no tienen,
+    item_{indice}; los miembros de un objeto conservan su clave.
+    """
+    if isinstance(index, str):
+        return index
+    if isinstance(item, dict) and 'id' in item:
+        # Convertir ID a string para Firebase (las claves deben ser strings)
+        return str(item['id'])
+    return f"item_{index}"
+
+
+def iter_chunks(stream, chunk_size: int) -> Iterator[Tuple[str, int, Dict[str, Any]]]:
+    """
+    Agrupa los elementos del JSON en lotes de escrituras multi-ruta.
+
+    Args:
+        stream: Fichero JSON abierto
+        chunk_size: Elementos por lote
+
+    Yields:
+        Tuple[str, int, Dict[str, Any]]: (colección, número de lote, rutas y valores)
+    """
+    current_collection = None
+    chunk_index = 0
+    updates: Dict[str, Any] = {}
+
+    for collection, index, value in iter_collections(stream):
+        if collection != current_collection:
+            if updates:
+                yield current_collection, chunk_index, updates
+            current_collection, chunk_index, updates = collection, 0, {}
+
+        if index is None:
+            # Valor simple en la raíz de la colección
+            yield collection, chunk_index, {collection: value}
+            chunk_index += 1
+            continue
+
+        updates[f"{collection}/{item_key(index, value)}"] = value
+        if len(updates) >= chunk_size:
+            yield collection, chunk_index, updates
+            chunk_index += 1
+            updates = {}
+
+    if updates:
+        yield current_collection, chunk_index, updates
+
+
+def write_chunk(db, updates: Dict[str, Any]):
+    """Escribe un lote con reintentos y backoff exponencial."""
+    def on_retry(attempt, error, delay):
+        print(f"   ↻ Reintento {attempt} en {delay:.1f}s: {error}")
+
+    call_with_retries(lambda: db.update(updates), attempts=6, on_retry=on_retry)
+
+
+def upload_json_to_firebase(
+    json_file_path: str,
+    workers: int = DEFAULT_WORKERS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    replace: bool = True,
+    restart: bool = False
+):
+    """
+    Lee el archivo JSON en streaming y sube los datos a Firebase Realtime Database.
 
     Args:
         json_file_path: Ruta al archivo JSON con los datos
+        workers: Hilos que escriben lotes en paralelo
+        chunk_size: Elementos por escritura multi-ruta
+        replace: Vaciar cada colección antes de subirla (como la carga completa original)
+        restart: Ignorar el checkpoint y empezar de cero
     """
     print("🔄 Iniciando carga de datos a Firebase...")
 
@@ -30,42 +198,89 @@ def upload_json_to_firebase(json_file_path: str):
         print(f"❌ Error: No se encontró el archivo {json_file_path}")
         return
 
-    print(f"📖 Leyendo datos de {json_path}...")
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    checkpoint = Checkpoint(json_path.with_name(json_path.name + ".upload-checkpoint.json"), json_path, chunk_size, restart)
+    if checkpoint.resumed:
+        print(f"⏯️  Reanudando carga anterior desde {checkpoint.path.name}")
 
     # Obtener referencia a la base de datos
     print("🔗 Conectando a Firebase Realtime Database...")
     db = get_database()
 
-    # Subir cada colección por separado
-    collections = ['products', 'categories', 'leagues', 'users', 'orders', 'cart_items']
-
-    for collection in collections:
-        if collection in data:
-            print(f"📤 Subiendo {collection}...")
-
-            # Para arrays, crear un diccionario con IDs como claves
-            if isinstance(data[collection], list):
-                # Convertir array a diccionario usando el ID como clave
-                collection_dict = {}
-                for item in data[collection]:
-                    if 'id' in item:
-                        # Convertir ID a string para Firebase (las claves deben ser strings)
-                        item_id = str(item['id'])
-                        collection_dict[item_id] = item
-                    else:
-                        # Si no hay ID, usar el índice
-                        collection_dict[f"item_{len(collection_dict)}"] = item
-
-                db.child(collection).set(collection_dict)
-                print(f"   ✅ {len(collection_dict)} {collection} subidos")
-            else:
-                db.child(collection).set(data[collection])
-                print(f"   ✅ {collection} subido")
+    print(f"📖 Leyendo datos de {json_path} ({workers} hilos, lotes de {chunk_size})...")
+
+    rows_by_collection: Dict[str, int] = {}
+    skipped_rows = 0
+    written_rows = 0
+    started = time.monotonic()
+    last_report = started
+    in_flight = {}
+
+    def collect(done):
+        """Registra los lotes terminados (propaga el error si alguno falló)."""
+        nonlocal written_rows
+        for future in done:
+            collection, chunk_index, rows = in_flight.pop(future)
+            future.result()
+            checkpoint.mark_done(collection, chunk_index)
+            written_rows += rows
+        checkpoint.save()
+
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f, ThreadPoolExecutor(max_workers=workers) as pool:
+            for collection, chunk_index, updates in iter_chunks(f, chunk_size):
+                if collection not in COLLECTIONS:
+                    continue
+
+                if collection not in rows_by_collection:
+                    print(f"📤 Subiendo {collection}...")
+                rows_by_collection[collection] = rows_by_collection.get(collection, 0) + len(updates)
+
+                if checkpoint.is_done(collection, chunk_index):
+                    skipped_rows += len(updates)
+                    continue
+
+                if replace and not checkpoint.is_cleared(collection):
+                    # Vaciar antes del primer lote (solo una vez, aunque se reanude)
+                    call_with_retries(lambda: db.child(collection).delete())
+                    checkpoint.mark_cleared(collection)
+
+                future = pool.submit(write_chunk, db, updates)
+                in_flight[future] = (collection, chunk_index, len(updates))
+
+                # Limitar los lotes en vuelo para que la memoria no crezca
+                if len(in_flight) >= workers * 2:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+                now = time.monotonic()
+                if now - last_report >= PROGRESS_INTERVAL_SECONDS:
+                    rate = written_rows / (now - started)
+                    print(f"   ⏱️  {written_rows} filas escritas · {rate:,.0f} filas/s")
+                    last_report = now
+
+            done, _ = wait(in_flight)
+            collect(done)
+    except BaseException:
+        # Guardar lo completado para poder reanudar
+        for future in [future for future in in_flight if future.done() and not future.exception()]:
+            collection, chunk_index, rows = in_flight.pop(future)
+            checkpoint.mark_done(collection, chunk_index)
+        checkpoint.save(force=True)
+        print(f"\n💾 Progreso guardado en {checkpoint.path}; vuelve a ejecutar el script para reanudar")
+        raise
+
+    elapsed = time.monotonic() - started
+    checkpoint.delete()
+
+    for collection in COLLECTIONS:
+        if collection in rows_by_collection:
+            print(f"   ✅ {rows_by_collection[collection]} {collection} subidos")
         else:
             print(f"   ⚠️  {collection} no encontrado en el JSON")
 
+    rate = written_rows / elapsed if elapsed > 0 else 0
+    print(f"\n⏱️  {written_rows} filas en {elapsed:.1f}s ({rate:,.0f} filas/s)"
+          + (f", {skipped_rows} ya subidas en la ejecución anterior" if skipped_rows else ""))
     print("\n🎉 ¡Datos subidos exitosamente a Firebase!")
     print(f"🔗 Base de datos: https://sportstyle-store-default-rtdb.europe-west1.firebasedatabase.app")
 
@@ -76,10 +291,25 @@ def main():
     default_json_path = Path(__file__).parent.parent / "data" / "BBDD.json"
 
     # Permitir ruta personalizada como argumento
-    json_path = sys.argv[1] if len(sys.argv) > 1 else str(default_json_path)
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('-')]
+    json_path = args[0] if args else str(default_json_path)
+
+    workers = DEFAULT_WORKERS
+    chunk_size = DEFAULT_CHUNK_SIZE
+    for arg in sys.argv[1:]:
+        if arg.startswith('--workers='):
+            workers = int(arg.split('=', 1)[1])
+        elif arg.startswith('--chunk-size='):
+            chunk_size = int(arg.split('=', 1)[1])
 
     try:
-        upload_json_to_firebase(json_path)
+        upload_json_to_firebase(
+            json_path,
+            workers=workers,
+            chunk_size=chunk_size,
+            replace='--merge' not in sys.argv,
+            restart='--restart' in sys.argv
+        )
     except Exception as e:
         print(f"\n❌ Error durante la carga: {e}")
         import traceback
@@ -0,0 +1,56 @@
+"""
+Script de prueba del contador de usuarios activos al desactivar usuarios.
+Usa la Realtime Database en memoria, sin conexión con Firebase.
+"""
+
+import sys
+import os
+import threading
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from backend.config.firebase_config import use_database
+from backend.services.metrics_service import MetricsService
+from backend.services.user_service import UserService
+from backend.utils.fake_rtdb import FakeDatabase
+from benchmarks.fixtures import build_dataset
+
+
+def test_concurrent_deactivations_count_once():
+    """Varias desactivaciones simultáneas del mismo usuario restan una sola vez."""
+    fake = FakeDatabase(build_dataset(users=4, orders_per_user=0, cart_items=0, seed=1))
+    use_database(fake)
+    try:
+        MetricsService.rebuild()
+
+        # Con latencia, todas las peticiones leen el usuario antes de que se escriba
+        fake.latency_ms = 5
+        threads = [threading.Thread(target=UserService.delete_user, args=(1,)) for _ in range(3)]
+        threads += [threading.Thread(target=UserService.update_user, args=(1,), kwargs={"activo": False})
+                    for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        fake.latency_ms = 0
+        incremental = fake.dump()["stats"]["summary"]
+        rebuilt = MetricsService.rebuild()
+    finally:
+        use_database(None)
+
+    assert incremental["active_users"] == rebuilt["active_users"] == 3
+
+
+def test_missing_user_is_not_created():
+    """Desactivar un usuario inexistente devuelve False sin escribir nada."""
+    fake = FakeDatabase({"users": {}})
+    use_database(fake)
+    try:
+        assert UserService.delete_user(99) is False
+        assert UserService.update_user(99, activo=True) is False
+    finally:
+        use_database(None)
+
+    assert fake.dump() == {}
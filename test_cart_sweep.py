@@ -0,0 +1,63 @@
+"""
+Script de prueba del barrido de carritos abandonados (CartService.sweep_abandoned)
+y de la lectura paginada por valor (iter_children_by_value).
+Usa la Realtime Database en memoria, sin conexión con Firebase.
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from backend.config.firebase_config import use_database
+from backend.services.cart_service import CartService
+from backend.utils.fake_rtdb import FakeDatabase
+from backend.utils.rtdb import iter_children_by_value
+
+
+def days_ago(days: int) -> str:
+    return (datetime.utcnow() - timedelta(days=days)).isoformat()
+
+
+def cart(updated_at: str, lines: int = 1) -> dict:
+    return {
+        "items": {str(i + 1): {"product_id": i + 1, "quantity": 1, "size": "M", "subtotal": 10.0} for i in range(lines)},
+        "total_items": lines,
+        "updated_at": updated_at,
+    }
+
+
+def test_iter_children_by_value_pages_through_repeated_values():
+    """Recorre todo el rango por páginas, aunque muchos hijos compartan valor."""
+    carts = {f"user{i:02d}": {"updated_at": f"2025-01-{1 + i // 4:02d}"} for i in range(30)}
+    carts["sin_fecha"] = {"total_items": 1}
+    carts["reciente"] = {"updated_at": "2025-12-31"}
+    fake = FakeDatabase({"carts": carts})
+
+    keys = [key for key, _ in iter_children_by_value(fake.reference("carts"), "updated_at", "", "2025-06-30", page_size=3)]
+
+    assert sorted(keys) == sorted(f"user{i:02d}" for i in range(30))
+    assert len(keys) == len(set(keys))
+    assert fake.summary()["by_op"]["query"] > 1
+
+
+def test_sweep_removes_only_idle_carts():
+    """Se borran los carritos sin cambios desde el corte; los activos y los sin fecha se quedan."""
+    fake = FakeDatabase({"carts": {
+        **{f"idle{i}": cart(days_ago(40 + i), lines=2) for i in range(5)},
+        "active": cart(days_ago(1)),
+        "undated": {"total_items": 0},
+    }})
+    use_database(fake)
+    try:
+        result = CartService.sweep_abandoned(max_idle_days=30, archive=True, page_size=2, batch_size=2)
+    finally:
+        use_database(None)
+
+    data = fake.dump()
+    assert result["carts"] == 5 and result["items"] == 10
+    assert set(data["carts"]) == {"active", "undated"}
+    assert set(data["carts_archive"]) == {f"idle{i}" for i in range(5)}
+
@@ -0,0 +1,44 @@
+"""
+Script de prueba de las transacciones de la Realtime Database en memoria
+(backend/utils/fake_rtdb.py), que deben comportarse como las del SDK.
+"""
+
+import sys
+import os
+import threading
+
+import pytest
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from backend.utils.fake_rtdb import FakeDatabase
+
+
+def test_transaction_rejects_none_like_the_sdk():
+    """Devolver None no borra el nodo: falla como set_if_unchanged del SDK."""
+    fake = FakeDatabase({"counter": 1})
+
+    with pytest.raises(ValueError):
+        fake.reference("counter").transaction(lambda current: None)
+
+    assert fake.dump() == {"counter": 1}
+
+
+def test_concurrent_transactions_retry_on_conflict():
+    """Con escrituras simultáneas, las transacciones se repiten y no se pierde ningún incremento."""
+    fake = FakeDatabase({"counter": 0}, latency_ms=5)
+    calls = []
+
+    def add_one(current):
+        calls.append(current)
+        return (current or 0) + 1
+
+    threads = [threading.Thread(target=fake.reference("counter").transaction, args=(add_one,)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fake.dump() == {"counter": 6}
+    assert len(calls) > 6
@@ -0,0 +1,41 @@
+"""
+Script de prueba de la serialización JSON rápida (backend/utils/fast_json.py).
+"""
+
+import json
+import sys
+import os
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from fastapi.encoders import jsonable_encoder
+
+from backend.services.order_service import OrderService
+from backend.utils import fast_json
+from benchmarks.generate_dataset import DatasetGenerator
+
+
+def sample_orders(count: int = 5):
+    generator = DatasetGenerator(products=20, users=5, orders=count, carts=0, seed=3)
+    return [OrderService._build_order(order) for _, order in generator.orders()]
+
+
+def test_model_encoding_matches_fastapi_default():
+    """Los modelos codificados directamente dan el mismo JSON que jsonable_encoder."""
+    orders = sample_orders()
+    expected = jsonable_encoder(orders)
+    assert json.loads(fast_json.dump_model(orders)) == expected
+    assert json.loads(fast_json.FastJSONResponse(orders).body) == expected
+    assert json.loads(fast_json.FastJSONResponse({"orders": expected}).body) == {"orders": expected}
+
+
+def test_stdlib_fallback_matches_orjson(monkeypatch):
+    """Sin orjson, dumps/loads producen el mismo resultado con la librería estándar."""
+    value = {"pedido": jsonable_encoder(sample_orders(1))[0], "ciudad": "Cádiz", 7: [1.5, None, True]}
+    fast = fast_json.dumps(value)
+
+    monkeypatch.setattr(fast_json, "ORJSON_AVAILABLE", False)
+    slow = fast_json.dumps(value)
+    assert json.loads(slow) == json.loads(fast)
+    assert fast_json.loads(slow) == json.loads(fast)
@@ -0,0 +1,57 @@
+"""
+Script de prueba de la inicialización perezosa de Firebase (backend/config/firebase_config.py).
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from backend.config import firebase_config
+
+
+def test_concurrent_initialization_creates_a_single_app(monkeypatch):
+    """Con varios hilos a la vez, las credenciales se cargan una sola vez."""
+    calls = []
+
+    def slow_create_app():
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return "app"
+
+    monkeypatch.setattr(firebase_config, "_firebase_app", None)
+    monkeypatch.setattr(firebase_config, "_create_app", slow_create_app)
+
+    threads = [threading.Thread(target=firebase_config.initialize_firebase) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert firebase_config.firebase_status()["status"] == "ready"
+
+
+def test_failed_initialization_is_reported_and_retried(monkeypatch):
+    """Un fallo queda en firebase_status() y la siguiente llamada lo reintenta."""
+    attempts = []
+
+    def failing_create_app():
+        attempts.append(1)
+        raise FileNotFoundError("No Firebase credentials found.")
+
+    monkeypatch.setattr(firebase_config, "_firebase_app", None)
+    monkeypatch.setattr(firebase_config, "_create_app", failing_create_app)
+
+    firebase_config.warm_up_firebase().join()
+    status = firebase_config.firebase_status()
+    assert status["status"] == "error"
+    assert "FileNotFoundError" in status["error"]
+
+    monkeypatch.setattr(firebase_config, "_create_app", lambda: "app")
+    assert firebase_config.initialize_firebase() == "app"
+    assert len(attempts) == 1
+    assert firebase_config.firebase_status()["status"] == "ready"
@@ -0,0 +1,75 @@
+"""
+Script de prueba de la compresión (backend/core/compression.py) y los validadores HTTP (backend/core/http_cache.py).
+"""
+
+import asyncio
+import gzip
+import sys
+import os
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from backend.core.compression import CompressionMiddleware, choose_encoding
+from backend.core.http_cache import cached_response, etag_matches
+
+
+def call(app, headers):
+    """Ejecuta una app ASGI y devuelve (estado, cabeceras, cuerpo)."""
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(k.encode(), v.encode()) for k, v in headers.items()]}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    response_headers = {k.decode(): v.decode() for k, v in messages[0]["headers"]}
+    return messages[0]["status"], response_headers, b"".join(m.get("body", b"") for m in messages[1:])
+
+
+def test_choose_encoding_respects_quality_values():
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0, identity") is None
+    assert choose_encoding("*") in ("br", "gzip")
+    assert choose_encoding("identity") is None
+
+
+def test_large_json_is_gzipped_and_small_json_is_not():
+    """Por encima del umbral se comprime (con ETag débil); por debajo va tal cual, con Vary."""
+    payload = {"orders": [{"id": n, "estado": "entregado"} for n in range(500)]}
+    app = CompressionMiddleware(JSONResponse(payload, headers={"ETag": '"abc"'}), minimum_size=1024)
+    status, headers, body = call(app, {"accept-encoding": "gzip"})
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert headers["etag"] == 'W/"abc"'
+    assert int(headers["content-length"]) == len(body)
+    assert gzip.decompress(body) == JSONResponse(payload).body
+
+    status, headers, body = call(CompressionMiddleware(JSONResponse({"ok": True})), {"accept-encoding": "gzip"})
+    assert "content-encoding" not in headers
+    assert headers["vary"] == "Accept-Encoding"
+    assert body == b'{"ok":true}'
+
+
+def test_cached_response_returns_304_for_matching_etag():
+    """Con el ETag vigente la respuesta es 304 sin cuerpo; si cambian los datos, 200."""
+    def request(headers):
+        return Request({"type": "http", "method": "GET", "path": "/", "headers": [(k.encode(), v.encode()) for k, v in headers.items()]})
+
+    first = cached_response(request({}), {"nombre": "Ana"})
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    again = cached_response(request({"if-none-match": f"W/{etag}"}), {"nombre": "Ana"})
+    assert again.status_code == 304 and again.body == b""
+    assert cached_response(request({"if-none-match": etag}), {"nombre": "Eva"}).status_code == 200
+
+    versioned = cached_response(request({}), {"spans": []}, version="trace-1", max_age=60)
+    assert etag_matches(versioned.headers["etag"], versioned.headers["etag"].removeprefix("W/"))
@@ -0,0 +1,95 @@
+"""
+Script de prueba de las métricas de la API (backend/core/metrics.py).
+Ejecuta el middleware sobre una aplicación ASGI mínima y la Realtime Database
+en memoria, sin servidor HTTP ni conexión con Firebase.
+"""
+
+import asyncio
+import sys
+import os
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from backend.config.firebase_config import get_database, use_database
+from backend.core import metrics
+from backend.utils import instrumented_rtdb
+from backend.utils.fake_rtdb import FakeDatabase
+
+
+def endpoint():
+    """Endpoint de prueba: dos lecturas de la base de datos."""
+    get_database().child('users').child('1').get()
+    get_database().child('users').child('2').get()
+
+
+async def app(scope, receive, send):
+    """Aplicación ASGI mínima: el endpoint resuelto por el "router" queda en el scope."""
+    await receive()
+    scope["endpoint"] = endpoint
+    endpoint()
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"hola"})
+
+
+class Route:
+    path = "/users/{user_id}"
+    endpoint = staticmethod(endpoint)
+
+
+class App:
+    routes = [Route()]
+
+
+def call(middleware, body: bytes = b"{}"):
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        pass
+
+    scope = {"type": "http", "method": "POST", "path": "/users/1", "app": App()}
+    asyncio.run(middleware(scope, receive, send))
+
+
+def test_middleware_records_route_status_sizes_and_storage_calls():
+    """Cada petición cuenta por plantilla de ruta, con tamaños y llamadas a la base de datos."""
+    use_database(FakeDatabase({"users": {"1": {"id": 1}, "2": {"id": 2}}}))
+    middleware = metrics.MetricsMiddleware(app)
+    try:
+        call(middleware)
+        call(middleware)
+        text = metrics.render()
+    finally:
+        instrumented_rtdb.remove_listener(metrics.record_storage_call)
+        use_database(None)
+
+    assert 'http_requests_total{method="POST",route="/users/{user_id}",status="200"} 2' in text
+    assert 'http_request_duration_seconds_count{method="POST",route="/users/{user_id}"} 2' in text
+    assert 'http_request_size_bytes_sum{route="/users/{user_id}"} 4.0' in text
+    assert 'http_response_size_bytes_sum{route="/users/{user_id}"} 8.0' in text
+    assert 'http_request_storage_calls_sum{route="/users/{user_id}"} 4.0' in text
+    assert 'storage_calls_total{op="get",collection="users"} 4' in text
+    assert 'http_requests_in_flight 0' in text
+
+
+def test_histogram_buckets_are_cumulative():
+    """Los cubos del histograma son acumulados y terminan en +Inf."""
+    histogram = metrics.Histogram("test_seconds", "Prueba", ("op",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, "get")
+
+    lines = histogram.render()
+    assert 'test_seconds_bucket{op="get",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{op="get",le="1.0"} 2' in lines
+    assert 'test_seconds_bucket{op="get",le="+Inf"} 3' in lines
+    assert 'test_seconds_count{op="get"} 3' in lines
+
+
+def test_get_database_is_not_wrapped_without_listeners():
+    """Sin listeners, get_database() devuelve la referencia sin instrumentar."""
+    use_database(FakeDatabase({}))
+    try:
+        assert not isinstance(get_database(), instrumented_rtdb.InstrumentedReference)
+    finally:
+        use_database(None)
@@ -0,0 +1,66 @@
+"""
+Script de prueba para los IDs de pedido ordenables por tiempo.
+No necesita conexión con Firebase.
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from backend.utils.ids import MonotonicIdGenerator
+
+
+def test_ids_are_monotonic_and_unique():
+    """Los IDs generados en ráfaga son únicos y respetan el orden de creación."""
+    generator = MonotonicIdGenerator("ORD")
+    ids = [generator.generate() for _ in range(5000)]
+
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+
+
+def test_lexicographic_order_matches_creation_time():
+    """El orden de las claves coincide con el orden temporal, también entre días."""
+    generator = MonotonicIdGenerator("ORD")
+    base = datetime(2025, 12, 5, 23, 59, 59)
+    moments = [base + timedelta(milliseconds=250 * i) for i in range(20)]
+    ids = [generator.generate(moment) for moment in moments]
+
+    assert ids == sorted(ids)
+    assert ids[0].startswith("ORD-20251205-")
+    assert ids[-1].startswith("ORD-20251206-")
+
+
+def test_key_range_contains_only_ids_of_the_range():
+    """Los límites de key_range() incluyen los IDs del rango y excluyen el resto."""
+    generator = MonotonicIdGenerator("ORD")
+    start = datetime(2025, 12, 5)
+    end = datetime(2025, 12, 5, 23, 59, 59)
+    low, high = generator.key_range(start, end)
+
+    inside = generator.generate(datetime(2025, 12, 5, 12, 0))
+    before = generator.generate(datetime(2025, 12, 4, 23, 59, 59))
+    after = generator.generate(datetime(2025, 12, 6, 0, 0, 0))
+
+    assert low <= inside <= high
+    assert before < low
+    assert after > high
+
+
+def test_timestamp_roundtrip():
+    """El instante de creación se puede recuperar del propio ID."""
+    generator = MonotonicIdGenerator("ORD")
+    moment = datetime(2025, 12, 5, 10, 30, 15, 123000)
+
+    assert generator.timestamp_of(generator.generate(moment)) == moment
+
+
+if __name__ == "__main__":
+    test_ids_are_monotonic_and_unique()
+    test_lexicographic_order_matches_creation_time()
+    test_key_range_contains_only_ids_of_the_range()
+    test_timestamp_roundtrip()
+    print("✅ Todas las pruebas de IDs de pedido pasaron")
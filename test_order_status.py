@@ -0,0 +1,61 @@
+"""
+Script de prueba de los cambios de estado de pedido y sus métricas agregadas.
+Usa la Realtime Database en memoria, sin conexión con Firebase.
+"""
+
+import sys
+import os
+import threading
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from backend.config.firebase_config import use_database
+from backend.models.models import OrderStatusEnum
+from backend.services.metrics_service import MetricsService
+from backend.services.order_service import OrderService
+from backend.utils.fake_rtdb import FakeDatabase
+from benchmarks.fixtures import build_dataset
+
+
+def test_concurrent_transitions_count_once():
+    """Varios cambios simultáneos desde el mismo estado ajustan los contadores una sola vez."""
+    fake = FakeDatabase(build_dataset(users=3, orders_per_user=2, cart_items=0, seed=1))
+    use_database(fake)
+    try:
+        order_id = next(iter(fake.dump()["orders"]))
+        fake.reference(f"orders/{order_id}/status").set(OrderStatusEnum.PENDING.value)
+        MetricsService.rebuild()
+
+        # Con latencia, todas las peticiones leen el pedido antes de que se escriba
+        fake.latency_ms = 5
+        threads = [
+            threading.Thread(target=OrderService.update_order_status, args=(order_id, OrderStatusEnum.CANCELLED))
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        fake.latency_ms = 0
+        incremental = fake.dump()["stats"]["summary"]
+        rebuilt = MetricsService.rebuild()
+    finally:
+        use_database(None)
+
+    assert fake.dump()["orders"][order_id]["status"] == OrderStatusEnum.CANCELLED.value
+    assert incremental["orders_by_status"] == rebuilt["orders_by_status"]
+    assert round(incremental["total_revenue"], 2) == round(rebuilt["total_revenue"], 2)
+
+
+def test_update_missing_order_returns_none():
+    """Un pedido inexistente no se crea al cambiarle el estado."""
+    fake = FakeDatabase({"orders": {}})
+    use_database(fake)
+    try:
+        assert OrderService.update_order_status("ORD-NOPE", OrderStatusEnum.SHIPPED) is None
+    finally:
+        use_database(None)
+
+    assert "orders" not in fake.dump()
@@ -0,0 +1,47 @@
+"""
+Script de prueba del profiler por muestreo (backend/core/profiler.py).
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from backend.core.profiler import SamplingProfiler
+
+
+def busy_loop(seconds: float):
+    """Función que ocupa la CPU para que aparezca en las muestras."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(100))
+
+
+def test_samples_only_the_requested_thread():
+    """Las muestras son del hilo pedido y contienen la función que se ejecuta."""
+    profiler = SamplingProfiler(interval=0.001, thread_ids=[threading.get_ident()]).start()
+    busy_loop(0.2)
+    profiler.stop()
+
+    assert profiler.samples
+    assert all(stack[0][0] == threading.current_thread().name for stack in profiler.samples)
+    assert any(frame[0] == "busy_loop" for stack in profiler.samples for frame in stack)
+    assert "test_profiler:busy_loop" in profiler.folded()
+
+
+def test_speedscope_export_references_shared_frames():
+    """El perfil de speedscope es de tipo sampled y sus muestras apuntan a marcos existentes."""
+    profiler = SamplingProfiler(interval=0.001, thread_ids=[threading.get_ident()]).start()
+    busy_loop(0.1)
+    profiler.stop()
+
+    data = profiler.speedscope("prueba")
+    frames = data["shared"]["frames"]
+    profile = data["profiles"][0]
+    assert profile["type"] == "sampled"
+    assert len(profile["samples"]) == len(profile["weights"])
+    assert all(0 <= index < len(frames) for sample in profile["samples"] for index in sample)
+    assert profile["endValue"] >= 0.1
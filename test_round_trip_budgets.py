@@ -0,0 +1,34 @@
+"""
+Script de prueba de los presupuestos de llamadas a la base de datos.
+Ejecuta cada operación de servicio contra la Realtime Database en memoria
+(sin conexión con Firebase) y falla si supera lo fijado en benchmarks/budgets.json.
+
+Si un cambio reduce o aumenta a propósito las llamadas de una operación,
+actualiza los presupuestos con:
+    python benchmarks/budgets.py --update
+"""
+
+import sys
+import os
+
+import pytest
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from benchmarks.budgets import load_budgets, measure_all, over_budget
+
+MEASURED = measure_all()
+BUDGETS = load_budgets()
+
+
+def test_every_operation_has_a_budget():
+    """Toda operación medida tiene presupuesto (y no sobran presupuestos)."""
+    assert set(MEASURED) == set(BUDGETS)
+
+
+@pytest.mark.parametrize("operation", sorted(BUDGETS))
+def test_operation_within_budget(operation):
+    """La operación no hace más llamadas ni mueve más bytes de lo presupuestado."""
+    exceeded = over_budget(MEASURED[operation], BUDGETS[operation])
+    assert not exceeded, f"{operation} supera su presupuesto (medido, máximo): {exceeded}"
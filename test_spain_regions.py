@@ -0,0 +1,50 @@
+"""
+Script de prueba para la tabla de códigos postales -> comunidad autónoma.
+No necesita conexión con Firebase.
+"""
+
+import sys
+import os
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from backend.utils.spain_regions import PROVINCES, REGIONS, UNKNOWN_REGION, lookup_province, lookup_region
+
+
+def test_every_province_prefix_is_mapped():
+    """Los prefijos 01-52 tienen provincia y comunidad válidas."""
+    assert len(PROVINCES) == 53
+    for prefix in range(1, 53):
+        province = PROVINCES[prefix]
+        assert province is not None
+        assert 0 <= province.region < len(REGIONS)
+
+
+def test_lookup_known_postal_codes():
+    """Códigos postales reales se resuelven a su provincia y comunidad."""
+    assert lookup_region("28013").slug == "madrid"
+    assert lookup_region("08001").slug == "cataluna"
+    assert lookup_region("48001").slug == "pais-vasco"
+    assert lookup_region("38001").slug == "canarias"
+    assert lookup_province("41001").name == "Sevilla"
+
+
+def test_lookup_tolerates_numeric_codes():
+    """Un código guardado como número (sin el 0 inicial) sigue resolviéndose."""
+    assert lookup_province(8001).name == "Barcelona"
+    assert lookup_region(" 46 001 ").slug == "valencia"
+
+
+def test_invalid_codes_fall_back_to_unknown():
+    """Códigos vacíos, fuera de rango o con letras van a la región desconocida."""
+    for code in (None, "", "00123", "53000", "99999", "ABCDE", "280011"):
+        assert lookup_region(code) == UNKNOWN_REGION
+
+
+if __name__ == "__main__":
+    test_every_province_prefix_is_mapped()
+    test_lookup_known_postal_codes()
+    test_lookup_tolerates_numeric_codes()
+    test_invalid_codes_fall_back_to_unknown()
+    print("✅ Tabla de regiones correcta")
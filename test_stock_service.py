@@ -0,0 +1,113 @@
+"""
+Script de prueba de los cambios de stock y sus agregados (StockService).
+Usa la Realtime Database en memoria, sin conexión con Firebase.
+"""
+
+import sys
+import os
+import threading
+
+import pytest
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from backend.config.firebase_config import use_database
+from backend.services.stock_service import StockService
+from backend.utils.fake_rtdb import FakeDatabase
+
+PRODUCTS = {
+    "101": {"name": "Camiseta local", "team": "Real Madrid", "league": "LaLiga", "category": "futbol",
+        "active": True, "stock": {"S": 3, "M": 10}},
+    "205": {"name": "Camiseta visitante", "team": "Barcelona", "league": "LaLiga", "category": "futbol",
+        "active": True, "stock": {"M": 8}},
+}
+
+
+@pytest.fixture
+def fake():
+    database = FakeDatabase({"products": PRODUCTS})
+    use_database(database)
+    StockService.rebuild()
+    yield database
+    use_database(None)
+
+
+def assert_aggregates_match_catalog(database, exact_low_stock: bool = True):
+    """
+    Los agregados incrementales coinciden con un recálculo completo.
+
+    Con cambios simultáneos de una misma talla solo se comprueba qué tallas
+    están en low_stock: su stock es el del último en escribir.
+    """
+    data = database.dump()
+    expected = StockService.compute(data["products"])
+    stats = data["stats"]["stock"]
+    for field in ("total", "by_category", "by_league", "by_team"):
+        assert stats[field] == expected[field]
+    low_stock = stats.get("low_stock") or {}
+    if exact_low_stock:
+        assert low_stock == expected["low_stock"]
+    else:
+        assert set(low_stock) == set(expected["low_stock"])
+
+
+def test_adjust_and_set_keep_aggregates_and_low_stock_consistent(fake):
+    """Tras ajustar y fijar stock, los totales y low_stock reflejan el stock real."""
+    assert StockService.adjust_stock(101, "M", -6) == 4
+    assert StockService.adjust_stock("101", "S", 5) == 8
+    assert StockService.set_stock(205, "M", 2) == 2
+    assert StockService.set_stock(205, "M", 2) == 2
+
+    assert_aggregates_match_catalog(fake)
+    low_stock = fake.dump()["stats"]["stock"]["low_stock"]
+    assert set(low_stock) == {"101-M", "205-M"}
+    assert low_stock["101-M"]["stock"] == 4
+
+
+def test_restock_above_threshold_removes_low_stock_entry(fake):
+    """Al reponer por encima del umbral, la talla sale de low_stock."""
+    assert "101-S" in fake.dump()["stats"]["stock"]["low_stock"]
+
+    assert StockService.adjust_stock(101, "S", 10) == 13
+    assert StockService.set_stock(205, "M", 20) == 20
+
+    assert "101-S" not in (fake.dump()["stats"]["stock"].get("low_stock") or {})
+    assert_aggregates_match_catalog(fake)
+
+
+def test_stock_never_goes_negative(fake):
+    """Un ajuste que dejaría el stock negativo falla sin escribir nada."""
+    with pytest.raises(ValueError):
+        StockService.adjust_stock(101, "S", -4)
+    with pytest.raises(ValueError):
+        StockService.set_stock(101, "S", -1)
+    with pytest.raises(ValueError):
+        StockService.adjust_stock(101, "XL", 1)
+
+    assert fake.dump()["products"]["101"]["stock"]["S"] == 3
+    assert_aggregates_match_catalog(fake)
+
+
+def test_concurrent_decrements_do_not_oversell(fake):
+    """Con 3 unidades, de 8 restas simultáneas solo 3 se aplican."""
+    errors = []
+    # Con latencia, todas las peticiones leen el stock antes de que se escriba
+    fake.latency_ms = 5
+
+    def buy():
+        try:
+            StockService.adjust_stock(101, "S", -1)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=buy) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    fake.latency_ms = 0
+
+    assert len(errors) == 5
+    assert fake.dump()["products"]["101"]["stock"]["S"] == 0
+    assert_aggregates_match_catalog(fake, exact_low_stock=False)
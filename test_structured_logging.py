@@ -0,0 +1,56 @@
+"""
+Script de prueba del logging estructurado (backend/core/logger.py).
+"""
+
+import json
+import logging
+import queue
+import sys
+import os
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from backend.core.logger import DroppingQueueHandler, JsonFormatter, SamplingFilter
+
+
+def make_record(msg: str, *args, level: int = logging.WARNING, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("sportstyle.test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_sampling_limits_repeated_messages_and_reports_suppressed():
+    """Un mensaje repetido se emite `burst` veces por ventana; el siguiente avisa de los omitidos."""
+    sampler = SamplingFilter(burst=3, window=60)
+    passed = [sampler.filter(make_record("Error al sincronizar %s", n)) for n in range(10)]
+    assert passed == [True] * 3 + [False] * 7
+
+    # Otra plantilla no se ve afectada y los errores nunca se muestrean
+    assert sampler.filter(make_record("Otro mensaje"))
+    assert all(sampler.filter(make_record("Error al sincronizar %s", n, level=logging.ERROR)) for n in range(10))
+
+    # Nueva ventana: el primer registro lleva los omitidos
+    sampler.window = 0
+    record = make_record("Error al sincronizar %s", 99)
+    assert sampler.filter(record)
+    assert record.suppressed == 7
+
+
+def test_full_queue_drops_instead_of_blocking():
+    """Con la cola llena el registro se descarta y se cuenta."""
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+    for n in range(5):
+        handler.handle(make_record("mensaje %d", n))
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_json_formatter_includes_extra_fields():
+    """Cada registro es un objeto JSON con los campos de `extra` y el ID de petición."""
+    line = JsonFormatter().format(make_record("Pedido %s creado", "ORD-1", request_id="abc", duration_ms=12.5))
+    data = json.loads(line)
+    assert data["msg"] == "Pedido ORD-1 creado"
+    assert data["level"] == "WARNING"
+    assert data["request_id"] == "abc"
+    assert data["duration_ms"] == 12.5
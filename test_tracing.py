@@ -0,0 +1,58 @@
+"""
+Script de prueba de las trazas por petición (backend/core/tracing.py).
+Usa la Realtime Database en memoria, sin conexión con Firebase.
+"""
+
+import sys
+import os
+
+# Añadir paths
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from backend.config.firebase_config import use_database
+from backend.core import tracing
+from backend.services.user_service import UserService
+from backend.utils import instrumented_rtdb
+from backend.utils.fake_rtdb import FakeDatabase
+
+
+def test_service_methods_and_storage_calls_are_nested_spans():
+    """Los métodos del servicio y sus llamadas a la base de datos quedan anidados."""
+    use_database(FakeDatabase({"users": {"1": {"id": 1, "email": "a@example.com"}}}))
+    instrumented_rtdb.add_listener(tracing.record_storage_call)
+    try:
+        trace = tracing.start_trace("GET /test")
+        with tracing.span("handler"):
+            UserService.get_user_by_id(1)
+        tracing.finish_trace(trace)
+    finally:
+        instrumented_rtdb.remove_listener(tracing.record_storage_call)
+        use_database(None)
+
+    spans = {span.name: span for span in trace.spans}
+    assert spans["handler"].parent_id is None
+    assert spans["UserService.get_user_by_id"].parent_id == spans["handler"].span_id
+    assert spans["rtdb.get"].parent_id == spans["UserService.get_user_by_id"].span_id
+    assert spans["rtdb.get"].attrs == {"path": "/users/1"}
+    assert trace.summary()["storage_calls"] == 1
+    assert tracing.get_trace(trace.trace_id) is trace
+
+
+def test_spans_outside_a_trace_are_not_recorded():
+    """Fuera de una traza los spans no registran nada."""
+    with tracing.span("suelto") as current:
+        assert current is None
+
+
+def test_chrome_export_has_one_row_per_request():
+    """La exportación de Chrome tiene la petición como evento raíz y sus spans."""
+    trace = tracing.start_trace("GET /chrome")
+    with tracing.span("jwt.decode"):
+        pass
+    tracing.finish_trace(trace)
+
+    events = tracing.chrome_trace([trace])["traceEvents"]
+    complete = [event for event in events if event["ph"] == "X"]
+    assert [event["name"] for event in complete] == ["GET /chrome", "jwt.decode"]
+    assert {event["tid"] for event in events} == {1}
+    assert complete[1]["ts"] >= complete[0]["ts"]